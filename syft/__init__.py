@@ -14,7 +14,9 @@ from syft.version import __version__
 # tensor types inside hook_args.py.
 import syft.frameworks.torch.hook.hook_args
 
+import importlib
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
@@ -26,10 +28,6 @@ logger = logging.getLogger(__name__)
 # Import Hooks
 
 if dependency_check.tfe_available:
-    from syft.frameworks.keras import KerasHook
-    from syft.workers.tfe import TFECluster
-    from syft.workers.tfe import TFEWorker
-
     __all__ = ["KerasHook", "TFECluster", "TFEWorker"]
 else:
     logger.info("TF Encrypted Keras not available.")
@@ -39,13 +37,6 @@ else:
 # Import Hook
 from syft.frameworks.torch.hook.hook import TorchHook
 
-# Import grids
-from syft.grid.private_grid import PrivateGridNetwork
-from syft.grid.public_grid import PublicGridNetwork
-
-# Import sandbox
-from syft.sandbox import create_sandbox, hook
-
 # Import federate learning objects
 from syft.frameworks.torch.fl import FederatedDataset, FederatedDataLoader, BaseDataset
 from syft.federated.train_config import TrainConfig
@@ -59,8 +50,6 @@ from syft.messaging.promise import Promise
 
 # Import Worker Types
 from syft.workers.virtual import VirtualWorker
-from syft.workers.websocket_client import WebsocketClientWorker
-from syft.workers.websocket_server import WebsocketServerWorker
 
 # Import Syft's Public Tensor Types
 from syft.frameworks.torch.tensors.decorators.logging import LoggingTensor
@@ -77,12 +66,55 @@ from syft.generic.pointers.pointer_protocol import PointerProtocol
 from syft.generic.pointers.pointer_tensor import PointerTensor
 from syft.generic.pointers.multi_pointer import MultiPointerTensor
 
-# Import serialization tools
-from syft import serde
-
 # import functions
 from syft.frameworks.torch.functions import combine_pointers
-from syft.frameworks.torch.he.paillier import keygen
+
+# The following objects pull in heavy dependencies (requests, websockets, phe,
+# tf_encrypted, etc.) or build large tables at import time, so they are only
+# imported the first time they are accessed as attributes of syft (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "serde": ("syft.serde", None),
+    "PrivateGridNetwork": ("syft.grid.private_grid", "PrivateGridNetwork"),
+    "PublicGridNetwork": ("syft.grid.public_grid", "PublicGridNetwork"),
+    "create_sandbox": ("syft.sandbox", "create_sandbox"),
+    "hook": ("syft.sandbox", "hook"),
+    "WebsocketClientWorker": ("syft.workers.websocket_client", "WebsocketClientWorker"),
+    "WebsocketServerWorker": ("syft.workers.websocket_server", "WebsocketServerWorker"),
+    "keygen": ("syft.frameworks.torch.he.paillier", "keygen"),
+    "RoundCoordinator": ("syft.federated.round_coordinator", "RoundCoordinator"),
+}
+
+if dependency_check.tfe_available:
+    _LAZY_ATTRIBUTES.update(
+        {
+            "KerasHook": ("syft.frameworks.keras", "KerasHook"),
+            "TFECluster": ("syft.workers.tfe", "TFECluster"),
+            "TFEWorker": ("syft.workers.tfe", "TFEWorker"),
+        }
+    )
+
+
+def __getattr__(name):
+    try:
+        module_name, attr_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module 'syft' has no attribute '{name}'")
+
+    module = importlib.import_module(module_name)
+    value = module if attr_name is None else getattr(module, attr_name)
+    # Cache the value so that __getattr__ is not called again for this name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # Module level __getattr__ is not supported, so everything is imported upfront
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
 
 
 def pool():
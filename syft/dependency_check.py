@@ -4,13 +4,17 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# tensorflow is only imported (which is slow) if syft_tensorflow is installed
+pstf_spec = util.find_spec("syft_tensorflow")
 try:
+    if pstf_spec is None:
+        raise ImportError()
+
     import tensorflow
 
     if LooseVersion(tensorflow.__version__) < LooseVersion("2.0.0"):
         raise ImportError()
-    pstf_spec = util.find_spec("syft_tensorflow")
-    tensorflow_available = pstf_spec is not None
+    tensorflow_available = True
 except ImportError:
     tensorflow_available = False
 
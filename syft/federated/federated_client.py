@@ -1,10 +1,28 @@
+import inspect
+from typing import List
+from typing import Union
+
 import torch as th
 from torch.utils.data import BatchSampler, RandomSampler, SequentialSampler
 import numpy as np
 
+import syft as sy
 from syft.generic.object_storage import ObjectStorage
+from syft.federated.model_update import flatten_parameters
+from syft.federated.model_update import UpdateEncoder
 from syft.federated.train_config import TrainConfig
 
+# Arguments of the torch DataLoader, some of which (like prefetch_factor) only exist
+# in recent versions of torch
+DATA_LOADER_ARGS = set(inspect.signature(th.utils.data.DataLoader.__init__).parameters)
+
+
+def _class_counts(classes: th.Tensor, nr_bins: int) -> th.Tensor:
+    """Counts the occurrences of each class in [0, nr_bins), the other values being
+    left out as with np.histogram."""
+    in_range = (classes >= 0) & (classes < nr_bins)
+    return th.bincount(classes[in_range], minlength=nr_bins)
+
 
 class FederatedClient(ObjectStorage):
     """A Client able to execute federated learning in local datasets."""
@@ -14,6 +32,15 @@ class FederatedClient(ObjectStorage):
         self.datasets = datasets if datasets is not None else dict()
         self.optimizer = None
         self.train_config = None
+        # parameters of the model received with the train config, and encoder of the
+        # updates sent back, which keeps the error feedback residual between rounds
+        self.received_params = None
+        self.update_encoder = None
+        # ids of the objects modified since they were received, like models trained,
+        # which no longer match the content their id was derived from
+        self.modified_obj_ids = set()
+        # data loaders kept between calls to fit with persistent_workers
+        self.data_loaders = {}
 
     def add_dataset(self, dataset, key: str):
         if key not in self.datasets:
@@ -34,9 +61,25 @@ class FederatedClient(ObjectStorage):
         if isinstance(obj, TrainConfig):
             self.train_config = obj
             self.optimizer = None
+            self.received_params = None
+            self.data_loaders = {}
         else:
+            self.modified_obj_ids.discard(obj.id)
             super().set_obj(obj)
 
+    def held_obj_ids(self, obj_ids: list) -> list:
+        """Returns the ids among obj_ids of the objects held unmodified, so that the
+        objects identified by their content are not sent again.
+
+        Args:
+            obj_ids: A list of object ids.
+        """
+        return [
+            obj_id
+            for obj_id in obj_ids
+            if obj_id in self._objects and obj_id not in self.modified_obj_ids
+        ]
+
     def _check_train_config(self):
         if self.train_config is None:
             raise ValueError("Operation needs TrainConfig object to be set.")
@@ -80,30 +123,88 @@ class FederatedClient(ObjectStorage):
         model = self.get_obj(self.train_config._model_id).obj
         loss_fn = self.get_obj(self.train_config._loss_fn_id).obj
 
+        if self.received_params is None:
+            self.received_params = flatten_parameters(model)
+        self.modified_obj_ids.add(self.train_config._model_id)
+
         self._build_optimizer(
             self.train_config.optimizer, model, optimizer_args=self.train_config.optimizer_args
         )
 
         return self._fit(model=model, dataset_key=dataset_key, loss_fn=loss_fn, device=device)
 
-    def _create_data_loader(self, dataset_key: str, shuffle: bool = False):
+    def model_update(self, top_k_ratio: float = None, quantize: bool = False) -> bytes:
+        """Encodes the difference between the model trained and the model received with
+        the TrainConfig, which is much smaller to send back than the model itself.
+
+        Args:
+            top_k_ratio: Optional fraction of the largest values of the delta to send.
+            quantize: Whether the values sent are quantized on 8 bits.
+
+        Returns:
+            The serialized encoded update, see syft.federated.model_update.decode_update.
+            It is serialized so that its tensors are sent back with the response of a
+            remote command, instead of being registered on the worker.
+        """
+        self._check_train_config()
+        if self.received_params is None:
+            raise ValueError("Operation needs the model to be trained with fit first.")
+
+        if (
+            self.update_encoder is None
+            or self.update_encoder.top_k_ratio != top_k_ratio
+            or self.update_encoder.quantize != quantize
+        ):
+            self.update_encoder = UpdateEncoder(top_k_ratio=top_k_ratio, quantize=quantize)
+
+        model = self.get_obj(self.train_config._model_id).obj
+        encoded = self.update_encoder.encode(flatten_parameters(model) - self.received_params)
+        return sy.serde.serialize(encoded)
+
+    def _create_data_loader(self, dataset_key: str, shuffle: bool = False, drop_last=False):
         data_range = range(len(self.datasets[dataset_key]))
         if shuffle:
             sampler = RandomSampler(data_range)
         else:
             sampler = SequentialSampler(data_range)
+
+        train_config = self.train_config
+        loader_args = {"num_workers": train_config.num_workers, "drop_last": drop_last}
+        if train_config.pin_memory and th.cuda.is_available():
+            loader_args["pin_memory"] = True
+        if train_config.num_workers > 0:
+            loader_args["prefetch_factor"] = train_config.prefetch_factor
+            loader_args["persistent_workers"] = train_config.persistent_workers
+        # Drop the options not supported by the installed torch version
+        loader_args = {k: v for k, v in loader_args.items() if k in DATA_LOADER_ARGS}
+
         data_loader = th.utils.data.DataLoader(
             self.datasets[dataset_key],
-            batch_size=self.train_config.batch_size,
+            batch_size=train_config.batch_size,
             sampler=sampler,
-            num_workers=0,
+            **loader_args,
         )
         return data_loader
 
+    def _get_data_loader(self, dataset_key: str, shuffle: bool = False, drop_last=False):
+        """Returns a data loader, which is reused between calls when the TrainConfig
+        asks for persistent_workers."""
+        if not self.train_config.persistent_workers:
+            return self._create_data_loader(dataset_key, shuffle=shuffle, drop_last=drop_last)
+
+        loader_key = (dataset_key, shuffle, drop_last)
+        if loader_key not in self.data_loaders:
+            self.data_loaders[loader_key] = self._create_data_loader(
+                dataset_key, shuffle=shuffle, drop_last=drop_last
+            )
+        return self.data_loaders[loader_key]
+
     def _fit(self, model, dataset_key, loss_fn, device="cpu"):
         model.train()
-        data_loader = self._create_data_loader(
-            dataset_key=dataset_key, shuffle=self.train_config.shuffle
+        data_loader = self._get_data_loader(
+            dataset_key=dataset_key,
+            shuffle=self.train_config.shuffle,
+            drop_last=self.train_config.drop_last,
         )
 
         loss = None
@@ -129,21 +230,29 @@ class FederatedClient(ObjectStorage):
 
     def evaluate(
         self,
-        dataset_key: str,
+        dataset_key: Union[str, List[str]],
         return_histograms: bool = False,
         nr_bins: int = -1,
         return_loss: bool = True,
         return_raw_accuracy: bool = True,
         device: str = "cpu",
+        return_confusion_matrix: bool = False,
     ):
         """Evaluates a model on the local dataset as specified in the local TrainConfig object.
 
+        The metrics are accumulated as tensors over the batches and only converted once
+        the whole dataset was evaluated.
+
         Args:
-            dataset_key: Identifier of the local dataset that shall be used for training.
+            dataset_key: Identifier of the local dataset that shall be used for training,
+                or list of identifiers to evaluate the model on several datasets at once.
             return_histograms: If True, calculate the histograms of predicted classes.
             nr_bins: Used together with calculate_histograms. Provide the number of classes/bins.
+                Defaults to the number of outputs of the model.
             return_loss: If True, loss is calculated additionally.
             return_raw_accuracy: If True, return nr_correct_predictions and nr_predictions
+            return_confusion_matrix: If True, return the confusion matrix and the per class
+                precision and recall.
 
         Returns:
             Dictionary containing depending on the provided flags:
@@ -152,49 +261,106 @@ class FederatedClient(ObjectStorage):
                 * nr_predictions: total number of predictions.
                 * histogram_predictions: histogram of predictions.
                 * histogram_target: histogram of target values in the dataset.
+                * confusion_matrix: nr_bins x nr_bins matrix counting, for each target
+                  class (row), the predictions of each class (column).
+                * precision_per_class: precision of the predictions of each class.
+                * recall_per_class: recall of the predictions of each class.
+            With a list of dataset keys, a dictionary mapping each key to its result.
         """
         self._check_train_config()
 
-        if dataset_key not in self.datasets:
-            raise ValueError("Dataset {} unknown.".format(dataset_key))
+        dataset_keys = dataset_key if isinstance(dataset_key, (list, tuple)) else [dataset_key]
+        for key in dataset_keys:
+            if key not in self.datasets:
+                raise ValueError("Dataset {} unknown.".format(key))
 
-        eval_result = dict()
         model = self.get_obj(self.train_config._model_id).obj
         loss_fn = self.get_obj(self.train_config._loss_fn_id).obj
         model.eval()
         device = "cuda" if device == "cuda" else "cpu"
-        data_loader = self._create_data_loader(dataset_key=dataset_key, shuffle=False)
-        test_loss = 0.0
-        correct = 0
-        if return_histograms:
-            hist_target = np.zeros(nr_bins)
-            hist_pred = np.zeros(nr_bins)
+
+        results = {
+            key: self._evaluate_dataset(
+                key,
+                model,
+                loss_fn,
+                return_histograms=return_histograms,
+                nr_bins=nr_bins,
+                return_loss=return_loss,
+                return_raw_accuracy=return_raw_accuracy,
+                device=device,
+                return_confusion_matrix=return_confusion_matrix,
+            )
+            for key in dataset_keys
+        }
+        if isinstance(dataset_key, (list, tuple)):
+            return results
+        return results[dataset_key]
+
+    def _evaluate_dataset(
+        self,
+        dataset_key: str,
+        model,
+        loss_fn,
+        return_histograms: bool,
+        nr_bins: int,
+        return_loss: bool,
+        return_raw_accuracy: bool,
+        device: str,
+        return_confusion_matrix: bool,
+    ) -> dict:
+        """Evaluates the model on one dataset, see evaluate."""
+        eval_result = dict()
+        data_loader = self._get_data_loader(dataset_key=dataset_key, shuffle=False)
+        test_loss = th.zeros((), device=device)
+        correct = th.zeros((), dtype=th.long, device=device)
+        # class counts summed over the batches, by name
+        counts = dict()
+
+        def add_counts(name, batch_counts):
+            counts[name] = counts[name] + batch_counts if name in counts else batch_counts
 
         with th.no_grad():
             for data, target in data_loader:
                 data, target = data.to(device), target.to(device)
                 output = model(data)
                 if return_loss:
-                    test_loss += loss_fn(output, target).item()  # sum up batch loss
-                pred = output.argmax(
-                    dim=1, keepdim=True
-                )  # get the index of the max log-probability
-                if return_histograms:
-                    hist, _ = np.histogram(target, bins=nr_bins, range=(0, nr_bins))
-                    hist_target += hist
-                    hist, _ = np.histogram(pred, bins=nr_bins, range=(0, nr_bins))
-                    hist_pred += hist
+                    test_loss += loss_fn(output, target)  # sum up batch loss
+                # get the index of the max log-probability
+                pred = output.argmax(dim=1)
+                target = target.view_as(pred)
                 if return_raw_accuracy:
-                    correct += pred.eq(target.view_as(pred)).sum().item()
+                    correct += pred.eq(target).sum()
 
+                if (return_histograms or return_confusion_matrix) and nr_bins < 0:
+                    nr_bins = output.shape[1]
+                if return_histograms:
+                    add_counts("histogram_target", _class_counts(target, nr_bins))
+                    add_counts("histogram_predictions", _class_counts(pred, nr_bins))
+                if return_confusion_matrix:
+                    in_range = (target >= 0) & (target < nr_bins) & (pred >= 0) & (pred < nr_bins)
+                    cells = th.where(in_range, target * nr_bins + pred, th.full_like(pred, -1))
+                    add_counts("confusion_matrix", _class_counts(cells, nr_bins * nr_bins))
+
+        # Synchronize and convert the accumulated metrics once
         if return_loss:
-            test_loss /= len(data_loader.dataset)
-            eval_result["loss"] = test_loss
+            eval_result["loss"] = test_loss.item() / len(data_loader.dataset)
         if return_raw_accuracy:
-            eval_result["nr_correct_predictions"] = correct
+            eval_result["nr_correct_predictions"] = correct.item()
             eval_result["nr_predictions"] = len(data_loader.dataset)
+
+        nr_bins = max(nr_bins, 0)
+        counts = {name: batch_counts.cpu().numpy() for name, batch_counts in counts.items()}
         if return_histograms:
-            eval_result["histogram_predictions"] = hist_pred
-            eval_result["histogram_target"] = hist_target
+            for name in ("histogram_predictions", "histogram_target"):
+                eval_result[name] = counts.get(name, np.zeros(nr_bins)).astype(np.float64)
+        if return_confusion_matrix:
+            confusion_matrix = counts.get("confusion_matrix", np.zeros(nr_bins ** 2, np.int64))
+            confusion_matrix = confusion_matrix.reshape(nr_bins, nr_bins)
+            true_positives = np.diag(confusion_matrix)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                eval_result["precision_per_class"] = true_positives / confusion_matrix.sum(axis=0)
+                eval_result["recall_per_class"] = true_positives / confusion_matrix.sum(axis=1)
+            eval_result["confusion_matrix"] = confusion_matrix
 
         return eval_result
@@ -0,0 +1,158 @@
+from typing import Union
+
+import torch
+
+import syft as sy
+
+
+def flatten_parameters(model: torch.nn.Module) -> torch.Tensor:
+    """Copy the parameters of a model into one contiguous 1-D tensor.
+
+    Args:
+        model (torch.nn.Module): the model whose parameters are flattened.
+    Returns:
+        torch.Tensor: the concatenation of the flattened parameters.
+    """
+    with torch.no_grad():
+        return torch.cat([param.data.reshape(-1) for param in model.parameters()])
+
+
+def assign_flat_parameters(model: torch.nn.Module, flat_params: torch.Tensor) -> torch.nn.Module:
+    """Copy the values of a 1-D tensor built by flatten_parameters into the parameters
+    of a model.
+
+    Args:
+        model (torch.nn.Module): the model whose parameters are set.
+        flat_params (torch.Tensor): the flattened parameters.
+    Returns:
+        torch.nn.Module: the model with the new parameters.
+    """
+    params = list(model.parameters())
+    nr_elements = sum(param.numel() for param in params)
+    if flat_params.numel() != nr_elements:
+        raise ValueError(
+            f"The model has {nr_elements} parameters but {flat_params.numel()} values were given"
+        )
+
+    offset = 0
+    with torch.no_grad():
+        for param in params:
+            nr_param_elements = param.numel()
+            param.copy_(flat_params[offset : offset + nr_param_elements].view_as(param))
+            offset += nr_param_elements
+    return model
+
+
+def quantize_8bit(values: torch.Tensor) -> tuple:
+    """Quantize a float tensor on 8 bits with an affine mapping of its range.
+
+    Args:
+        values (torch.Tensor): the tensor to quantize.
+    Returns:
+        tuple: the uint8 tensor, and the minimum and scale to dequantize it.
+    """
+    if values.numel() == 0:
+        return values.to(torch.uint8), 0.0, 1.0
+
+    minimum = values.min().item()
+    scale = (values.max().item() - minimum) / 255 or 1.0
+    quantized = ((values - minimum) / scale).round_().clamp_(0, 255).to(torch.uint8)
+    return quantized, minimum, scale
+
+
+def dequantize_8bit(quantized: torch.Tensor, minimum: float, scale: float) -> torch.Tensor:
+    """Inverse of quantize_8bit, up to the quantization error."""
+    return quantized.float().mul_(scale).add_(minimum)
+
+
+class UpdateEncoder:
+    """Encodes model updates as the difference between the parameters of the model
+    trained and those of the model received, to reduce the bandwidth they use.
+
+    The delta can be sparsified by only keeping its top_k_ratio largest values, and
+    quantized on 8 bits. The part of the delta which was not sent, because it was
+    dropped or rounded, is kept as a residual and added to the next delta encoded
+    (error feedback), so that it is eventually transmitted.
+    """
+
+    def __init__(self, top_k_ratio: float = None, quantize: bool = False):
+        """Initializer for UpdateEncoder.
+
+        Args:
+            top_k_ratio: optional fraction of the values of the delta to send, the
+                largest in absolute value being selected. By default all are sent.
+            quantize: whether the values sent are quantized on 8 bits.
+        """
+        if top_k_ratio is not None and not 0 < top_k_ratio <= 1:
+            raise ValueError(f"top_k_ratio must be in (0, 1], got {top_k_ratio}")
+
+        self.top_k_ratio = top_k_ratio
+        self.quantize = quantize
+        self.residual = None
+
+    def encode(self, delta: torch.Tensor) -> dict:
+        """Encodes a parameter delta.
+
+        Args:
+            delta (torch.Tensor): the difference between the parameters trained and the
+                parameters received.
+        Returns:
+            dict: the encoded update, which can be decoded with decode_update.
+        """
+        delta = delta.reshape(-1)
+        encoded = {"size": delta.numel()}
+        if self.top_k_ratio is None and not self.quantize:
+            encoded["values"] = delta
+            return encoded
+
+        if self.residual is not None and self.residual.numel() == delta.numel():
+            delta = delta + self.residual
+
+        indices = None
+        values = delta
+        if self.top_k_ratio is not None:
+            k = max(1, int(self.top_k_ratio * delta.numel()))
+            _, indices = delta.abs().topk(k, sorted=False)
+            values = delta[indices]
+            # int32 indices are enough for any model and halve their size
+            encoded["indices"] = indices.int()
+
+        if self.quantize:
+            encoded["values"], encoded["min"], encoded["scale"] = quantize_8bit(values)
+            sent_values = dequantize_8bit(encoded["values"], encoded["min"], encoded["scale"])
+        else:
+            encoded["values"] = values
+            sent_values = values
+
+        # Keep what was not transmitted for the next update
+        if indices is None:
+            self.residual = values - sent_values
+        else:
+            self.residual = delta.clone()
+            self.residual[indices] = values - sent_values
+
+        return encoded
+
+
+def decode_update(encoded: Union[dict, bytes]) -> torch.Tensor:
+    """Decodes an update encoded by UpdateEncoder into a dense parameter delta.
+
+    Args:
+        encoded (dict or bytes): the encoded update, or its serialization as returned
+            by FederatedClient.model_update.
+    Returns:
+        torch.Tensor: the 1-D parameter delta.
+    """
+    if isinstance(encoded, bytes):
+        encoded = sy.serde.deserialize(encoded)
+
+    values = encoded["values"]
+    if "scale" in encoded:
+        values = dequantize_8bit(values, encoded["min"], encoded["scale"])
+
+    if "indices" not in encoded:
+        return values
+
+    delta = torch.zeros(encoded["size"], dtype=values.dtype)
+    delta[encoded["indices"].long()] = values
+    return delta
@@ -0,0 +1,190 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError
+from concurrent.futures import as_completed
+from concurrent.futures import wait
+import logging
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+import torch
+
+from syft.federated.model_update import assign_flat_parameters
+from syft.federated.model_update import decode_update
+from syft.federated.model_update import flatten_parameters
+from syft.federated.train_config import TrainConfig
+from syft.frameworks.torch.fl import utils
+from syft.workers.base import BaseWorker
+
+logger = logging.getLogger(__name__)
+
+
+class RoundCoordinator:
+    """Runs federated training rounds on several workers concurrently.
+
+    Each round sends a TrainConfig to every worker and calls fit on all of them at
+    the same time, collecting the trained models as the workers complete. Workers
+    which did not complete before the timeout are dropped from the round, and the
+    round can end as soon as the first nr_updates workers completed.
+
+    The results of the dropped workers are ignored, and they are not sent the
+    TrainConfig of the next round before their previous fit completed, so that two
+    rounds never use the connection to a worker at the same time. Call close once
+    done to wait for them.
+
+    With update_encoding, the workers only send back the encoded difference between
+    the model trained and the model sent, see FederatedClient.model_update.
+    """
+
+    def __init__(
+        self,
+        workers: List[BaseWorker],
+        dataset_key: str,
+        timeout: float = None,
+        nr_updates: int = None,
+        update_encoding: dict = None,
+        **train_config_args,
+    ):
+        """Initializer for RoundCoordinator.
+
+        Args:
+            workers: The workers taking part in the rounds.
+            dataset_key: Identifier of the dataset the workers train on.
+            timeout: Optional number of seconds after which the workers which did not
+                return their model are dropped from the round.
+            nr_updates: Optional number of models after which the round ends, the
+                remaining workers being dropped. Defaults to all the workers.
+            update_encoding: Optional arguments of FederatedClient.model_update, like
+                {"top_k_ratio": 0.01, "quantize": True}, to get parameter deltas back
+                instead of the models.
+            **train_config_args: The arguments of the TrainConfig sent to each worker,
+                like batch_size or optimizer_args.
+        """
+        self.workers = list(workers)
+        self.dataset_key = dataset_key
+        self.timeout = timeout
+        self.nr_updates = nr_updates
+        self.update_encoding = update_encoding
+        self.train_config_args = train_config_args
+
+        # ids of the workers dropped from the last round
+        self.stragglers = []
+
+        self._executor = None
+        # futures of the workers dropped from a round which are still training
+        self._pending = {}
+
+    def _fit_on_worker(
+        self, worker: BaseWorker, model: torch.jit.ScriptModule, loss_fn: torch.jit.ScriptModule
+    ) -> Tuple[Union[torch.jit.ScriptModule, torch.Tensor], torch.Tensor]:
+        """Trains the model on one worker and gets it, or its parameter delta, back."""
+        train_config = TrainConfig(model=model, loss_fn=loss_fn, **self.train_config_args)
+        train_config.send(worker)
+        loss = worker.fit(dataset_key=self.dataset_key)
+
+        if self.update_encoding is not None:
+            return decode_update(worker.model_update(**self.update_encoding)), loss
+        return train_config.model_ptr.get().obj, loss
+
+    def fit(
+        self, model: torch.jit.ScriptModule, loss_fn: torch.jit.ScriptModule
+    ) -> Dict[Union[int, str], Tuple[Union[torch.jit.ScriptModule, torch.Tensor], torch.Tensor]]:
+        """Runs one training round on all the workers concurrently.
+
+        Args:
+            model: A traced torch nn.Module instance to train.
+            loss_fn: A jit function representing the loss function.
+
+        Returns:
+            A dict mapping the id of each worker which completed in time to the
+            model it trained, or the decoded parameter delta with update_encoding,
+            and its loss on the last batch.
+        """
+        nr_updates = self.nr_updates or len(self.workers)
+        updates = {}
+
+        busy_worker_ids = self._wait_for_stragglers()
+        if busy_worker_ids:
+            logger.info("Workers %s are still training and skip the round", busy_worker_ids)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=len(self.workers))
+        futures = {
+            self._executor.submit(self._fit_on_worker, worker, model, loss_fn): worker
+            for worker in self.workers
+            if worker.id not in busy_worker_ids
+        }
+        try:
+            for future in as_completed(futures, timeout=self.timeout):
+                worker = futures[future]
+                try:
+                    updates[worker.id] = future.result()
+                except Exception as e:
+                    logger.warning("Training on worker %s failed: %s", worker.id, e)
+                    continue
+                if len(updates) >= nr_updates:
+                    break
+        except TimeoutError:
+            logger.info("Round deadline reached with %s/%s models", len(updates), nr_updates)
+        finally:
+            # Stragglers keep running in the background, their result is ignored
+            for future, worker in futures.items():
+                if not future.done():
+                    self._pending[worker.id] = future
+
+        self.stragglers = [worker.id for worker in self.workers if worker.id not in updates]
+        return updates
+
+    def close(self):
+        """Waits for the stragglers of the last round and releases the threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._pending = {}
+
+    def _wait_for_stragglers(self) -> set:
+        """Waits for the workers dropped from the previous rounds to complete, for at
+        most timeout seconds.
+
+        Returns:
+            The ids of the workers still training.
+        """
+        pending = [future for future in self._pending.values() if not future.cancel()]
+        wait(pending, timeout=self.timeout)
+        self._pending = {
+            worker_id: future for worker_id, future in self._pending.items() if not future.done()
+        }
+        return set(self._pending)
+
+    def fit_and_average(
+        self, model: torch.jit.ScriptModule, loss_fn: torch.jit.ScriptModule, weights=None
+    ) -> torch.jit.ScriptModule:
+        """Runs one training round and averages the models returned in time.
+
+        Args:
+            model: A traced torch nn.Module instance to train.
+            loss_fn: A jit function representing the loss function.
+            weights: Optional dict of the weight of each worker id in the average,
+                like its number of training samples.
+
+        Returns:
+            The averaged model, or the model given if no worker completed in time.
+            With update_encoding, the averaged delta is applied to the model given.
+        """
+        updates = self.fit(model, loss_fn)
+        if not updates:
+            logger.warning("No worker completed the round, the model is unchanged")
+            return model
+
+        if self.update_encoding is not None:
+            averager = utils.ModelAverager()
+            for worker_id, (delta, _) in updates.items():
+                weight = weights[worker_id] if weights is not None else 1.0
+                averager.add_flat_parameters(delta, weight)
+            return assign_flat_parameters(model, flatten_parameters(model) + averager.average())
+
+        models = {worker_id: update[0] for worker_id, update in updates.items()}
+        if weights is not None:
+            weights = {worker_id: weights[worker_id] for worker_id in models}
+        return utils.federated_avg(models, weights=weights)
@@ -1,3 +1,5 @@
+import hashlib
+from typing import List
 from typing import Union
 import weakref
 
@@ -9,6 +11,12 @@ from syft.workers.abstract import AbstractWorker
 from syft.workers.base import BaseWorker
 
 
+def content_id(obj: object) -> str:
+    """Returns an id derived from the serialized content of an object, so that
+    identical objects get the same id wherever they are sent."""
+    return "sha256:" + hashlib.sha256(sy.serde.serialize(obj)).hexdigest()
+
+
 class TrainConfig:
     """TrainConfig abstraction.
 
@@ -30,6 +38,11 @@ class TrainConfig:
         shuffle: bool = True,
         loss_fn_id: int = None,
         model_id: int = None,
+        num_workers: int = 0,
+        prefetch_factor: int = 2,
+        persistent_workers: bool = False,
+        pin_memory: bool = False,
+        drop_last: bool = False,
     ):
         """Initializer for TrainConfig.
 
@@ -50,6 +63,14 @@ class TrainConfig:
             loss_fn_id: The id_at_location of (the ObjectWrapper of) a loss function which
                         shall be used to calculate the loss. This is used internally for train config deserialization.
             model_id: id_at_location of a traced torch nn.Module instance (objectwrapper). . This is used internally for train config deserialization.
+            num_workers: Number of subprocesses loading the data on the worker, so that data
+                loading and transforms overlap the training. 0 loads data in the main process.
+            prefetch_factor: Number of batches loaded in advance by each subprocess.
+            persistent_workers: Whether the data loader, and its subprocesses, are kept
+                between calls to fit instead of being created again.
+            pin_memory: Whether batches are copied into pinned memory, for faster transfer
+                to the GPU.
+            drop_last: Whether the last incomplete training batch is dropped.
         """
         # syft related attributes
         self.owner = owner if owner else sy.hook.local_worker
@@ -66,6 +87,13 @@ class TrainConfig:
         self.max_nr_batches = max_nr_batches
         self.shuffle = shuffle
 
+        # data loading related attributes
+        self.num_workers = num_workers
+        self.prefetch_factor = prefetch_factor
+        self.persistent_workers = persistent_workers
+        self.pin_memory = pin_memory
+        self.drop_last = drop_last
+
         # pointers
         self.model_ptr = None
         self.loss_fn_ptr = None
@@ -91,13 +119,26 @@ class TrainConfig:
         out += ">"
         return out
 
-    def _wrap_and_send_obj(self, obj, location):
-        """Wrappers object and send it to location."""
-        obj_with_id = ObjectWrapper(id=sy.ID_PROVIDER.pop(), obj=obj)
-        obj_ptr = self.owner.send(obj_with_id, location)
-        obj_id = obj_ptr.id_at_location
+    def _wrap_and_send_obj(self, obj, location, obj_id: str, held: bool = False):
+        """Wraps object under its content id and sends it to location, unless
+        location already holds it in which case only a pointer is created."""
+        obj_with_id = ObjectWrapper(id=obj_id, obj=obj)
+        if held:
+            obj_ptr = ObjectWrapper.create_pointer(
+                obj_with_id, owner=self.owner, location=location, ptr_id=sy.ID_PROVIDER.pop()
+            )
+        else:
+            obj_ptr = self.owner.send(obj_with_id, location)
         return obj_ptr, obj_id
 
+    @staticmethod
+    def _held_obj_ids(location: BaseWorker, obj_ids: List[str]) -> List[str]:
+        """Asks location which of the objects it already holds."""
+        held_obj_ids = getattr(location, "held_obj_ids", None)
+        if held_obj_ids is None:
+            return []
+        return held_obj_ids(obj_ids)
+
     def send(self, location: BaseWorker) -> weakref:
         """Gets the pointer to a new remote object.
 
@@ -110,14 +151,25 @@ class TrainConfig:
             location: The BaseWorker object which you want to send this object
                 to. Note that this is never actually the BaseWorker but instead
                 a class which instantiates the BaseWorker abstraction.
+        The model and the loss function are identified by the hash of their content,
+        and are only sent if location doesn't already hold them unchanged.
+
         Returns:
             A weakref instance.
         """
+        model_id = content_id(self.model)
+        loss_fn_id = content_id(self.loss_fn)
+        held_obj_ids = self._held_obj_ids(location, [model_id, loss_fn_id])
+
         # Send traced model
-        self.model_ptr, self._model_id = self._wrap_and_send_obj(self.model, location)
+        self.model_ptr, self._model_id = self._wrap_and_send_obj(
+            self.model, location, model_id, held=model_id in held_obj_ids
+        )
 
         # Send loss function
-        self.loss_fn_ptr, self._loss_fn_id = self._wrap_and_send_obj(self.loss_fn, location)
+        self.loss_fn_ptr, self._loss_fn_id = self._wrap_and_send_obj(
+            self.loss_fn, location, loss_fn_id, held=loss_fn_id in held_obj_ids
+        )
 
         # Send train configuration itself
         ptr = self.owner.send(self, location)
@@ -151,8 +203,8 @@ class TrainConfig:
             tuple: a tuple holding the unique attributes of the TrainConfig object
         """
         return (
-            train_config._model_id,
-            train_config._loss_fn_id,
+            sy.serde.msgpack.serde._simplify(worker, train_config._model_id),
+            sy.serde.msgpack.serde._simplify(worker, train_config._loss_fn_id),
             train_config.batch_size,
             train_config.epochs,
             sy.serde.msgpack.serde._simplify(worker, train_config.optimizer),
@@ -160,6 +212,11 @@ class TrainConfig:
             sy.serde.msgpack.serde._simplify(worker, train_config.id),
             train_config.max_nr_batches,
             train_config.shuffle,
+            train_config.num_workers,
+            train_config.prefetch_factor,
+            train_config.persistent_workers,
+            train_config.pin_memory,
+            train_config.drop_last,
         )
 
     @staticmethod
@@ -183,9 +240,16 @@ class TrainConfig:
             id,
             max_nr_batches,
             shuffle,
+            num_workers,
+            prefetch_factor,
+            persistent_workers,
+            pin_memory,
+            drop_last,
         ) = train_config_tuple
 
         id = sy.serde.msgpack.serde._detail(worker, id)
+        model_id = sy.serde.msgpack.serde._detail(worker, model_id)
+        loss_fn_id = sy.serde.msgpack.serde._detail(worker, loss_fn_id)
         detailed_optimizer = sy.serde.msgpack.serde._detail(worker, optimizer)
         detailed_optimizer_args = sy.serde.msgpack.serde._detail(worker, optimizer_args)
 
@@ -202,6 +266,11 @@ class TrainConfig:
             optimizer_args=detailed_optimizer_args,
             max_nr_batches=max_nr_batches,
             shuffle=shuffle,
+            num_workers=num_workers,
+            prefetch_factor=prefetch_factor,
+            persistent_workers=persistent_workers,
+            pin_memory=pin_memory,
+            drop_last=drop_last,
         )
 
         return train_config
@@ -1,3 +1,4 @@
+import importlib
 import logging
 from syft import dependency_check
 
@@ -11,11 +12,17 @@ if dependency_check.tensorflow_available:
     __all__.append("tensorflow")
 
 if dependency_check.tfe_available:
-    from syft.frameworks import keras
-
+    # tf_encrypted is slow to import, so syft.frameworks.keras is only
+    # imported when it is first accessed (see __getattr__ below)
     __all__.append("keras")
 
 if dependency_check.torch_available:
     from syft.frameworks import torch
 
     __all__.append("torch")
+
+
+def __getattr__(name):
+    if name == "keras" and dependency_check.tfe_available:
+        return importlib.import_module("syft.frameworks.keras")
+    raise AttributeError(f"module 'syft.frameworks' has no attribute '{name}'")
@@ -194,70 +194,150 @@ def smoothed_sens(counts, noise_eps, l, beta):
     return smoothed_sensitivity
 
 
-def perform_analysis(teacher_preds, indices, noise_eps, delta=1e-5, moments=8, beta=0.09):
-    """"Performs PATE analysis on predictions from teachers and combined predictions for student.
+def _counts_from_preds(teacher_preds, num_labels=None):
+    """Counts the votes of the teachers for each label of each example.
 
     Args:
-        teacher_preds: a numpy array of dim (num_teachers x num_examples). Each value corresponds to the
-            index of the label which a teacher gave for a specific example
-        indices: a numpy array of dim (num_examples) of aggregated examples which were aggregated using
-            the noisy max mechanism.
-        noise_eps: the epsilon level used to create the indices
-        delta: the desired level of delta
-        moments: the number of moments to track (see the paper)
-        beta: a smoothing parameter (see the paper)
+        teacher_preds: a numpy array of dim (num_teachers x num_examples) of labels.
+        num_labels: the number of labels, defaults to the number of distinct labels
+            in teacher_preds.
     Returns:
-        tuple: first value is the data dependent epsilon, then the data independent epsilon
+        counts: a numpy array of dim (num_examples x num_labels)
     """
+    teacher_preds = np.asarray(teacher_preds).astype(np.int64)
+    num_examples = teacher_preds.shape[1]
+    if num_labels is None:
+        num_labels = len(np.unique(teacher_preds))
+    num_labels = max(num_labels, int(teacher_preds.max(initial=-1)) + 1)
 
-    num_teachers, num_examples = teacher_preds.shape
-    _num_examples = indices.shape[0]
-    labels = set(list(teacher_preds.flatten()))
-    num_labels = len(labels)
+    flat_indices = (np.arange(num_examples) * num_labels + teacher_preds).ravel()
+    counts = np.bincount(flat_indices, minlength=num_examples * num_labels)
+    return counts.reshape(num_examples, num_labels).astype(np.float64)
 
-    assert num_examples == _num_examples
 
-    counts_mat = np.zeros((num_examples, num_labels))
+def _compute_q_noisy_max_batch(counts, noise_eps):
+    """Same as compute_q_noisy_max, for all the rows of counts along its last axis."""
+    winner = counts.argmax(axis=-1)[..., None]
+    gaps = noise_eps * (np.take_along_axis(counts, winner, axis=-1) - counts)
+    with np.errstate(over="ignore"):
+        terms = (gaps + 2.0) / (4.0 * np.exp(gaps))
+    np.put_along_axis(terms, winner, 0.0, axis=-1)
+
+    return np.minimum(terms.sum(axis=-1), 1.0 - (1.0 / counts.shape[-1]))
 
-    for i in range(num_examples):
-        for j in range(num_teachers):
-            counts_mat[i, int(teacher_preds[j, i])] += 1
 
-    l_list = 1.0 + np.array(range(moments))
+def _logmgf_exact_batch(q, priv_eps, l):
+    """Same as logmgf_exact, where q and l are arrays broadcast together."""
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        t_one = (1 - q) * np.power((1 - q) / (1 - math.exp(priv_eps) * q), l)
+        t_two = q * np.exp(priv_eps * l)
+        t = t_one + t_two
+        log_t = np.where((q < 0.5) & (t > 0), np.log(t), priv_eps * l)
 
-    total_log_mgf_nm = np.array([0.0 for _ in l_list])
-    total_ss_nm = np.array([0.0 for _ in l_list])
+    return np.minimum(np.minimum(0.5 * priv_eps * priv_eps * l * (l + 1), log_t), priv_eps * l)
 
-    for i in indices:
 
-        total_log_mgf_nm += np.array(
-            [logmgf_from_counts(counts_mat[i], noise_eps, l) for l in l_list]
-        )
+def _smoothed_sens_batch(counts, noise_eps, l_list, beta):
+    """Same as smoothed_sens, for all the rows of counts and all the moments of l_list.
+
+    The sensitivities at all the distances k are computed at once, and masked
+    from the first k where smoothed_sens stops.
 
-        total_ss_nm += np.array([smoothed_sens(counts_mat[i], noise_eps, l, beta) for l in l_list])
+    Args:
+        counts: a numpy array of dim (num_queries x num_labels)
+        noise_eps: noise parameter
+        l_list: a numpy array of the moments of interest
+        beta: smoothness parameter
+    Returns:
+        smooth_sensitivity: a numpy array of dim (num_queries x num_moments)
+    """
+    max_counts = counts.max(axis=1)
+    max_k = int(np.ceil(max_counts.max()))
+    k = np.arange(max_k + 1)
+
+    # The two largest counts moved by k and by k + 1, as in sens_at_k
+    counts_sorted = -np.sort(-counts, axis=1)
+    moved = np.repeat(counts_sorted[:, None, :], max_k + 2, axis=1)
+    moved[:, :, 0] -= np.arange(max_k + 2)
+    moved[:, :, 1] += np.arange(max_k + 2)
+    q = _compute_q_noisy_max_batch(moved, noise_eps)
+    log_mgf = _logmgf_exact_batch(q[..., None], 2.0 * noise_eps, l_list)
+    sens = log_mgf[:, 1:] - log_mgf[:, :-1]
+
+    sens[k[None, :] > (counts[:, 0] - counts[:, 1])[:, None]] = 0.0
+    sens[:, :, 0.5 * noise_eps * l_list > 1] = 0.0
+
+    # smoothed_sens stops after the first k > 0 at which the sensitivity is 0,
+    # and at k = max(counts)
+    is_zero = sens == 0.0
+    is_zero[:, 0] = False
+    stopped = (np.cumsum(is_zero, axis=1) - is_zero) > 0
+    stopped |= (k[None, :] > max_counts[:, None])[..., None]
+
+    smoothed = np.exp(-beta * k)[None, :, None] * sens
+    smoothed[stopped] = -np.inf
+    return smoothed.max(axis=1)
+
+
+def _privacy_costs(counts, noise_eps, l_list, beta):
+    """Computes the log moment generating functions and the smooth sensitivities
+    of the noisy max answers to queries, summed over the queries.
+
+    Args:
+        counts: a numpy array of dim (num_queries x num_labels) with the votes of
+            the teachers for each query.
+        noise_eps: the epsilon level used to answer the queries
+        l_list: a numpy array of the moments to track
+        beta: a smoothing parameter
+    Returns:
+        tuple: the sums of the log-MGF and of the smooth sensitivities for each moment
+    """
+    total_log_mgf = np.zeros(len(l_list))
+    total_ss = np.zeros(len(l_list))
+    if len(counts) == 0:
+        return total_log_mgf, total_ss
+
+    if 0.5 * noise_eps * l_list.max() > 1:
+        print("l too large to compute sensitivity")
+
+    # Process the queries by blocks to bound the memory used for all the distances k
+    max_k = int(np.ceil(counts.max()))
+    block_size = max(1, 2 ** 22 // ((max_k + 2) * max(counts.shape[1], len(l_list))))
+    for start in range(0, len(counts), block_size):
+        block = counts[start : start + block_size]
+        q = _compute_q_noisy_max_batch(block, noise_eps)
+        total_log_mgf += _logmgf_exact_batch(q[:, None], 2.0 * noise_eps, l_list).sum(axis=0)
+        total_ss += _smoothed_sens_batch(block, noise_eps, l_list, beta).sum(axis=0)
+
+    return total_log_mgf, total_ss
+
+
+def _perform_analysis(teacher_preds, indices, noise_eps, delta, moments, beta):
+    """Implementation of perform_analysis and perform_analysis_torch on numpy arrays."""
+    num_teachers, num_examples = teacher_preds.shape
+    _num_examples = indices.shape[0]
+
+    assert num_examples == _num_examples
+
+    counts_mat = _counts_from_preds(teacher_preds)
+
+    l_list = 1.0 + np.arange(moments)
+
+    total_log_mgf_nm, total_ss_nm = _privacy_costs(
+        counts_mat[np.asarray(indices).astype(np.int64)], noise_eps, l_list, beta
+    )
 
     # We want delta = exp(alpha - eps l).
     # Solving gives eps = (alpha - ln (delta))/l
 
     eps_list_nm = (total_log_mgf_nm - math.log(delta)) / l_list
 
-    # print("Epsilons (Noisy Max): " + str(eps_list_nm))
-    # print("Smoothed sensitivities (Noisy Max): " + str(total_ss_nm / l_list))
-
     # If beta < eps / 2 ln (1/delta), then adding noise Lap(1) * 2 SS/eps
     # is eps,delta DP
     # Also if beta < eps / 2(gamma +1), then adding noise 2(gamma+1) SS eta / eps
     # where eta has density proportional to 1 / (1+|z|^gamma) is eps-DP
     # Both from Corolloary 2.4 in
     # http://www.cse.psu.edu/~ads22/pubs/NRS07/NRS07-full-draft-v1.pdf
-    # Print the first one's scale
-
-    ss_eps = 2.0 * beta * math.log(1 / delta)
-    ss_scale = 2.0 / ss_eps
-    # print("To get an " + str(ss_eps) + "-DP estimate of epsilon, ")
-    # print("..add noise ~ " + str(ss_scale))
-    # print("... times " + str(total_ss_nm / l_list))
-    # print("Epsilon = " + str(min(eps_list_nm)) + ".")
     if min(eps_list_nm) == eps_list_nm[-1]:
         print(
             "Warning: May not have used enough values of l. Increase 'moments' variable and run again."
@@ -265,17 +345,131 @@ def perform_analysis(teacher_preds, indices, noise_eps, delta=1e-5, moments=8, b
 
     # Data independent bound, as mechanism is
     # 2*noise_eps DP.
-    data_ind_log_mgf = np.array([0.0 for _ in l_list])
-    data_ind_log_mgf += num_examples * np.array(
-        [logmgf_exact(1.0, 2.0 * noise_eps, l) for l in l_list]
-    )
+    data_ind_log_mgf = num_examples * _logmgf_exact_batch(1.0, 2.0 * noise_eps, l_list)
 
     data_ind_eps_list = (data_ind_log_mgf - math.log(delta)) / l_list
-    # print("Data independent bound = " + str(min(data_ind_eps_list)) + ".")
 
     return min(eps_list_nm), min(data_ind_eps_list)
 
 
+def perform_analysis(teacher_preds, indices, noise_eps, delta=1e-5, moments=8, beta=0.09):
+    """"Performs PATE analysis on predictions from teachers and combined predictions for student.
+
+    The votes are counted with np.bincount, and the privacy costs are computed for all
+    the queries and moments at once.
+
+    Args:
+        teacher_preds: a numpy array of dim (num_teachers x num_examples). Each value corresponds to the
+            index of the label which a teacher gave for a specific example
+        indices: a numpy array of dim (num_examples) of aggregated examples which were aggregated using
+            the noisy max mechanism.
+        noise_eps: the epsilon level used to create the indices
+        delta: the desired level of delta
+        moments: the number of moments to track (see the paper)
+        beta: a smoothing parameter (see the paper)
+    Returns:
+        tuple: first value is the data dependent epsilon, then the data independent epsilon
+    """
+    return _perform_analysis(
+        np.asarray(teacher_preds), np.asarray(indices), noise_eps, delta, moments, beta
+    )
+
+
+class PATEAccountant:
+    """Keeps track of the privacy cost of the queries answered with the noisy max
+    mechanism, as perform_analysis does, but incrementally.
+
+    The log moment generating functions and smooth sensitivities of the answered
+    queries are accumulated, so each batch of queries answered only costs its own
+    analysis, and the current epsilons can be read at any time. The state of the
+    accountant can be saved with state_dict and restored with from_state_dict.
+    """
+
+    def __init__(self, num_labels, noise_eps, delta=1e-5, moments=8, beta=0.09):
+        """Initializer for PATEAccountant.
+
+        Args:
+            num_labels: the number of labels the teachers vote for.
+            noise_eps: the epsilon level used to answer the queries
+            delta: the desired level of delta
+            moments: the number of moments to track (see the paper)
+            beta: a smoothing parameter (see the paper)
+        """
+        self.num_labels = num_labels
+        self.noise_eps = noise_eps
+        self.delta = delta
+        self.moments = moments
+        self.beta = beta
+
+        self.l_list = 1.0 + np.arange(moments)
+        self.num_queries = 0
+        self.log_mgf = np.zeros(moments)
+        self.smoothed_sens = np.zeros(moments)
+
+    def update(self, teacher_preds=None, counts=None):
+        """Accounts for a batch of answered queries.
+
+        Args:
+            teacher_preds: a numpy array or torch tensor of dim (num_teachers x batch_size)
+                of the labels predicted by each teacher for the queries answered.
+            counts: alternatively, a numpy array or torch tensor of dim
+                (batch_size x num_labels) of the votes of the teachers for each query.
+        """
+        if (teacher_preds is None) == (counts is None):
+            raise ValueError("Give either the teacher predictions or the counts of the queries")
+
+        if counts is None:
+            counts = _counts_from_preds(teacher_preds, self.num_labels)
+        else:
+            counts = np.asarray(counts, dtype=np.float64)
+        if counts.shape[1] != self.num_labels:
+            raise ValueError(f"Expected {self.num_labels} labels, got {counts.shape[1]}")
+
+        log_mgf, smoothed_sens = _privacy_costs(counts, self.noise_eps, self.l_list, self.beta)
+        self.log_mgf += log_mgf
+        self.smoothed_sens += smoothed_sens
+        self.num_queries += len(counts)
+
+    def data_dependent_epsilon(self):
+        """Returns the data dependent epsilon of the queries answered so far."""
+        return float(min((self.log_mgf - math.log(self.delta)) / self.l_list))
+
+    def data_independent_epsilon(self):
+        """Returns the data independent epsilon of the queries answered so far, as the
+        mechanism is 2*noise_eps DP."""
+        log_mgf = self.num_queries * _logmgf_exact_batch(1.0, 2.0 * self.noise_eps, self.l_list)
+        return float(min((log_mgf - math.log(self.delta)) / self.l_list))
+
+    def state_dict(self):
+        """Returns the state of the accountant as a dict of python numbers and lists,
+        which can be serialized with json or msgpack."""
+        return {
+            "num_labels": self.num_labels,
+            "noise_eps": self.noise_eps,
+            "delta": self.delta,
+            "moments": self.moments,
+            "beta": self.beta,
+            "num_queries": self.num_queries,
+            "log_mgf": self.log_mgf.tolist(),
+            "smoothed_sens": self.smoothed_sens.tolist(),
+        }
+
+    @classmethod
+    def from_state_dict(cls, state):
+        """Builds an accountant from a state returned by state_dict."""
+        accountant = cls(
+            state["num_labels"],
+            state["noise_eps"],
+            delta=state["delta"],
+            moments=state["moments"],
+            beta=state["beta"],
+        )
+        accountant.num_queries = state["num_queries"]
+        accountant.log_mgf = np.array(state["log_mgf"], dtype=np.float64)
+        accountant.smoothed_sens = np.array(state["smoothed_sens"], dtype=np.float64)
+        return accountant
+
+
 def tensors_to_literals(tensor_list):
     """Converts list of torch tensors to list of integers/floats. Fix for not having the functionality which converts list of tensors to tensors
 
@@ -443,6 +637,9 @@ def smooth_sens_torch(counts, noise_eps, l, beta):
 
 def perform_analysis_torch(preds, indices, noise_eps=0.1, delta=1e-5, moments=8, beta=0.09):
     """Performs PATE analysis on predictions from teachers and combined predictions for student.
+
+    This is perform_analysis for torch tensors, it shares its implementation.
+
     Args:
         teacher_preds: a torch tensor of dim (num_teachers x num_examples). Each value corresponds to the
             index of the label which a teacher gave for a specific example
@@ -455,53 +652,12 @@ def perform_analysis_torch(preds, indices, noise_eps=0.1, delta=1e-5, moments=8,
     Returns:
         tuple: first value is the data dependent epsilon, then the data independent epsilon
     """
+    preds = torch.as_tensor(preds).cpu().numpy()
+    indices = torch.as_tensor(indices).cpu().numpy()
 
-    num_teachers, num_examples = preds.shape
-    _num_examples = indices.shape[0]
-
-    assert num_examples == _num_examples
-
-    labels = list(preds.flatten())
-    labels = set([tensor.item() for tensor in labels])
-    num_labels = len(labels)
-
-    counts_mat = torch.zeros(num_examples, num_labels, dtype=torch.float32)
-
-    for i in range(num_examples):
-
-        for j in range(num_teachers):
-
-            counts_mat[i, int(preds[j, i])] += 1
+    data_dep_eps, data_ind_eps = _perform_analysis(preds, indices, noise_eps, delta, moments, beta)
 
-    l_list = 1 + torch.tensor(range(moments), dtype=torch.float)
-
-    total_log_mgf_nm = torch.tensor([0.0 for _ in l_list], dtype=torch.float)
-    total_ss_nm = torch.tensor([0.0 for _ in l_list], dtype=torch.float)
-
-    for i in indices:
-
-        total_log_mgf_nm += torch.tensor(
-            [logmgf_from_counts_torch(counts_mat[i].clone(), noise_eps, l) for l in l_list]
-        )
-
-        total_ss_nm += torch.tensor(
-            [smooth_sens_torch(counts_mat[i].clone(), noise_eps, l, beta) for l in l_list],
-            dtype=torch.float,
-        )
-
-    eps_list_nm = (total_log_mgf_nm - math.log(delta)) / l_list
-    ss_eps = 2.0 * beta * math.log(1 / delta)
-    ss_scale = 2.0 / ss_eps
-    if min(eps_list_nm) == eps_list_nm[-1]:
-        print(
-            "Warning: May not have used enough values of l. Increase 'moments' variable and run again."
-        )
-
-    data_ind_log_mgf = torch.tensor([0.0 for _ in l_list])
-    data_ind_log_mgf += num_examples * torch.tensor(
-        tensors_to_literals([logmgf_exact_torch(1.0, 2.0 * noise_eps, l) for l in l_list])
+    return (
+        torch.tensor(data_dep_eps, dtype=torch.float),
+        torch.tensor(data_ind_eps, dtype=torch.float),
     )
-
-    data_ind_eps_list = (data_ind_log_mgf - math.log(delta)) / l_list
-
-    return min(eps_list_nm), min(data_ind_eps_list)
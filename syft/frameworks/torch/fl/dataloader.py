@@ -2,9 +2,14 @@ import torch
 from torch.utils.data import SequentialSampler, RandomSampler, BatchSampler
 from torch._six import string_classes, int_classes, container_abcs
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 import logging
 import math
 
+from syft.frameworks.torch.fl.dataset import BaseDataset
+
 numpy_type_map = {
     "float64": torch.DoubleTensor,
     "float32": torch.FloatTensor,
@@ -50,6 +55,43 @@ def default_collate(batch):
     raise TypeError((error_msg.format(type(batch[0]))))
 
 
+class _BatchPrefetcher(object):
+    """Builds the batches drawn from a worker's sample iterator, keeping up to `depth`
+    upcoming batches in flight in a background thread. Batches are built and returned
+    in the order the sampler draws them, so shuffling is unchanged."""
+
+    def __init__(self, loader, depth):
+        self.loader = loader
+        self.depth = depth
+        self.pending = deque()
+        self.executor = ThreadPoolExecutor(max_workers=1) if depth > 0 else None
+
+    def next_batch(self, worker, sample_iter):
+        if self.executor is None:
+            return self.loader.fetch_batch(worker, next(sample_iter))
+
+        for indices in itertools.islice(sample_iter, self.depth + 1 - len(self.pending)):
+            self.pending.append(self.executor.submit(self.loader.fetch_batch, worker, indices))
+
+        if not self.pending:
+            raise StopIteration
+        return self.pending.popleft().result()
+
+    def close(self):
+        """Drops the batches in flight and stops the background thread. Safe to call
+        several times."""
+        while self.pending:
+            self.pending.popleft().cancel()
+        if self.executor is not None:
+            # At most one batch is being fetched, the others were cancelled
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    def __del__(self):
+        # Iterators abandoned mid-epoch, for instance with break, are never stopped
+        self.close()
+
+
 class _DataLoaderIter(object):
     """Iterates once over the DataLoader's dataset, as specified by the samplers"""
 
@@ -70,6 +112,8 @@ class _DataLoaderIter(object):
             worker: iter(batch_sampler) for worker, batch_sampler in loader.batch_samplers.items()
         }
 
+        self.prefetcher = _BatchPrefetcher(loader, loader.prefetch)
+
     def __len__(self):
         return len(self.federated_dataset)
 
@@ -81,8 +125,7 @@ class _DataLoaderIter(object):
         worker = self.workers[self.worker_idx]
 
         try:
-            indices = next(self.sample_iter[worker])
-            batch = self.collate_fn([self.federated_dataset[worker][i] for i in indices])
+            batch = self.prefetcher.next_batch(worker, self.sample_iter[worker])
             return batch
         # All the data for this worker has been used
         except StopIteration:
@@ -107,6 +150,7 @@ class _DataLoaderIter(object):
 
     def stop(self):
         self.worker_idx = -1
+        self.prefetcher.close()
         raise StopIteration
 
 
@@ -126,14 +170,15 @@ class _DataLoaderOneWorkerIter(object):
         # Create a sample iterator for each worker
         self.sample_iter = iter(loader.batch_samplers[self.worker])
 
+        self.prefetcher = _BatchPrefetcher(loader, loader.prefetch)
+
     def _get_batch(self):
         # If all workers have been used, end the iterator
         if not self.worker:
             self.stop()
 
         try:
-            indices = next(self.sample_iter)
-            batch = self.collate_fn([self.federated_dataset[self.worker][i] for i in indices])
+            batch = self.prefetcher.next_batch(self.worker, self.sample_iter)
             return batch
         # All the data for this worker has been used
         except StopIteration:
@@ -153,6 +198,7 @@ class _DataLoaderOneWorkerIter(object):
 
     def stop(self):
         self.worker = None
+        self.prefetcher.close()
         raise StopIteration
 
 
@@ -177,6 +223,9 @@ class FederatedDataLoader(object):
             the effect is to retrieve num_iterators epochs of data but at each step data from num_iterators distinct
             workers is returned.
         iter_per_worker (bool): if set to true, __next__() will return a dictionary containing one batch per worker
+        prefetch (int): number of upcoming batches of each iterator which are built in the
+            background while the current one is used, so that with iter_per_worker the
+            batches of a worker are prepared while training on another one. (default: ``0``)
     """
 
     __initialized = False
@@ -190,6 +239,7 @@ class FederatedDataLoader(object):
         drop_last=False,
         collate_fn=default_collate,
         iter_per_worker=False,
+        prefetch=0,
         **kwargs,
     ):
         if len(kwargs) > 0:
@@ -208,6 +258,7 @@ class FederatedDataLoader(object):
         self.batch_size = batch_size
         self.drop_last = drop_last
         self.collate_fn = collate_fn
+        self.prefetch = prefetch
         self.iter_class = _DataLoaderOneWorkerIter if iter_per_worker else _DataLoaderIter
 
         # Build a batch sampler per worker
@@ -231,23 +282,56 @@ class FederatedDataLoader(object):
             else:
                 self.num_iterators = min(num_iterators, len(self.workers) - 1)
 
+    def fetch_batch(self, worker, indices):
+        """Builds the batch of the given indices from the dataset of a worker.
+
+        With the default collate function, a BaseDataset without transform builds the
+        whole batch where the data is located using index_select, which costs a few
+        messages per batch instead of several per data point. Its batch_transform, if
+        any, is then applied to the batch remotely in a single call.
+        """
+        dataset = self.federated_dataset[worker]
+        if (
+            self.collate_fn is default_collate
+            and isinstance(dataset, BaseDataset)
+            and dataset.transform_ is None
+        ):
+            return dataset.index_select(indices)
+
+        return self.collate_fn([dataset[i] for i in indices])
+
     def __iter__(self):
+        # The iterators of an epoch which was not run to the end are dropped
+        self._close_iterators()
         self.iterators = list()
         for idx in range(self.num_iterators):
             self.iterators.append(self.iter_class(self, worker_idx=idx))
         return self
 
     def __next__(self):
-        if self.num_iterators > 1:
-            batches = {}
-            for iterator in self.iterators:
+        try:
+            if self.num_iterators > 1:
+                batches = {}
+                for iterator in self.iterators:
+                    data, target = next(iterator)
+                    batches[data.location] = (data, target)
+                return batches
+            else:
+                iterator = self.iterators[0]
                 data, target = next(iterator)
-                batches[data.location] = (data, target)
-            return batches
-        else:
-            iterator = self.iterators[0]
-            data, target = next(iterator)
-            return data, target
+                return data, target
+        except StopIteration:
+            # The epoch ends as soon as one iterator is exhausted
+            self._close_iterators()
+            raise
+
+    def __del__(self):
+        self._close_iterators()
+
+    def _close_iterators(self):
+        """Stops prefetching the batches of the current iterators."""
+        for iterator in getattr(self, "iterators", []):
+            iterator.prefetcher.close()
 
     def __len__(self):
         length = len(self.federated_dataset) / self.batch_size
@@ -1,9 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
 import math
 import logging
 
 import torch
 from torch.utils.data import Dataset
 
+import syft as sy
+from syft.generic.pointers.object_wrapper import ObjectWrapper
+from syft.generic.pointers.pointer_tensor import PointerTensor
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,15 +23,29 @@ class BaseDataset:
 
         data[list,torch tensors]: the data points
         targets: Corresponding labels of the data points
-        transform: Function to transform the datapoints
+        transform: Function to transform the datapoints, applied to each of them as
+            a numpy array
+        batch_transform: Torch-native function transforming a batch of data points,
+            stacked along the first dimension. It is applied where the data is located,
+            in one call per batch, so it must be serializable (e.g. a torch.jit script
+            function) when the dataset is sent to a worker.
+        cache_transform: Set to True if batch_transform is deterministic: it is then
+            applied once to all the data points and its output reused.
 
     """
 
-    def __init__(self, data, targets, transform=None):
+    def __init__(self, data, targets, transform=None, batch_transform=None, cache_transform=False):
 
         self.data = data
         self.targets = targets
         self.transform_ = transform
+        self.batch_transform = batch_transform
+        self.cache_transform = cache_transform
+
+        # Pointer to the batch_transform sent where the data is located
+        self._batch_transform_ptr = None
+        # Output of the batch_transform on all the data points, with cache_transform
+        self._transformed_data = None
 
     def __len__(self):
         return len(self.data)
@@ -43,13 +62,80 @@ class BaseDataset:
             data: Data points corresponding to the given index
             targets: Targets correspoding to given datapoint
         """
-        data_elem = self.data[index]
+        if self.batch_transform is None:
+            data_elem = self.data[index]
+        elif self.cache_transform:
+            data_elem = self.transformed_data()[index]
+        else:
+            data_elem = self._apply_batch_transform(self.data[index].unsqueeze(0))[0]
+
         if self.transform_ is not None:
-            # TODO: avoid passing through numpy domain
-            data_elem = torch.tensor(self.transform_(data_elem.numpy()))
+            # as_tensor shares the memory of the array returned when possible
+            data_elem = torch.as_tensor(self.transform_(data_elem.numpy()))
 
         return data_elem, self.targets[index]
 
+    def index_select(self, indices):
+
+        """
+        Gets a batch of data points with one operation on the data and one on the
+        targets: the indices are sent once to where the data is located, which then
+        builds the batch instead of having each data point indexed and stacked remotely.
+        The batch_transform is applied to the whole batch, also where the data is located.
+
+        Args:
+
+            indices[list of integers]: indices of the items to get
+
+        Returns:
+
+            data: Data points corresponding to the given indices, stacked
+            targets: Targets corresponding to the given indices, stacked
+        """
+        index = torch.tensor(indices, dtype=torch.long)
+        if isinstance(getattr(self.data, "child", None), PointerTensor):
+            index = index.send(self.data.location)
+
+        if self.batch_transform is None:
+            data = self.data.index_select(0, index)
+        elif self.cache_transform:
+            data = self.transformed_data().index_select(0, index)
+        else:
+            data = self._apply_batch_transform(self.data.index_select(0, index))
+
+        return data, self.targets.index_select(0, index)
+
+    def transformed_data(self):
+
+        """
+        Returns:
+
+            The output of the batch_transform on all the data points, which is
+            computed on the first call and then cached.
+        """
+        if self._transformed_data is None:
+            self._transformed_data = self._apply_batch_transform(self.data)
+        return self._transformed_data
+
+    def _apply_batch_transform(self, data):
+        """Applies the batch_transform to a batch, on the worker holding it if the batch
+        is remote, sending the batch_transform to this worker on first use."""
+        if not isinstance(getattr(data, "child", None), PointerTensor):
+            return self.batch_transform(data)
+
+        location = data.location
+        if self._batch_transform_ptr is None or self._batch_transform_ptr.location != location:
+            transform_with_id = ObjectWrapper(obj=self.batch_transform, id=sy.ID_PROVIDER.pop())
+            self._batch_transform_ptr = data.child.owner.send(transform_with_id, location)
+
+        return self._batch_transform_ptr(data).wrap()
+
+    def _reset_batch_transform(self):
+        """Forgets what was computed or sent for the batch_transform, when the data moves
+        or changes."""
+        self._batch_transform_ptr = None
+        self._transformed_data = None
+
     def transform(self, transform):
 
         """
@@ -63,6 +149,7 @@ class BaseDataset:
         if type(self.data) == torch.Tensor:
 
             self.data = transform(self.data)
+            self._reset_batch_transform()
 
         else:
 
@@ -82,6 +169,7 @@ class BaseDataset:
 
         self.data.send_(worker)
         self.targets.send_(worker)
+        self._reset_batch_transform()
         return self
 
     def get(self):
@@ -91,6 +179,7 @@ class BaseDataset:
 
         self.data.get_()
         self.targets.get_()
+        self._reset_batch_transform()
         return self
 
     def fix_prec(self, *args, **kwargs):
@@ -99,6 +188,7 @@ class BaseDataset:
         """
         self.data.fix_prec_(*args, **kwargs)
         self.targets.fix_prec_(*args, **kwargs)
+        self._reset_batch_transform()
         return self
 
     fix_precision = fix_prec
@@ -109,6 +199,7 @@ class BaseDataset:
         """
         self.data.float_prec_(*args, **kwargs)
         self.targets.float_prec_(*args, **kwargs)
+        self._reset_batch_transform()
         return self
 
     float_precision = float_prec
@@ -119,6 +210,7 @@ class BaseDataset:
         """
         self.data.share_(*args, **kwargs)
         self.targets.share_(*args, **kwargs)
+        self._reset_batch_transform()
         return self
 
     @property
@@ -129,25 +221,123 @@ class BaseDataset:
         return self.data.location
 
 
-def dataset_federate(dataset, workers):
+def _iid_shards(nr_samples, nr_workers):
+    """Splits the samples in contiguous shards of the same size, as slices."""
+    # take ceil to have at most len(workers) sets after splitting
+    shard_size = max(math.ceil(nr_samples / nr_workers), 1)
+    return [
+        slice(start, min(start + shard_size, nr_samples))
+        for start in range(0, nr_samples, shard_size)
+    ]
+
+
+def _label_shards(targets, nr_workers):
+    """Gives all the samples of a label to the same worker, the labels being dealt
+    to the workers in turn."""
+    _, label_ids = torch.unique(targets, return_inverse=True)
+    owners = label_ids.view(-1) % nr_workers
+    return [(owners == worker_idx).nonzero().view(-1) for worker_idx in range(nr_workers)]
+
+
+def _dirichlet_shards(targets, nr_workers, alpha):
+    """Splits the samples of each label between the workers with proportions drawn
+    from a symmetric Dirichlet distribution of concentration alpha: the lower alpha,
+    the more each label is concentrated on a few workers."""
+    _, label_ids = torch.unique(targets, return_inverse=True)
+    label_ids = label_ids.view(-1)
+    nr_samples = len(label_ids)
+    counts = torch.bincount(label_ids)
+
+    proportions = torch.distributions.Dirichlet(torch.full((nr_workers,), float(alpha))).sample(
+        (len(counts),)
+    )
+    bounds = proportions.cumsum(dim=1)
+
+    # Order the samples by label, in random order within each label, and give each
+    # sample its relative rank in its label
+    order = torch.randperm(nr_samples)
+    _, sorted_positions = (label_ids[order] * nr_samples + torch.arange(nr_samples)).sort()
+    order = order[sorted_positions]
+    sorted_labels = label_ids[order]
+    label_starts = counts.cumsum(dim=0) - counts
+    ranks = torch.arange(nr_samples) - label_starts[sorted_labels]
+    quantiles = (ranks.double() + 0.5) / counts[sorted_labels].double()
+
+    owners = (quantiles.unsqueeze(1) > bounds[sorted_labels].double()).sum(dim=1)
+    owners = owners.clamp(max=nr_workers - 1)
+    return [order[owners == worker_idx].sort()[0] for worker_idx in range(nr_workers)]
+
+
+def _shard_size(shard):
+    if isinstance(shard, slice):
+        return shard.stop - shard.start
+    return len(shard)
+
+
+def _send_shard(dataset, shard, worker):
+    """Builds the BaseDataset of a shard of the dataset and sends it to the worker."""
+    logger.debug("Sending data to worker %s", worker.id)
+    if isinstance(dataset, BaseDataset) and dataset.transform_ is None:
+        # Index the tensors directly, contiguous shards being views of the dataset
+        return BaseDataset(
+            dataset.data[shard].send(worker),
+            dataset.targets[shard].send(worker),
+            batch_transform=dataset.batch_transform,
+            cache_transform=dataset.cache_transform,
+        )
+
+    if isinstance(shard, slice):
+        shard = range(shard.start, shard.stop)
+    else:
+        shard = shard.tolist()
+    data_loader = torch.utils.data.DataLoader(
+        torch.utils.data.Subset(dataset, shard), batch_size=len(shard)
+    )
+    data, targets = next(iter(data_loader))
+    return BaseDataset(data.send(worker), targets.send(worker))
+
+
+def dataset_federate(dataset, workers, partition="iid", alpha=0.5):
     """
     Add a method to easily transform a torch.Dataset or a sy.BaseDataset
     into a sy.FederatedDataset. The dataset given is split in len(workers)
-    part and sent to each workers
+    part and sent to each workers, concurrently.
+
+    Args:
+        dataset: the dataset to federate. For non-iid partitions, it must have a
+            targets attribute holding the labels.
+        workers: the workers to which the parts are sent.
+        partition: how the samples are split between the workers:
+            "iid": in contiguous parts of the same size (default),
+            "label": all the samples of a label go to the same worker,
+            "dirichlet": the samples of each label are split with proportions drawn
+            from a Dirichlet distribution of concentration alpha.
+        alpha: the concentration of the Dirichlet partition.
+
+    Returns:
+        The FederatedDataset of the parts, workers receiving no sample being left out.
     """
     logger.info("Scanning and sending data to {}...".format(", ".join([w.id for w in workers])))
 
-    # take ceil to have exactly len(workers) sets after splitting
-    data_size = math.ceil(len(dataset) / len(workers))
-
-    datasets = []
-    data_loader = torch.utils.data.DataLoader(dataset, batch_size=data_size)
-    for dataset_idx, (data, targets) in enumerate(data_loader):
-        worker = workers[dataset_idx % len(workers)]
-        logger.debug("Sending data to worker %s", worker.id)
-        data = data.send(worker)
-        targets = targets.send(worker)
-        datasets.append(BaseDataset(data, targets))  # .send(worker)
+    if partition == "iid":
+        shards = _iid_shards(len(dataset), len(workers))
+    else:
+        targets = getattr(dataset, "targets", None)
+        if targets is None:
+            raise ValueError(f"The {partition} partition needs the targets of the dataset")
+        targets = torch.as_tensor(targets)
+        if partition == "label":
+            shards = _label_shards(targets, len(workers))
+        elif partition == "dirichlet":
+            shards = _dirichlet_shards(targets, len(workers), alpha)
+        else:
+            raise ValueError(f"Unknown partition {partition}")
+
+    shards = [(shard, worker) for shard, worker in zip(shards, workers) if _shard_size(shard) > 0]
+    with ThreadPoolExecutor(max_workers=max(len(shards), 1)) as executor:
+        datasets = list(
+            executor.map(lambda shard_worker: _send_shard(dataset, *shard_worker), shards)
+        )
 
     logger.debug("Done!")
     return FederatedDataset(datasets)
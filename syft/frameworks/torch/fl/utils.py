@@ -1,8 +1,14 @@
 import syft as sy
 import torch
+from typing import Any
+from typing import Dict
 from typing import List
+from typing import Union
 import logging
 
+from syft.federated.model_update import assign_flat_parameters
+from syft.federated.model_update import flatten_parameters
+
 logger = logging.getLogger(__name__)
 
 
@@ -68,22 +74,100 @@ def scale_model(model, scale):
     return model
 
 
-def federated_avg(models: List[torch.nn.Module]) -> torch.nn.Module:
+class ModelAverager:
+    """Streaming weighted average of models sharing the same architecture.
+
+    The parameters of each model are flattened into one buffer and folded into a
+    running weighted sum as soon as the model is added, so that models can be averaged
+    as they arrive without holding all of them in memory.
+    """
+
+    def __init__(self):
+        self.weighted_sum = None
+        self.total_weight = 0.0
+        self.nr_models = 0
+
+    def add(self, model: torch.nn.Module, weight: float = 1.0):
+        """Fold a model into the average.
+
+        Args:
+            model (torch.nn.Module): the model to add.
+            weight (float): the weight of the model, like its number of training samples.
+        """
+        self.add_flat_parameters(flatten_parameters(model), weight)
+
+    def add_flat_parameters(self, flat_params: torch.Tensor, weight: float = 1.0):
+        """Fold parameters flattened with flatten_parameters into the average, for
+        instance decoded parameter deltas.
+
+        Args:
+            flat_params (torch.Tensor): the flattened parameters.
+            weight (float): the weight of the parameters.
+        """
+        if self.weighted_sum is None:
+            self.weighted_sum = flat_params * weight
+        elif flat_params.numel() != self.weighted_sum.numel():
+            raise ValueError("All the models averaged must have the same parameters")
+        else:
+            self.weighted_sum.add_(flat_params, alpha=weight)
+        self.total_weight += weight
+        self.nr_models += 1
+
+    def average(self) -> torch.Tensor:
+        """Returns the flattened weighted average of the models added."""
+        if self.nr_models == 0:
+            raise ValueError("No model was added to the average")
+        return self.weighted_sum / self.total_weight
+
+    def assign_to(self, model: torch.nn.Module) -> torch.nn.Module:
+        """Set the parameters of a model to the weighted average of the models added.
+
+        Args:
+            model (torch.nn.Module): the model receiving the averaged parameters.
+        Returns:
+            torch.nn.Module: the model with averaged parameters.
+        """
+        return assign_flat_parameters(model, self.average())
+
+
+def federated_avg(
+    models: Union[Dict[Any, torch.nn.Module], List[torch.nn.Module]],
+    weights: Union[Dict[Any, float], List[float]] = None,
+    dst_model: torch.nn.Module = None,
+) -> torch.nn.Module:
     """Calculate the federated average of a list of models.
 
     Args:
-        models (List[torch.nn.Module]): the models of which the federated average is calculated.
+        models (Dict or List[torch.nn.Module]): the models of which the federated average
+            is calculated, for instance indexed by worker.
+        weights (Dict or List[float]): optional weights of the models, like their number of
+            training samples, indexed like the models. By default all models weigh the same.
+        dst_model (torch.nn.Module): the model receiving the averaged parameters. Defaults
+            to the first model, whose parameters are then overwritten.
 
     Returns:
         torch.nn.Module: the module with averaged parameters.
     """
-    nr_models = len(models)
-    model_list = list(models.values())
-    model = model_list[0]
-    for i in range(1, nr_models):
-        model = add_model(model, model_list[i])
-    model = scale_model(model, 1.0 / nr_models)
-    return model
+    if isinstance(models, dict):
+        keys = list(models.keys())
+        model_list = list(models.values())
+        if isinstance(weights, dict):
+            weights = [weights[key] for key in keys]
+    else:
+        model_list = list(models)
+
+    if weights is None:
+        weights = [1.0] * len(model_list)
+    elif len(weights) != len(model_list):
+        raise ValueError(f"Got {len(weights)} weights for {len(model_list)} models")
+
+    averager = ModelAverager()
+    for model, weight in zip(model_list, weights):
+        averager.add(model, float(weight))
+
+    if dst_model is None:
+        dst_model = model_list[0]
+    return averager.assign_to(dst_model)
 
 
 def accuracy(pred_softmax, target):
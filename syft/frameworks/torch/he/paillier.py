@@ -1,4 +1,382 @@
+import itertools
+import random
+
+import numpy as np
 from phe import paillier
+from phe.paillier import EncryptedNumber
+from phe.paillier import PaillierPublicKey
 from phe.paillier import generate_paillier_keypair
+from phe.util import invert
+from phe.util import powmod
+
+import syft
 
 keygen = generate_paillier_keypair
+
+# Encoding constants of phe.EncodedNumber, the encrypted values are mantissa * BASE ** exponent
+BASE = 16
+LOG2_BASE = 4
+FLOAT_MANTISSA_BITS = 53
+
+# Number of values encrypted, decrypted or multiplied by each task of the process pool
+CHUNK_SIZE = 32
+
+# Obfuscators r ** n mod n ** 2 precomputed for each public key, indexed by n
+_obfuscators = {}
+
+
+def _map_chunks(function, *columns, constants: tuple = (), chunk_size: int = CHUNK_SIZE) -> list:
+    """Applies function to chunks of the columns in the process pool of syft and
+    concatenates the results. A single chunk is processed in the current process.
+
+    Args:
+        function: a module level function taking a tuple of the constants followed by
+            a chunk of each column, and returning a list.
+        *columns: lists of the same length which are split in chunks.
+        constants: values passed to every call of the function.
+        chunk_size: the number of values of each chunk.
+    Returns:
+        list: the concatenation of the lists returned for each chunk.
+    """
+    size = len(columns[0])
+    chunks = [
+        constants + tuple(column[i : i + chunk_size] for column in columns)
+        for i in range(0, size, chunk_size)
+    ]
+    if len(chunks) <= 1:
+        results = [function(chunk) for chunk in chunks]
+    else:
+        results = syft.pool().map(function, chunks)
+    return list(itertools.chain.from_iterable(results))
+
+
+def _generate_obfuscators(chunk: tuple) -> list:
+    n, indices = chunk
+    nsquare = n * n
+    rand = random.SystemRandom()
+    return [powmod(rand.randrange(1, n), n, nsquare) for _ in indices]
+
+
+def _raw_obfuscate(chunk: tuple) -> list:
+    n, ciphertexts, obfuscators = chunk
+    nsquare = n * n
+    rand = random.SystemRandom()
+    obfuscated = []
+    for ciphertext, obfuscator in zip(ciphertexts, obfuscators):
+        if obfuscator is None:
+            obfuscator = powmod(rand.randrange(1, n), n, nsquare)
+        obfuscated.append(ciphertext * obfuscator % nsquare)
+    return obfuscated
+
+
+def _raw_decrypt(chunk: tuple) -> list:
+    private_key, ciphertexts = chunk
+    return [private_key.raw_decrypt(ciphertext) for ciphertext in ciphertexts]
+
+
+def _raw_mul(chunk: tuple) -> list:
+    n, ciphertexts, mantissas = chunk
+    nsquare = n * n
+    products = []
+    for ciphertext, mantissa in zip(ciphertexts, mantissas):
+        if mantissa < 0:
+            # Raise the inverse to the absolute value rather than to n - |mantissa|
+            products.append(powmod(invert(ciphertext, nsquare), -mantissa, nsquare))
+        else:
+            products.append(powmod(ciphertext, mantissa, nsquare))
+    return products
+
+
+def precompute_obfuscators(public_key: PaillierPublicKey, count: int):
+    """Generates obfuscators r ** n mod n ** 2 offline, in the process pool. They are
+    the costly part of the encryption and don't depend on the values encrypted, so
+    encrypt_array only needs a multiplication per value while they last. Each
+    obfuscator is used once.
+
+    Args:
+        public_key: the public key the obfuscators are generated for.
+        count: the number of obfuscators to generate.
+    """
+    obfuscators = _map_chunks(_generate_obfuscators, range(count), constants=(public_key.n,))
+    _obfuscators.setdefault(public_key.n, []).extend(obfuscators)
+
+
+def _pop_obfuscators(public_key: PaillierPublicKey, count: int) -> list:
+    """Takes up to count precomputed obfuscators, completed with None."""
+    available = _obfuscators.get(public_key.n, [])
+    obfuscators = available[len(available) - min(count, len(available)) :]
+    del available[len(available) - len(obfuscators) :]
+    return obfuscators + [None] * (count - len(obfuscators))
+
+
+def _obfuscate(public_key: PaillierPublicKey, ciphertexts: list) -> list:
+    """Multiplies raw ciphertexts by fresh obfuscators r ** n mod n ** 2, which
+    re-randomizes them without changing the values encrypted. The precomputed
+    obfuscators of the public key are used first, see precompute_obfuscators."""
+    obfuscators = _pop_obfuscators(public_key, len(ciphertexts))
+
+    # Without any obfuscator to compute, a multiplication per value doesn't need the pool
+    chunk_size = CHUNK_SIZE if None in obfuscators else max(len(ciphertexts), 1)
+    return _map_chunks(
+        _raw_obfuscate, ciphertexts, obfuscators, constants=(public_key.n,), chunk_size=chunk_size
+    )
+
+
+def _is_obfuscated(number: EncryptedNumber) -> bool:
+    # phe only exposes this flag through EncryptedNumber.ciphertext(be_secure=True)
+    return number._EncryptedNumber__is_obfuscated
+
+
+def encoding_exponent(values: np.ndarray) -> int:
+    """Returns the largest exponent with which all the values can be encoded exactly.
+
+    As in phe.EncodedNumber.encode, integers have an exponent of 0 and floats an
+    exponent keeping all the bits of their mantissa, but here a single exponent is
+    used for the whole array, so that the encrypted values can be added without
+    changing their exponent.
+    """
+    if values.dtype.kind != "f":
+        return 0
+    nonzero = values[values != 0]
+    if nonzero.size == 0:
+        return 0
+    _, exponents = np.frexp(nonzero)
+    return int(exponents.min() - FLOAT_MANTISSA_BITS) // LOG2_BASE
+
+
+def _scale_floats(values: np.ndarray, exponents) -> list:
+    """Returns the integers values / BASE ** exponents, which are exact as scaling by a
+    power of two is, or raises OverflowError if they are too large for a float."""
+    with np.errstate(over="ignore"):
+        scaled = np.ldexp(values.astype(np.float64), -LOG2_BASE * np.asarray(exponents))
+    return [int(value) for value in scaled.ravel().tolist()]
+
+
+def encode(public_key: PaillierPublicKey, values: np.ndarray, exponent: int = None) -> tuple:
+    """Encodes values as mantissa * BASE ** exponent with a common exponent.
+
+    If no exponent is given and the floats have too wide a range to share one, like
+    [1e-200, 1e200], each value gets its own exponent as with phe.EncodedNumber.
+
+    Args:
+        public_key: the public key the values are encoded for.
+        values: an array of numbers.
+        exponent: the exponent of the encoding, defaults to encoding_exponent(values).
+    Returns:
+        tuple: the list of the signed integer mantissas, and the common exponent or
+            the list of the exponents of the values.
+    Raises:
+        ValueError: if the values can't be encoded exactly with the exponent, or if a
+            mantissa doesn't fit in the public key.
+    """
+    natural_exponent = encoding_exponent(values)
+    common_exponent = exponent is None
+    if common_exponent:
+        exponent = natural_exponent
+    elif exponent > natural_exponent:
+        raise ValueError(f"The values can't be encoded exactly with an exponent of {exponent}")
+
+    if values.dtype.kind == "f":
+        try:
+            mantissas = _scale_floats(values, exponent)
+        except OverflowError:
+            mantissas = None
+    else:
+        scale = BASE ** -exponent
+        mantissas = [int(value) * scale for value in values.ravel().tolist()]
+
+    if mantissas is None or (
+        mantissas and max(abs(min(mantissas)), abs(max(mantissas))) > public_key.max_int
+    ):
+        if not common_exponent or values.dtype.kind != "f":
+            raise ValueError(f"Integer needs to be within +/- {public_key.max_int}")
+        flat_values = values.ravel()
+        _, exponents = np.frexp(flat_values)
+        exponents = np.where(flat_values == 0, 0, (exponents - FLOAT_MANTISSA_BITS) // LOG2_BASE)
+        return _scale_floats(flat_values, exponents), exponents.tolist()
+
+    return mantissas, exponent
+
+
+def decode(public_key: PaillierPublicKey, plaintexts: list, exponents: list) -> list:
+    """Decodes raw plaintexts as phe.EncodedNumber.decode does."""
+    n, max_int = public_key.n, public_key.max_int
+    values = []
+    for plaintext, exponent in zip(plaintexts, exponents):
+        if plaintext <= max_int:
+            mantissa = plaintext
+        elif plaintext >= n - max_int:
+            mantissa = plaintext - n
+        else:
+            raise OverflowError("Overflow detected in decrypted number")
+        values.append(mantissa * pow(BASE, exponent))
+    return values
+
+
+def _to_encrypted(
+    public_key: PaillierPublicKey, ciphertexts: list, exponents, shape, obfuscated: bool = False
+) -> np.ndarray:
+    """Builds an array of EncryptedNumber from raw ciphertexts and their exponents.
+
+    If obfuscated is True, the ciphertexts were randomized with fresh obfuscators and
+    phe won't obfuscate them again before exposing them.
+    """
+    if isinstance(exponents, int):
+        exponents = itertools.repeat(exponents)
+
+    numbers = [
+        EncryptedNumber(public_key, ciphertext, exponent)
+        for ciphertext, exponent in zip(ciphertexts, exponents)
+    ]
+    if obfuscated:
+        for number in numbers:
+            number._EncryptedNumber__is_obfuscated = True
+
+    encrypted = np.empty(len(numbers), dtype=object)
+    encrypted[:] = numbers
+    return encrypted.reshape(shape)
+
+
+def _from_encrypted(encrypted: np.ndarray, secure: bool = False) -> tuple:
+    """Returns the public key, and the lists of raw ciphertexts and exponents of an
+    array of EncryptedNumber.
+
+    If secure is True, the ciphertexts which were not obfuscated, like the results of
+    operations computed by phe, are obfuscated in chunks before being returned, so
+    that they can be exposed. Otherwise they can only be used locally.
+    """
+    numbers = encrypted.ravel().tolist()
+    if not numbers:
+        return None, [], []
+    public_key = numbers[0].public_key
+    assert all(
+        number.public_key == public_key for number in numbers
+    ), "All the values should be encrypted with the same public key"
+    ciphertexts = [number.ciphertext(be_secure=False) for number in numbers]
+    exponents = [number.exponent for number in numbers]
+
+    if secure:
+        indices = [i for i, number in enumerate(numbers) if not _is_obfuscated(number)]
+        obfuscated = _obfuscate(public_key, [ciphertexts[i] for i in indices])
+        for i, ciphertext in zip(indices, obfuscated):
+            ciphertexts[i] = ciphertext
+
+    return public_key, ciphertexts, exponents
+
+
+def encrypt_array(public_key: PaillierPublicKey, values: np.ndarray) -> np.ndarray:
+    """Encrypts an array of numbers in chunks in the process pool of syft.
+
+    The values are encoded with a common exponent when their range allows it, see
+    encode, and the precomputed obfuscators of the public key are used first, see
+    precompute_obfuscators.
+
+    Args:
+        public_key: the public key used to encrypt the values.
+        values: an array of numbers.
+    Returns:
+        np.ndarray: an object array of EncryptedNumber with the shape of values.
+    """
+    mantissas, exponent = encode(public_key, values)
+    n, nsquare = public_key.n, public_key.nsquare
+    # With g = n + 1, g ** m = n * m + 1 mod n ** 2
+    ciphertexts = _obfuscate(public_key, [(n * (m % n) + 1) % nsquare for m in mantissas])
+    return _to_encrypted(public_key, ciphertexts, exponent, values.shape, obfuscated=True)
+
+
+def decrypt_array(private_key: paillier.PaillierPrivateKey, encrypted: np.ndarray) -> np.ndarray:
+    """Decrypts an array of EncryptedNumber in chunks in the process pool of syft.
+
+    Args:
+        private_key: the private key matching the public key of the values.
+        encrypted: an object array of EncryptedNumber.
+    Returns:
+        np.ndarray: an object array of the decrypted numbers with the shape of encrypted.
+    """
+    _, ciphertexts, exponents = _from_encrypted(encrypted)
+    plaintexts = _map_chunks(_raw_decrypt, ciphertexts, constants=(private_key,))
+
+    decrypted = np.empty(len(plaintexts), dtype=object)
+    decrypted[:] = decode(private_key.public_key, plaintexts, exponents)
+    return decrypted.reshape(encrypted.shape)
+
+
+def add_plain(encrypted: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Adds an array of numbers to an array of EncryptedNumber, with broadcasting.
+
+    When the values can be encoded with the common exponent of the encrypted values,
+    each addition is a multiplication of the ciphertext by the encryption of the value
+    without randomness, the sums being re-randomized with obfuscators so that they
+    don't reveal the ciphertexts they were computed from. Otherwise the
+    EncryptedNumber additions are used.
+    """
+    encrypted, values = np.broadcast_arrays(encrypted, values)
+    public_key, ciphertexts, exponents = _from_encrypted(encrypted)
+    if not ciphertexts or len(set(exponents)) > 1 or exponents[0] > encoding_exponent(values):
+        return encrypted + values
+
+    exponent = exponents[0]
+    try:
+        mantissas, _ = encode(public_key, values, exponent)
+    except ValueError:
+        return encrypted + values
+    n, nsquare = public_key.n, public_key.nsquare
+    sums = [
+        ciphertext * (n * (mantissa % n) + 1) % nsquare
+        for ciphertext, mantissa in zip(ciphertexts, mantissas)
+    ]
+    sums = _obfuscate(public_key, sums)
+    return _to_encrypted(public_key, sums, exponent, encrypted.shape, obfuscated=True)
+
+
+def mul_plain(encrypted: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Multiplies an array of EncryptedNumber by an array of numbers, with broadcasting.
+
+    The modular exponentiations are computed in chunks in the process pool of syft,
+    and the products are re-randomized with obfuscators like in add_plain.
+    """
+    encrypted, values = np.broadcast_arrays(encrypted, values)
+    public_key, ciphertexts, exponents = _from_encrypted(encrypted)
+    if not ciphertexts:
+        return encrypted * values
+
+    mantissas, exponent = encode(public_key, values)
+    products = _map_chunks(_raw_mul, ciphertexts, mantissas, constants=(public_key.n,))
+    products = _obfuscate(public_key, products)
+    value_exponents = itertools.repeat(exponent) if isinstance(exponent, int) else exponent
+    exponents = [e + value_exponent for e, value_exponent in zip(exponents, value_exponents)]
+    return _to_encrypted(public_key, products, exponents, encrypted.shape, obfuscated=True)
+
+
+def serialize_encrypted(encrypted: np.ndarray) -> tuple:
+    """Packs an array of EncryptedNumber compactly: the public key and the ciphertexts
+    as fixed width big-endian bytes, and the exponents as int32 bytes. Like phe does
+    before exposing a ciphertext, the ciphertexts which were not obfuscated are.
+
+    Returns:
+        tuple: (n, shape, exponents, ciphertexts), see deserialize_encrypted.
+    """
+    public_key, ciphertexts, exponents = _from_encrypted(encrypted, secure=True)
+    n = public_key.n if public_key is not None else 0
+    width = (2 * n.bit_length() + 7) // 8
+    return (
+        n.to_bytes((n.bit_length() + 7) // 8, "big"),
+        tuple(encrypted.shape),
+        np.array(exponents, dtype=np.int32).tobytes(),
+        b"".join(ciphertext.to_bytes(width, "big") for ciphertext in ciphertexts),
+    )
+
+
+def deserialize_encrypted(data: tuple) -> np.ndarray:
+    """Unpacks an array of EncryptedNumber packed by serialize_encrypted."""
+    n_bytes, shape, exponents, ciphertexts = data
+    n = int.from_bytes(n_bytes, "big")
+    public_key = PaillierPublicKey(n) if n else None
+    width = (2 * n.bit_length() + 7) // 8
+    exponents = np.frombuffer(exponents, dtype=np.int32).tolist()
+    ciphertexts = [
+        int.from_bytes(ciphertexts[i : i + width], "big")
+        for i in range(0, len(ciphertexts), width or 1)
+    ]
+    # The ciphertexts serialized were obfuscated, so they can be exposed again
+    return _to_encrypted(public_key, ciphertexts, exponents, shape, obfuscated=True)
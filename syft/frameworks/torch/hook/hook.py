@@ -65,6 +65,11 @@ class TorchHook(FrameworkHook):
             yourself.
         verbose: An optional boolean parameter (default True) to indicate
             whether or not to print the operations as they occur.
+        lazy_hooking: An optional boolean parameter (default True). If set,
+            the methods of the syft tensor types (PointerTensor,
+            AdditiveSharingTensor, FixedPrecisionTensor, etc.) are only hooked
+            the first time they are used, which makes the hooking process
+            much faster. Set it to False to hook all of them upfront.
         queue_size: An integer optional parameter (default 0) to specify the
             max length of the list that stores the messages to be sent.
 
@@ -87,7 +92,12 @@ class TorchHook(FrameworkHook):
     """
 
     def __init__(
-        self, torch, local_worker: BaseWorker = None, is_client: bool = True, verbose: bool = True
+        self,
+        torch,
+        local_worker: BaseWorker = None,
+        is_client: bool = True,
+        verbose: bool = True,
+        lazy_hooking: bool = True,
     ):
         """Initializes the hook.
 
@@ -103,6 +113,8 @@ class TorchHook(FrameworkHook):
         # Save the local worker as an attribute
         self.local_worker = local_worker
 
+        self.lazy_hooking = lazy_hooking
+
         if hasattr(torch, "torch_hooked"):
             logging.warning("Torch was already hooked... skipping hooking process")
             self.local_worker = syft.local_worker
@@ -307,11 +319,11 @@ class TorchHook(FrameworkHook):
         """
 
         tensor_type = self.torch.Tensor
-        # Use a pre-defined list to select the methods to overload
-        for attr in self.to_auto_overload[tensor_type]:
-            if attr not in dir(AdditiveSharingTensor):
-                new_method = self._get_hooked_additive_shared_method(attr)
-                setattr(AdditiveSharingTensor, attr, new_method)
+        self._hook_methods_lazily(
+            AdditiveSharingTensor,
+            self.to_auto_overload[tensor_type],
+            self._get_hooked_additive_shared_method,
+        )
 
     def _hook_parameters(self):
         """
@@ -449,6 +461,7 @@ class TorchHook(FrameworkHook):
         torch_modules = syft.torch.torch_modules
 
         for module_name, torch_module in torch_modules.items():
+            module_attrs = set(dir(torch_module))
             for func in dir(torch_module):
 
                 # Some functions we want to ignore (not override). Such functions have been hard
@@ -469,7 +482,7 @@ class TorchHook(FrameworkHook):
                     continue
 
                 # If we haven't already overloaded this function
-                if "native_" in func or f"native_{func}" in dir(torch_module):
+                if "native_" in func or f"native_{func}" in module_attrs:
                     continue
 
                 self._perform_function_overloading(module_name, torch_module, func)
@@ -508,7 +521,7 @@ class TorchHook(FrameworkHook):
 
             results = {}
             for k, v in new_self.items():
-                results[k] = v.__getattribute__(attr)(*dispatch(new_args, k), **new_kwargs)
+                results[k] = getattr(v, attr)(*dispatch(new_args, k), **new_kwargs)
 
             # Put back AdditiveSharingTensor on the tensors found in the response
             response = hook_args.hook_response(
@@ -571,8 +584,9 @@ class TorchHook(FrameworkHook):
 
             return method
 
-        for method_name in methods_to_hook:
-            setattr(PromiseTensor, method_name, generate_method(method_name))
+        hook_self._hook_methods_lazily(
+            PromiseTensor, methods_to_hook, generate_method, force=methods_to_hook
+        )
 
         def FloatTensor(shape, *args, **kwargs):
             return PromiseTensor(shape, tensor_type="torch.FloatTensor", *args, **kwargs).wrap()
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 import random
 from typing import List
 
@@ -17,6 +18,36 @@ except ImportError:
     raise DependencyError("scipy", "scipy")
 
 
+def _map_workers(func, *ptr_lists):
+    """
+    Calls func on the pointers located on each worker concurrently, so that the
+    computations of the workers run in parallel rather than one after the other
+    """
+    with ThreadPoolExecutor(max_workers=max(len(ptr_lists[0]), 1)) as executor:
+        return list(executor.map(func, *ptr_lists))
+
+
+def _pack(tensors):
+    """
+    Flattens and concatenates tensors located on the same worker, so that they can
+    be secret shared at once
+    """
+    return torch.cat([tensor.contiguous().view(-1) for tensor in tensors])
+
+
+def _unpack(tensor, shapes):
+    """
+    Splits a 1-dim tensor built by _pack back into tensors of the given shapes
+    """
+    tensors = []
+    offset = 0
+    for shape in shapes:
+        size = int(np.prod(shape))
+        tensors.append(tensor[offset : offset + size].view(*shape))
+        offset += size
+    return tensors
+
+
 class EncryptedLinearRegression:
     """
     Multi-Party Linear Regressor based on Jonathan Bloom's algorithm.
@@ -94,14 +125,17 @@ class EncryptedLinearRegression:
         self.workers = self._get_workers(X_ptrs)
 
         # Computing aggregated pairwise dot products remotelly
-        XX_ptrs, Xy_ptrs, yy_ptrs = self._remote_dot_products(X_ptrs, y_ptrs)
+        packed_ptrs = self._remote_dot_products(X_ptrs, y_ptrs)
 
         # Secred share tensors between hbc_worker, crypto_provider and a random worker
         # and compute aggregates. It corresponds to the Combine stage of Bloom's algorithm
         idx = random.randint(0, len(self.workers) - 1)
-        XX_shared = sum(self._share_ptrs(XX_ptrs, idx))
-        Xy_shared = sum(self._share_ptrs(Xy_ptrs, idx))
-        yy_shared = sum(self._share_ptrs(yy_ptrs, idx))
+        n_cols = self.n_features + int(self.fit_intercept)
+        n_targets = y_ptrs[0].shape[1]
+        XX_shared, Xy_shared, yy_shared = _unpack(
+            sum(self._share_ptrs(packed_ptrs, idx)),
+            [(n_cols, n_cols), (n_cols, n_targets), (n_targets, n_targets)],
+        )
 
         ##################### Compute inverse of Gram Matrix ###########################
         # We need to normalize it by dividing the Gram matrix by the total sample size
@@ -258,31 +292,30 @@ class EncryptedLinearRegression:
     def _remote_dot_products(X_ptrs, y_ptrs):
         """
         This method computes the aggregated dot-products remotely. It corresponds
-        to the Compression stage (or Compression within) of Bloom's algorithm
+        to the Compression stage (or Compression within) of Bloom's algorithm.
+        The workers compute their dot-products concurrently, and each returns
+        them packed in a single 1-dim tensor (XX, Xy, yy)
         """
-        XX_ptrs = []
-        Xy_ptrs = []
-        yy_ptrs = []
-        for x, y in zip(X_ptrs, y_ptrs):
-            XX_ptrs.append(x.t() @ x)
-            Xy_ptrs.append(x.t() @ y)
-            yy_ptrs.append(y.t() @ y)
 
-        return XX_ptrs, Xy_ptrs, yy_ptrs
+        def dot_products(x, y):
+            return _pack((x.t() @ x, x.t() @ y, y.t() @ y))
+
+        return _map_workers(dot_products, X_ptrs, y_ptrs)
 
     def _share_ptrs(self, ptrs, worker_idx):
         """
         Method that secret share a list of remote tensors between a worker of
-        the pool and the 'honest but curious' worker, using a crypto_provider worker
+        the pool and the 'honest but curious' worker, using a crypto_provider worker.
+        The tensors are shared concurrently.
         """
-        shared_tensors = []
-        for ptr in ptrs:
+
+        def share(ptr):
             fpt_tensor = ptr.fix_precision(precision_fractional=self.precision_fractional)
-            shared_tensor = fpt_tensor.share(
+            return fpt_tensor.share(
                 self.workers[worker_idx], self.hbc_worker, crypto_provider=self.crypto_provider
             ).get()
-            shared_tensors.append(shared_tensor)
-        return shared_tensors
+
+        return _map_workers(share, ptrs)
 
     def _compute_pvalues(self):
         """
@@ -354,23 +387,29 @@ class DASH:
 
         self.workers = self._get_workers(X_ptrs)
 
-        # Computing aggregated pairwise dot products remotely
-        XX_ptrs, Xy_ptrs, yy_ptrs, CX_ptrs, Cy_ptrs = self._remote_dot_products(
-            X_ptrs, C_ptrs, y_ptrs
-        )
-
-        # Compute remote QR decompositions
-        R_ptrs = self._remote_qr(C_ptrs)
+        # Computing aggregated pairwise dot products and QR decompositions remotely
+        packed_ptrs = self._remote_compression(X_ptrs, C_ptrs, y_ptrs)
 
         # Secred share tensors between hbc_worker, crypto_provider and a random worker
         # and compute aggregates. It corresponds to the Combine stage of DASH's algorithm
         idx = random.randint(0, len(self.workers) - 1)
-        XX_shared = sum(self._share_ptrs(XX_ptrs, idx))
-        Xy_shared = sum(self._share_ptrs(Xy_ptrs, idx))
-        yy_shared = sum(self._share_ptrs(yy_ptrs, idx))
-        CX_shared = sum(self._share_ptrs(CX_ptrs, idx))
-        Cy_shared = sum(self._share_ptrs(Cy_ptrs, idx))
-        R_cat_shared = torch.cat(self._share_ptrs(R_ptrs, idx), dim=0)
+        packed_shared = self._share_ptrs(packed_ptrs, idx)
+
+        n_targets = y_ptrs[0].shape[1]
+        shapes = [
+            (self.n_features,),
+            (self.n_features, n_targets),
+            (n_targets, n_targets),
+            (self.n_permanent, self.n_features),
+            (self.n_permanent, n_targets),
+        ]
+        n_aggregated = sum(int(np.prod(shape)) for shape in shapes)
+        XX_shared, Xy_shared, yy_shared, CX_shared, Cy_shared = _unpack(
+            sum(packed[:n_aggregated] for packed in packed_shared), shapes
+        )
+        R_cat_shared = torch.cat(
+            [packed[n_aggregated:].view(-1, self.n_permanent) for packed in packed_shared], dim=0
+        )
 
         # QR decomposition of R_cat_shared
         _, R_shared = qr(R_cat_shared, norm_factor=self.total_size ** (1 / 2))
@@ -467,36 +506,20 @@ class DASH:
         return tuple(workers)
 
     @staticmethod
-    def _remote_dot_products(X_ptrs, C_ptrs, y_ptrs):
+    def _remote_compression(X_ptrs, C_ptrs, y_ptrs):
         """
-        This method computes the aggregated dot-products remotely. It corresponds
-        to the Compression stage (or Compression within) of DASH algorithm
+        This method computes the aggregated dot-products and the QR decomposition of
+        the permanent covariate matrices remotely. It corresponds to the Compression
+        stage (or Compression within) of DASH algorithm. The workers compute them
+        concurrently, and each returns them packed in a single 1-dim tensor
+        (XX, Xy, yy, CX, Cy, R)
         """
-        XX_ptrs = []
-        Xy_ptrs = []
-        yy_ptrs = []
-        CX_ptrs = []
-        Cy_ptrs = []
-        for x, c, y in zip(X_ptrs, C_ptrs, y_ptrs):
-            XX_ptrs.append((x.t() @ x).sum(dim=0))
-            Xy_ptrs.append(x.t() @ y)
-            yy_ptrs.append(y.t() @ y)
-            CX_ptrs.append(c.t() @ x)
-            Cy_ptrs.append(c.t() @ y)
 
-        return XX_ptrs, Xy_ptrs, yy_ptrs, CX_ptrs, Cy_ptrs
-
-    @staticmethod
-    def _remote_qr(C_ptrs):
-        """
-        Performs the QR decompositions of permanent covariate matrices remotely.
-        It returns a list with the upper right matrices located in each worker
-        """
-        R_ptrs = []
-        for c in C_ptrs:
+        def compression(x, c, y):
             _, r = qr(c)
-            R_ptrs.append(r)
-        return R_ptrs
+            return _pack(((x.t() @ x).sum(dim=0), x.t() @ y, y.t() @ y, c.t() @ x, c.t() @ y, r))
+
+        return _map_workers(compression, X_ptrs, C_ptrs, y_ptrs)
 
     @staticmethod
     def _inv_upper(R):
@@ -526,16 +549,17 @@ class DASH:
     def _share_ptrs(self, ptrs, worker_idx):
         """
         Method that secret share a list of remote tensors between a worker of
-        the pool and the 'honest but curious' worker, using a crypto_provider worker
+        the pool and the 'honest but curious' worker, using a crypto_provider worker.
+        The tensors are shared concurrently.
         """
-        shared_tensors = []
-        for ptr in ptrs:
+
+        def share(ptr):
             fpt_tensor = ptr.fix_precision(precision_fractional=self.precision_fractional)
-            shared_tensor = fpt_tensor.share(
+            return fpt_tensor.share(
                 self.workers[worker_idx], self.hbc_worker, crypto_provider=self.crypto_provider
             ).get()
-            shared_tensors.append(shared_tensor)
-        return shared_tensors
+
+        return _map_workers(share, ptrs)
 
     def _compute_pvalues(self):
         """
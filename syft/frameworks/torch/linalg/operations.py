@@ -5,41 +5,48 @@ from syft.generic.pointers.pointer_tensor import PointerTensor
 from syft.frameworks.torch.tensors.interpreters.additive_shared import AdditiveSharingTensor
 
 
-def inv_sym(t):
+def inv_sym(t, block_size=16):
     """
     This function performs the inversion of a symmetric matrix (2-dim tensor) in MPC.
     It uses LDLt decomposition, which is better than Cholensky decomposition in our case
     since it doesn't use square root.
     Algorithm reference: https://arxiv.org/abs/1111.4144 - Section IV
 
+    The inverse is computed as inv(L)t * inv(D) * inv(L), where the inverse of the unit
+    lower triangular matrix L is computed by blocks of rows without any division.
+
+    On an AdditiveSharingTensor, the number of communication rounds is O(n): each
+    column needs one secure division and one matrix multiplication, since its pivot
+    depends on the previous columns of the panel, so the divisions of a panel can't
+    be batched. The panels reduce the size of the products, not the number of rounds.
+
     Args:
         t: symmetric 2-dim tensor
+        block_size: number of columns processed together with matrix multiplications
 
     Returns:
         t_inv: inverse of t as 2-dim tensor
 
     """
 
-    n = t.shape[0]
-    l, d, inv_d = _ldl(t)
-    l_t = l.t()
-    t_inv = torch.zeros_like(t)
-    for j in range(n - 1, -1, -1):
-        for i in range(j, -1, -1):
-            if i == j:
-                t_inv[i, j] = inv_d[i] - (l_t[i, i + 1 : n] * t_inv[i + 1 : n, j]).sum()
-            else:
-                t_inv[j, i] = t_inv[i, j] = -(l_t[i, i + 1 : n] * t_inv[i + 1 : n, j]).sum()
+    l, d, inv_d = _ldl(t, block_size=block_size)
+    l_inv = _inv_unit_lower(l, block_size=block_size)
+    t_inv = l_inv.t() @ (l_inv * inv_d.view(-1, 1))
 
     return t_inv
 
 
-def _ldl(t):
+def _ldl(t, block_size=16):
     """
     This function performs the LDLt decomposition of a symmetric matrix (2-dim tensor)
 
+    The columns are factorized by panels of block_size columns: within a panel each
+    column is computed with vector operations, and the rest of the matrix is updated
+    once per panel with a matrix multiplication.
+
     Args:
         t: symmetric 2-dim tensor
+        block_size: number of columns in a panel
 
     Returns:
         l: lower triangular matrix as a 2-dim tensor with same type as t
@@ -49,28 +56,82 @@ def _ldl(t):
                computations with division, which is very slow in MPC
     """
     n = t.shape[0]
+    # a is t minus the contribution l[:, j] * d[j] * l[:, j]t of the columns already factorized
+    a = t.copy()
     l = torch.zeros_like(t)
     d = torch.diag(l).copy()
     inv_d = d.copy()
 
-    for i in range(n):
-        d[i] = t[i, i] - (l[i, :i] ** 2 * d[:i]).sum()
-        inv_d[i] = (0 * d[i] + 1) / d[i]  # Needed to compute inv of a number in MPC
-        for j in range(i, n):
+    for start in range(0, n, block_size):
+        end = min(start + block_size, n)
+
+        for i in range(start, end):
+            d[i] = a[i, i]
+            inv_d[i] = (0 * d[i] + 1) / d[i]  # Needed to compute inv of a number in MPC
             # The diagonal of L in LDLt decomposition is 1
-            if j == i:
-                l[j, i] += 1
-            else:
-                l[j, i] = (t[j, i] - (l[j, :i] * l[i, :i] * d[:i]).sum()) * inv_d[i]
+            l[i, i] += 1
+            if i + 1 < n:
+                l[i + 1 :, i] = a[i + 1 :, i] * inv_d[i]
+            # Only the columns of the panel are updated here
+            if i + 1 < end:
+                a[i + 1 :, i + 1 : end] = (
+                    a[i + 1 :, i + 1 : end] - l[i + 1 :, i : i + 1] @ a[i : i + 1, i + 1 : end]
+                )
+
+        # Update the rest of the matrix with the whole panel, a[end:, start:end] being
+        # the columns of l scaled by d
+        if end < n:
+            a[end:, end:] = a[end:, end:] - l[end:, start:end] @ a[end:, start:end].t()
 
     return l, d, inv_d
 
 
-def qr(t, mode="reduced", norm_factor=None):
+def _inv_unit_lower(l, block_size=16):
+    """
+    This function performs the inversion of a lower triangular matrix with a unit
+    diagonal, like the L of the LDLt decomposition, by forward substitution on blocks
+    of rows. As the diagonal is 1, no division is needed.
+
+    Args:
+        l: lower triangular 2-dim tensor with a unit diagonal
+        block_size: number of rows in a block
+
+    Returns:
+        l_inv: inverse of l as 2-dim tensor
+    """
+    n = l.shape[0]
+    l_inv = torch.zeros_like(l)
+    for i in range(n):
+        l_inv[i, i] += 1
+
+    for start in range(0, n, block_size):
+        end = min(start + block_size, n)
+
+        # Contribution of the rows of the blocks already inverted
+        if start > 0:
+            l_inv[start:end, :start] = l_inv[start:end, :start] - (
+                l[start:end, :start] @ l_inv[:start, :start]
+            )
+
+        # Substitution of the rows within the block
+        for i in range(start + 1, end):
+            l_inv[i : i + 1, :i] = l_inv[i : i + 1, :i] - l[i : i + 1, start:i] @ l_inv[start:i, :i]
+
+    return l_inv
+
+
+def qr(t, mode="reduced", norm_factor=None, block_size=16):
     """
     This function performs the QR decomposition of a matrix (2-dim tensor). The
     decomposition is performed using Householder Reflection.
 
+    The reflections are computed by panels of block_size columns and accumulated in
+    the compact WY form I - Y T Yt, so that the rest of R and Q are updated with a few
+    matrix multiplications per panel rather than with one reflection per column.
+    As in inv_sym, the reflection of each column depends on the previous ones, so on
+    an AdditiveSharingTensor the norm and the secure division of each column still
+    need their own communication rounds.
+
     Args:
         t: 2-dim tensor, shape(M, N). It should be whether a local tensor, a
             pointer to a remote tensor or an AdditiveSharedTensor
@@ -86,6 +147,8 @@ def qr(t, mode="reduced", norm_factor=None):
             order of the square root of number of entries in the original matrix
             used to perform the compression phase assuming the entries are standardized.
 
+        block_size: number of columns in a panel
+
     Returns:
         q: orthogonal matrix as a 2-dim tensor with same type as t
         r: lower triangular matrix as a 2-dim tensor with same type as t
@@ -122,74 +185,71 @@ def qr(t, mode="reduced", norm_factor=None):
             "mode should have one of the values in the list:" + str(["reduced", "complete", "r"])
         )
 
-    ######## QR decomposition via Householder Reflection #########
+    ######## QR decomposition via blocked Householder Reflection #########
     n_rows, n_cols = t.shape
 
     # Initiate R matrix from t
     R = t.copy()
 
-    # Initiate identity matrix with size (n_rows, n_rows)
-    I = torch.diag(torch.Tensor([1.0] * n_rows))
+    if not mode == "r":
+        # Initiate Q_transpose with the identity matrix with size (n_rows, n_rows)
+        Q_t = torch.diag(torch.Tensor([1.0] * n_rows))
+
+        # Send it to remote worker if t is pointer, secret share it if it's an AST
+        if t_type == "pointer":
+            Q_t = Q_t.send(location)
+        if t_type == "ast":
+            Q_t = Q_t.fix_prec(precision_fractional=prec_frac).share(
+                *workers, crypto_provider=crypto_prov
+            )
 
-    # Send it to remote worker if t is pointer, secret share it if it's an AST
-    if t_type == "pointer":
-        I = I.send(location)
-    if t_type == "ast":
-        I = I.fix_prec(precision_fractional=prec_frac).share(*workers, crypto_provider=crypto_prov)
+    n_reflections = min(n_rows, n_cols)
+    for start in range(0, n_reflections, block_size):
+        end = min(start + block_size, n_reflections)
 
-    if not mode == "r":
-        # Initiate Q_transpose
-        Q_t = I.copy()
-
-    # Iteration via Household Reflection
-    for i in range(min(n_rows, n_cols)):
-
-        # Identity for this iteration, it has size (n_cols-i, n_cols-i)
-        I_i = I[i:, i:]
-
-        # Init 1st vector of the canonical base in the same worker as t
-        e = torch.zeros_like(t)[i:, 0].view(-1, 1)
-        e[0, 0] += 1
-
-        # Current vector in R to perform reflection
-        x = R[i:, i].view(-1, 1)
-
-        # Compute norm in MPC if it's an AST
-        x_norm = _norm_mpc(x, norm_factor) if t_type == "ast" else torch.sqrt(x.t() @ x).squeeze()
-
-        # Compute Householder transform
-        numerator = x @ x.t() - x_norm * (e @ x.t() + x @ e.t()) + (x.t() @ x) * (e @ e.t())
-        denominator = x.t() @ x - x_norm * x[0, 0]
-        # Need the line below to perform inverse of a number in MPC
-        inv_denominator = (0 * denominator + 1) / denominator
-        H = I_i - numerator * inv_denominator
-
-        # If it is not the 1st iteration
-        # expand matrix H with Identity at diagonal and zero elsewhere
-        if i > 0:
-            down_zeros = torch.zeros([n_rows - i, i])
-            up_zeros = torch.zeros([i, n_rows - i])
-
-            # Send them to remote worker if t is pointer, secret share it if its an AST
-            if t_type == "pointer":
-                down_zeros = down_zeros.send(location)
-                up_zeros = up_zeros.send(location)
-            if t_type == "ast":
-                down_zeros = down_zeros.fix_prec(precision_fractional=prec_frac).share(
-                    *workers, crypto_provider=crypto_prov
-                )
-                up_zeros = up_zeros.fix_prec(precision_fractional=prec_frac).share(
-                    *workers, crypto_provider=crypto_prov
+        # The reflections of the panel are H_i = I - tau_i * v_i @ v_it, and their
+        # product H_start @ ... @ H_end-1 = I - Y @ T @ Yt, where Y stores the vectors v_i
+        # (which are zero above row i) and T is upper triangular
+        Y = torch.zeros_like(R)[start:, start:end]
+        T = torch.zeros_like(R)[: end - start, start:end]
+
+        for i in range(start, end):
+            k = i - start
+
+            # Init 1st vector of the canonical base in the same worker as t
+            e = torch.zeros_like(t)[i:, 0].view(-1, 1)
+            e[0, 0] += 1
+
+            # Current vector in R to perform reflection
+            x = R[i:, i].view(-1, 1)
+
+            # Compute norm in MPC if it's an AST
+            x_norm = (
+                _norm_mpc(x, norm_factor) if t_type == "ast" else torch.sqrt(x.t() @ x).squeeze()
+            )
+
+            # Compute Householder vector
+            v = x - x_norm * e
+            denominator = x.t() @ x - x_norm * x[0, 0]
+            # Need the line below to perform inverse of a number in MPC
+            tau = (0 * denominator + 1) / denominator
+
+            # Apply the reflection to the columns of the panel only
+            R[i:, i:end] = R[i:, i:end] - (v * tau) @ (v.t() @ R[i:, i:end])
+
+            # Accumulate the reflection in Y and T
+            Y[k:, k : k + 1] = v
+            if k > 0:
+                T[:k, k : k + 1] = (
+                    T[:k, k : k + 1] - (T[:k, :k] @ (Y[:, :k].t() @ Y[:, k : k + 1])) * tau
                 )
-            left_cat = torch.cat((I[:i, :i], down_zeros), dim=0)
-            right_cat = torch.cat((up_zeros, H), dim=0)
-            H = torch.cat((left_cat, right_cat), dim=1)
+            T[k : k + 1, k : k + 1] = T[k : k + 1, k : k + 1] + tau
 
-        # Update R
-        R = H @ R
+        # Apply H_end-1 @ ... @ H_start = I - Y @ Tt @ Yt to the rest of R and to Q_transpose
+        if end < n_cols:
+            R[start:, end:] = R[start:, end:] - Y @ (T.t() @ (Y.t() @ R[start:, end:]))
         if not mode == "r":
-            # Update Q_transpose
-            Q_t = H @ Q_t
+            Q_t[start:, :] = Q_t[start:, :] - Y @ (T.t() @ (Y.t() @ Q_t[start:, :]))
 
     if mode == "reduced":
         R = R[:n_cols, :]
@@ -0,0 +1,156 @@
+"""Polynomial approximations of non-linear functions for fixed precision tensors.
+
+In MPC, the cost of evaluating a function is mostly the number of multiplications
+between private values, each of which needs a communication round, while additions
+and multiplications by public coefficients are local. The polynomials are thus
+evaluated with the Paterson-Stockmeyer scheme, which needs about 2 * sqrt(degree)
+private multiplications instead of degree for Horner's rule.
+
+Each approximated function has presets trading accuracy for rounds: "fast",
+"balanced" (the default, see DEFAULT_PRESETS) and "accurate".
+"""
+import math
+from functools import lru_cache
+
+import numpy as np
+import torch
+
+PRESETS = {
+    # exp(x) = p(x / 2 ** iterations) ** (2 ** iterations), where p is the Taylor
+    # polynomial of the given degree, which is accurate for |x| / 2 ** iterations <= 1.
+    # "limit" is the limit approximation (1 + x / 2 ** 8) ** (2 ** 8), which is less
+    # accurate but stays bounded for all inputs down to -2 ** 9.
+    "exp": {
+        "limit": {"iterations": 8, "degree": 1},
+        "fast": {"iterations": 2, "degree": 4},
+        "balanced": {"iterations": 3, "degree": 5},
+        "accurate": {"iterations": 3, "degree": 7},
+    },
+    # Householder iterations, each using the exp preset of the same name. order is the
+    # highest power of the residual in the update.
+    "log": {
+        "fast": {"iterations": 2, "order": 3},
+        "balanced": {"iterations": 3, "order": 2},
+        "accurate": {"iterations": 4, "order": 1},
+    },
+    # Chebyshev interpolation of degree over [-interval, interval], saturated outside
+    "sigmoid": {
+        "fast": {"degree": 7, "interval": 6},
+        "balanced": {"degree": 11, "interval": 6},
+        "accurate": {"degree": 13, "interval": 6},
+    },
+    # Newton-Schulz iterations starting from I / scale
+    "inverse": {
+        "fast": {"iterations": 6, "scale": 10},
+        "balanced": {"iterations": 8, "scale": 10},
+        "accurate": {"iterations": 12, "scale": 10},
+    },
+}
+
+# The preset used when none is given, "balanced" for the functions not listed
+DEFAULT_PRESETS = {"exp": "limit"}
+
+
+def get_parameters(function: str, preset: str = None, **parameters) -> dict:
+    """Returns the parameters of a preset of an approximated function.
+
+    Args:
+        function: the name of the function, a key of PRESETS.
+        preset: the name of the preset, defaults to the one of DEFAULT_PRESETS.
+        **parameters: parameters overriding those of the preset, ignored when None.
+
+    Returns:
+        dict: the parameters of the approximation.
+    """
+    preset = preset or DEFAULT_PRESETS.get(function, "balanced")
+    if preset not in PRESETS[function]:
+        raise ValueError(
+            f"Unknown preset {preset} for {function}, choose one of {list(PRESETS[function])}"
+        )
+
+    result = dict(PRESETS[function][preset])
+    result.update({key: value for key, value in parameters.items() if value is not None})
+    return result
+
+
+def exp_coefficients(degree: int) -> list:
+    """Returns the coefficients of the Taylor polynomial of exp, by increasing degree."""
+    return [1 / math.factorial(i) for i in range(degree + 1)]
+
+
+@lru_cache()
+def sigmoid_coefficients(degree: int, interval: float) -> tuple:
+    """Returns the coefficients of the Chebyshev interpolation of sigmoid(x) - 1/2 over
+    [-interval, interval], as a polynomial of u = x / interval.
+
+    sigmoid(x) - 1/2 is odd, so only the coefficients of odd degrees are kept, and they
+    are returned such that sigmoid(x) ~ 1/2 + u * q(u ** 2), with q the polynomial of
+    the coefficients returned, by increasing degree.
+
+    Args:
+        degree: the (odd) degree of the polynomial.
+        interval: the half width of the interpolation interval.
+    """
+    chebyshev = np.polynomial.chebyshev.chebinterpolate(
+        lambda u: 1 / (1 + np.exp(-u * interval)) - 0.5, degree
+    )
+    chebyshev[::2] = 0
+    coefficients = np.polynomial.chebyshev.cheb2poly(chebyshev)
+    return tuple(coefficients[1::2].tolist())
+
+
+def _nr_private_muls(degree: int, k: int) -> int:
+    """Number of private multiplications of evaluate_polynomial with k powers of x."""
+    nr_blocks = math.ceil((degree + 1) / k)
+    # A last block reduced to a constant is multiplied publicly
+    last_block_is_constant = nr_blocks > 1 and (degree + 1) - (nr_blocks - 1) * k == 1
+    return (k - 1) + (nr_blocks - 1) - int(last_block_is_constant)
+
+
+def evaluate_polynomial(x, coefficients):
+    """Evaluates a polynomial with public coefficients on a fixed precision tensor
+    with the Paterson-Stockmeyer scheme.
+
+    The powers x, x^2, ..., x^k are computed, the polynomial is split into blocks of k
+    coefficients which are evaluated with public multiplications only, and the blocks
+    are combined with Horner's rule in x^k. k is chosen to minimize the number of
+    private multiplications.
+
+    Args:
+        x: a FixedPrecisionTensor.
+        coefficients: the coefficients of the polynomial, by increasing degree.
+
+    Returns:
+        the FixedPrecisionTensor of the values of the polynomial.
+    """
+    coefficients = [float(c) for c in coefficients]
+    degree = len(coefficients) - 1
+    k = min(range(1, max(degree, 1) + 1), key=lambda k: _nr_private_muls(degree, k))
+
+    powers = [None, x]
+    for i in range(2, k + 1):
+        powers.append(powers[i // 2] * powers[i - i // 2])
+
+    weights = torch.tensor(coefficients).fix_precision(**x.get_class_attributes()).child
+
+    def evaluate_block(start):
+        """Evaluates the block of coefficients starting at start, returning a float if
+        it is a constant"""
+        result = coefficients[start]
+        for i in range(1, min(k, degree + 1 - start)):
+            if coefficients[start + i] != 0:
+                result = powers[i] * weights[start + i] + result
+        return result
+
+    starts = list(range(0, degree + 1, k))
+    result = evaluate_block(starts[-1])
+    for start in reversed(starts[:-1]):
+        if isinstance(result, float):
+            result = powers[k] * weights[start + k]
+        else:
+            result = result * powers[k]
+        result = result + evaluate_block(start)
+
+    if isinstance(result, float):
+        result = x * 0 + result
+    return result
@@ -1,7 +1,8 @@
-import torch
-import math
-import numpy as np
+import functools
 import itertools
+import math
+
+import torch
 
 import syft
 from syft.frameworks.torch.tensors.interpreters.precision import FixedPrecisionTensor
@@ -22,6 +23,10 @@ class CRTPrecisionTensor(AbstractTensor):
     exactly one x in Zq with q = f_0 * ... * f_n satisfies this system. This x is the real value represented by the tensor.
     This tensor makes it possible to represent big numbers and to avoid overflows while manipulating them.
     It also makes additions, subtractions, and multiplications of huge numbers quite efficient.
+
+    The residues are stacked in a single child tensor of shape [n_moduli, *shape], the residues
+    modulo moduli[i] being child[i], so that operations are applied to all the residues at once,
+    the moduli being broadcast along the first dimension.
     """
 
     def __init__(
@@ -29,26 +34,31 @@ class CRTPrecisionTensor(AbstractTensor):
         residues: dict = None,
         base=None,
         precision_fractional=None,
-        reconstruction_coeffs=None,
+        moduli: tuple = None,
         owner=None,
         id=None,
         tags: set = None,
         description: str = None,
     ):
+        """Initializes a CRTPrecisionTensor.
+
+        Args:
+            residues: optional dictionary where keys are moduli and values are the residues
+                under the form of FixedPrecisionTensor, which are stacked in the child.
+            base: the base of the fixed precision encoding.
+            precision_fractional: the number of fractional digits of the encoding.
+            moduli: the pairwise coprime moduli of the representation, if residues is
+                not given.
+        """
         super().__init__(owner=owner, id=id, tags=tags, description=description)
 
-        # Check that all the moduli are pairwise coprime
-        if residues is not None:
-            for pair in itertools.combinations(residues.keys(), r=2):
-                assert (
-                    math.gcd(pair[0], pair[1]) == 1
-                ), f"{pair[0]} and {pair[1]} are not coprime, you cannot build a CRTPrecisionTensor with these as moduli"
+        self.base = base
+        self.precision_fractional = precision_fractional
+        self.moduli = tuple(moduli) if moduli is not None else None
 
         # Check that all the residues have the same precision and
         # check that all the shapes are the same
         # while filling tensor
-        self.base = base
-        self.precision_fractional = precision_fractional
         if residues is not None:
             assert all(
                 [isinstance(r.child, FixedPrecisionTensor) for r in residues.values()]
@@ -58,8 +68,6 @@ class CRTPrecisionTensor(AbstractTensor):
             base_residue = r.child.base
             prec_frac = r.child.precision_fractional
             res_shape = r.shape
-            self.child = {}
-            prod_moduli = 1
             for f, r in residues.items():
                 assert (
                     r.child.base == base_residue
@@ -69,14 +77,11 @@ class CRTPrecisionTensor(AbstractTensor):
                 ), "All residue tensors of CRTPrecisionTensor must have the same precision_fractional"
                 assert (
                     f == r.child.field
-                ), "All residue tensors of CRTPrecisionTensor must have the same precision_fractional"
+                ), "All residue tensors of CRTPrecisionTensor must have their modulus as field"
                 assert (
                     r.shape == res_shape
                 ), "All residue tensors of CRTPrecisionTensor must have the same shape"
 
-                self.child[f] = r
-                prod_moduli *= f
-
             if base is not None:
                 assert (
                     base_residue == base
@@ -85,13 +90,44 @@ class CRTPrecisionTensor(AbstractTensor):
                 assert (
                     prec_frac == precision_fractional
                 ), "If a precision_fractional is specified, it should be the same as the residue tensors' precision_fractional"
+            if moduli is not None:
+                assert self.moduli == tuple(
+                    residues.keys()
+                ), "If moduli are specified, they should be the keys of the residues"
+
             self.base = base_residue
             self.precision_fractional = prec_frac
-            self.field = prod_moduli
+            self.moduli = tuple(residues.keys())
+            stacked = torch.stack([r.child.child for r in residues.values()])
+            self.child = stacked % self._moduli_view(stacked.dim())
+
+        if self.base is None:
+            self.base = 10
+        if self.precision_fractional is None:
+            self.precision_fractional = 3
+
+        # Check that all the moduli are pairwise coprime, this is only done once per moduli
+        if self.moduli is not None:
+            _reconstruction_constants(self.moduli)
+
+    @property
+    def field(self) -> int:
+        return _reconstruction_constants(self.moduli)[0]
+
+    def _moduli_view(self, dim: int) -> torch.Tensor:
+        """Returns the moduli as a tensor of dim dimensions which broadcasts over the residues."""
+        moduli = _reconstruction_constants(self.moduli)[1]
+        return moduli.view(-1, *([1] * (dim - 1)))
+
+    def fix_precision(self):
+        """This method encodes the .child float tensor as its residues modulo each of the moduli"""
+        upscaled = (self.child * self.base ** self.precision_fractional).long()
+        self.child = upscaled.unsqueeze(0) % self._moduli_view(upscaled.dim() + 1)
+        return self
 
     def float_precision(self):
-        res = self.reconstruct() / self.base ** self.precision_fractional
-        return res
+        res = self._signed_values() / self.base ** self.precision_fractional
+        return res.float()
 
     @property
     def grad(self):
@@ -104,7 +140,9 @@ class CRTPrecisionTensor(AbstractTensor):
     def __str__(self):
         type_name = type(self).__name__
         out = f"[" f"{type_name}]"
-        for mod, res in self.child.items():
+        if self._is_shared(self.child):
+            return out + f"\n\t -> {self.moduli}: {self.child}"
+        for mod, res in zip(self.moduli, self.child):
             out += f"\n\t -> {mod}: {res}"
         return out
 
@@ -113,95 +151,104 @@ class CRTPrecisionTensor(AbstractTensor):
 
     @property
     def shape(self) -> torch.Size:
-        return next(iter(self.child.values())).shape
+        return torch.Size(self.child.shape[1:])
 
-    @overloaded.method
-    def eq(self, self_, other_):
-        assert (
-            self_.keys() == other_.keys()
-        ), "Cannot compare 2 CRT tensors that don't have the same moduli"
+    @staticmethod
+    def _is_shared(residues) -> bool:
+        return isinstance(residues, torch.Tensor) and residues.has_child()
 
-        result = 1
-        for mod in self_.keys():
-            result *= (self_[mod] == other_[mod]).long()
+    def _residues_of(self, other, operation: str):
+        """Returns the stacked residues of other, or other itself if it is a scalar."""
+        if isinstance(other, CRTPrecisionTensor):
+            assert (
+                self.moduli == other.moduli
+            ), f"Cannot {operation} 2 CRT tensors that don't have the same moduli"
+            return other.child
+        return other
+
+    def _with_residues(self, residues) -> "CRTPrecisionTensor":
+        """Builds a CRT tensor with the same moduli and encoding as self on the residues."""
+        return CRTPrecisionTensor(owner=self.owner, **self.get_class_attributes()).on(
+            residues, wrap=False
+        )
 
-        dict_result = {}
-        for mod in self_.keys():
-            # This is a bit ugly, I want the result to be stored in a CRT tensor with same moduli
-            result.child.field = mod
-            dict_result[mod] = result.copy()
+    def _reduce(self, residues):
+        """Brings residues back between 0 and their modulus. Shared residues are only
+        reduced when they are reconstructed, in the field of their shares."""
+        if self._is_shared(residues):
+            return residues
+        return residues % self._moduli_view(residues.dim())
 
-        return dict_result
+    def eq(self, other):
+        other_ = self._residues_of(other, "compare")
+
+        # The values are equal if all their residues are
+        equal = (self.child == other_).all(dim=0).long() * self.base ** self.precision_fractional
+
+        return self._with_residues(self._reduce(equal.unsqueeze(0)))
 
     __eq__ = eq
 
     def __neg__(self):
         return -1 * self
 
-    @overloaded.method
-    def add(self, self_, other):
-
-        result = {}
-
-        if isinstance(other, int):
-            for mod in self_.keys():
-                result[mod] = self_[mod] + other
-
-        else:
-            assert (
-                self_.keys() == other.keys()
-            ), "Cannot add 2 CRT tensors that don't have the same moduli"
+    def add(self, other):
+        other_ = self._residues_of(other, "add")
+        self_ = self.child
 
-            for mod in self_.keys():
-                result[mod] = self_[mod] + other[mod]
+        if isinstance(other_, int):
+            other_ = int(other_ * self.base ** self.precision_fractional)
+        elif self._is_shared(other_) and not self._is_shared(self_):
+            self_, other_ = other_, self_
 
-        return result
+        return self._with_residues(self._reduce(self_ + other_))
 
     __add__ = add
     __radd__ = add
 
-    @overloaded.method
-    def sub(self, self_, other):
-
-        result = {}
-
-        if isinstance(other, int):
-            for mod in self_.keys():
-                result[mod] = self_[mod] - other
-
-        else:
-            assert (
-                self_.keys() == other.keys()
-            ), "Cannot subtract 2 CRT tensors that don't have the same moduli"
+    def sub(self, other):
+        other_ = self._residues_of(other, "subtract")
+        self_ = self.child
 
-            for mod in self_.keys():
-                result[mod] = self_[mod] - other[mod]
+        if isinstance(other_, int):
+            other_ = int(other_ * self.base ** self.precision_fractional)
+        elif self._is_shared(other_) and not self._is_shared(self_):
+            return self._with_residues(self._reduce((other_ - self_) * -1))
 
-        return result
+        return self._with_residues(self._reduce(self_ - other_))
 
     __sub__ = sub
 
     def __rsub__(self, other):
         return (-self).sub(-other)
 
-    @overloaded.method
-    def mul(self, self_, other):
+    def mul(self, other):
+        other_ = self._residues_of(other, "multiply")
+        self_ = self.child
 
-        result = {}
+        if isinstance(other_, int):
+            if self._is_shared(self_):
+                return self._with_residues(self_ * other_)
+            return self._with_residues(self._reduce(self_ * other_))
 
-        if isinstance(other, int):
-            for mod in self_.keys():
-                result[mod] = self_[mod] * other
+        if self._is_shared(self_) or self._is_shared(other_):
+            raise NotImplementedError(
+                "Multiplying shared CRTPrecisionTensors is not supported: the truncation needs "
+                "the sign of the residues"
+            )
 
-        else:
-            assert (
-                self_.keys() == other.keys()
-            ), "Cannot multiply 2 CRT tensors that don't have the same moduli"
+        # As in FixedPrecisionTensor, the absolute values are multiplied and truncated,
+        # the residues above half their modulus representing negative values
+        moduli = self._moduli_view(self_.dim())
+        sgn_self = self_ < moduli // 2
+        sgn_other = other_ < moduli // 2
+        abs_self = torch.where(sgn_self, self_, moduli - self_)
+        abs_other = torch.where(sgn_other, other_, moduli - other_)
 
-            for mod in self_.keys():
-                result[mod] = self_[mod] * other[mod]
+        response = abs_self * abs_other // self.base ** self.precision_fractional % moduli
+        response = torch.where(sgn_self == sgn_other, response, moduli - response)
 
-        return result
+        return self._with_residues(response % moduli)
 
     __mul__ = mul
     __rmul__ = mul
@@ -212,62 +259,47 @@ class CRTPrecisionTensor(AbstractTensor):
     __truediv__ = div
 
     def reconstruct(self):
-        """ Build the tensor in Zq with q = prod(self.child.keys())
-        satisfying the modular system represented by the tensor.
-        The algorithm consists in:
-        1) Compute N = prod(self.child.keys())
-        2) yi = N / ni where the ni's are moduli in the system
-        3) zi = yi^(-1) mod ni (we know zi exists because all the original moduli are pairwise coprime)
-        4) The result is x = sum(ai * yi * zi) where ai is the residue modulo ni in the system
-
-        We can see that this boils down to a linear combination of ai's with coefficients yi * zi.
-        These coefficients depend only on the moduli used to represent the tensor so we don't need
-        to compute them several times for the same tensor. We can also reuse them for a tensor produced
-        by operations on self because 1) the operations can only be done between tensors with the same moduli
-        and 2) the output tensor will have the same moduli.
-        This is why we store them after having computed them once.
+        """ Build the tensor in Zq with q = prod(self.moduli)
+        satisfying the modular system represented by the tensor, the values above q / 2
+        being mapped to negative values.
+
+        The values are computed from the residues with Garner's algorithm, which writes
+        them in the mixed radix system of the moduli:
+            x = v_0 + v_1 * f_0 + v_2 * f_0 * f_1 + ... + v_n * f_0 * ... * f_n-1
+        with 0 <= v_i < f_i. Each digit v_i is computed from the residues with small integer
+        operations, using the inverses of the moduli modulo each other, so all the residues
+        are processed at once without computing with large integers. The inverses only depend
+        on the moduli, so they are computed once per set of moduli and cached.
         """
-        res = 0
-        N = 1
-
-        def modular_inverse(a, b):
-            """ Computes the modular inverse x = a^(-1) mod b
-            with Euclid's extended algorithm.
-            The coefficient are computed and stored in a list in ascending order of moduli.
-            The list is then turned to a tuple to be hashable and passed via the get_class_attributes method.
-            """
-            b0 = b
-            x0, x1 = 0, 1
-            if b == 1:
-                return 1
-            while a > 1:
-                q = a // b
-                a, b = b, a % b
-                x0, x1 = x1 - q * x0, x0
-            if x1 < 0:
-                x1 += b0
-            return x1
-
-        N = 1
-        for mod in self.child.keys():
-            N *= mod
-
-        coeffs = []
-        for mod, ai in sorted(self.child.items()):
-            yi = N // mod
-            zi = modular_inverse(yi, mod)
-            # We need numpy objects to reconstruct the original tensor because large values are used in the process
-            res += ai.child.child.numpy() * yi * zi
-
-        res %= N
-
-        gate = res > (N / 2)
-        neg_nums = (res - N) * gate
-        pos_nums = res * (1 - gate)
-        res = neg_nums + pos_nums
-
-        res = res.astype(np.float32)
-        return torch.from_numpy(res)
+        return self._signed_values().float()
+
+    def _signed_values(self) -> torch.Tensor:
+        """Returns the values represented by the residues, as a double tensor."""
+        _, moduli, inverses, half_digits = _reconstruction_constants(self.moduli)
+        residues = self.child
+        dim = residues.dim()
+        moduli = moduli.view(-1, *([1] * (dim - 1)))
+
+        digits = residues.clone()
+        for i in range(len(self.moduli) - 1):
+            inverse = inverses[i, i + 1 :].view(-1, *([1] * (dim - 1)))
+            digits[i + 1 :] = (digits[i + 1 :] - digits[i]) * inverse % moduli[i + 1 :]
+
+        # x is negative if its digits are above the ones of q // 2, in lexicographic order
+        greater = torch.zeros(residues.shape[1:], dtype=torch.bool)
+        equal = torch.ones(residues.shape[1:], dtype=torch.bool)
+        for digit, half_digit in reversed(list(zip(digits, half_digits))):
+            greater = greater | (equal & (digit > half_digit))
+            equal = equal & (digit == half_digit)
+
+        # The digits of q - 1 - x are f_i - 1 - v_i, without any borrow
+        digits = torch.where(greater, moduli - 1 - digits, digits).double()
+
+        values = digits[-1]
+        for i in reversed(range(len(self.moduli) - 1)):
+            values = values * self.moduli[i] + digits[i]
+
+        return torch.where(greater, -(values + 1), values)
 
     @staticmethod
     @overloaded.module
@@ -294,22 +326,19 @@ class CRTPrecisionTensor(AbstractTensor):
 
     def share(self, *owners, field=None, crypto_provider=None):
         """ Share the tensor between several workers.
-        This gives an AdditiveSharingTensor wrapped around the original CRT tensor
+        This gives an AdditiveSharingTensor wrapped around the stacked residues. The shares
+        live in the default field of the AdditiveSharingTensor, which is large enough for the
+        residues to be added without overflow, and are reduced modulo the moduli in get.
         """
         assert field is None or field == self.field, "field is chosen when fixing precision"
-        for mod, res in self.child.items():
-            ast_mod = res.share(*owners, field=mod, crypto_provider=None)
-            self.child[mod] = ast_mod
-
-        return self
+        shared = self.child.share(*owners, crypto_provider=crypto_provider)
+        return self._with_residues(shared)
 
     def get(self):
         """ Get back a tensor shared between several workers.
         """
-        self_ = self.child
-        for mod, res in self_.items():
-            res.child = res.child.get().child
-        return self.wrap()
+        residues = self.child.get()
+        return self._with_residues(residues % self._moduli_view(residues.dim())).wrap()
 
     @staticmethod
     def simplify(worker: AbstractWorker, tensor: "CRTPrecisionTensor") -> tuple:
@@ -325,7 +354,13 @@ class CRTPrecisionTensor(AbstractTensor):
         if hasattr(tensor, "child"):
             chain = syft.serde.msgpack.serde._simplify(worker, tensor.child)
 
-        return (tensor.id, tensor.base, tensor.precision_fractional, chain)
+        return (
+            tensor.id,
+            tensor.base,
+            tensor.precision_fractional,
+            syft.serde.msgpack.serde._simplify(worker, tensor.moduli),
+            chain,
+        )
 
     @staticmethod
     def detail(worker: AbstractWorker, tensor_tuple: tuple) -> "CRTPrecisionTensor":
@@ -337,11 +372,12 @@ class CRTPrecisionTensor(AbstractTensor):
         Returns:
             CRTPrecisionTensor: a CRTPrecisionTensor
         """
-        tensor_id, tensor_base, tensor_precision_fractional, chain = tensor_tuple
+        tensor_id, tensor_base, tensor_precision_fractional, moduli, chain = tensor_tuple
 
         tensor = syft.CRTPrecisionTensor(
             base=tensor_base,
             precision_fractional=tensor_precision_fractional,
+            moduli=syft.serde.msgpack.serde._detail(worker, moduli),
             owner=worker,
             id=tensor_id,
         )
@@ -353,7 +389,62 @@ class CRTPrecisionTensor(AbstractTensor):
         return tensor
 
     def get_class_attributes(self):
-        return {"base": self.base, "precision_fractional": self.precision_fractional}
+        return {
+            "base": self.base,
+            "precision_fractional": self.precision_fractional,
+            "moduli": self.moduli,
+        }
+
+
+def _modular_inverse(a, b):
+    """ Computes the modular inverse x = a^(-1) mod b
+    with Euclid's extended algorithm.
+    """
+    b0 = b
+    x0, x1 = 0, 1
+    if b == 1:
+        return 1
+    while a > 1:
+        q = a // b
+        a, b = b, a % b
+        x0, x1 = x1 - q * x0, x0
+    if x1 < 0:
+        x1 += b0
+    return x1
+
+
+@functools.lru_cache(maxsize=None)
+def _reconstruction_constants(moduli: tuple) -> tuple:
+    """Checks that the moduli are pairwise coprime and computes the constants used by
+    CRTPrecisionTensor.reconstruct. They only depend on the moduli, so they are cached.
+
+    Args:
+        moduli: the moduli of a CRTPrecisionTensor.
+    Returns:
+        tuple: the product q of the moduli, the moduli as a LongTensor, the matrix of the
+            inverses of moduli[i] modulo moduli[j] at [i, j] for i < j, and the digits of
+            q // 2 in the mixed radix system of the moduli.
+    """
+    for pair in itertools.combinations(moduli, r=2):
+        assert (
+            math.gcd(pair[0], pair[1]) == 1
+        ), f"{pair[0]} and {pair[1]} are not coprime, you cannot build a CRTPrecisionTensor with these as moduli"
+
+    prod_moduli = 1
+    for mod in moduli:
+        prod_moduli *= mod
+
+    inverses = torch.ones(len(moduli), len(moduli), dtype=torch.long)
+    for i, j in itertools.combinations(range(len(moduli)), r=2):
+        inverses[i, j] = _modular_inverse(moduli[i] % moduli[j], moduli[j])
+
+    half_digits = []
+    rest = prod_moduli // 2
+    for mod in moduli:
+        half_digits.append(rest % mod)
+        rest //= mod
+
+    return prod_moduli, torch.tensor(moduli, dtype=torch.long), inverses, tuple(half_digits)
 
 
 _moduli_for_fields = {
@@ -368,7 +459,6 @@ _sizes_for_fields = {
     "int100": 6_616_464_272_061_971_915_798_970_247_351,
     "int128": 403_323_543_826_671_667_708_586_382_524_878_143_061,
 }
-# Should we also precompute reconstruction coefficients and put them here?
 
 ### Register the tensor with hook_args.py ###
 default_register_tensor(CRTPrecisionTensor)
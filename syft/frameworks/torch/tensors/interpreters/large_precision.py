@@ -25,7 +25,9 @@ class LargePrecisionTensor(AbstractTensor):
     The smaller values are of type `internal_type`. The split of the large number into the smaller values
     is in the range ±2**(size - 1).
 
-    By default operations are done with NumPy. This implies unpacking the representation and packing it again.
+    When the field is a power of 2, additions, subtractions and multiplications are done on the smaller values
+    directly, with carries, in torch. Other operations, and all operations for other fields, are done with NumPy,
+    which implies unpacking the representation and packing it again.
 
     Sharing a LPT requires using a arithmetic field where the shares will live. This field cannot bigger than 2 ** 62
     or the process would trigger a RuntimeError: Overflow when unpacking long. Note that this field will be applied to
@@ -70,21 +72,71 @@ class LargePrecisionTensor(AbstractTensor):
 
     def _create_internal_representation(self):
         """Decompose a tensor into an array of numbers that represent such tensor with the required precision"""
-        self_scaled = self.child.numpy() * self.base ** self.precision_fractional
-
-        # floor is applied otherwise, long float is not accurate
-        self_scaled = np.vectorize(math.floor)(self_scaled)
-        # https://github.com/numpy/numpy/issues/6464
-        self_scaled = np.remainder(self_scaled, np.array(self.field), casting="unsafe")
-
-        # self_scaled can be an array of floats. As multiplying an array of int with an int
-        # still gives an array of int, I think it should be because self.child is a float tensor at this point.
-        # Right now, it does not cause any problem, LargePrecisionTensor._split_numbers() returns an array of int.
-        result = LargePrecisionTensor._split_numbers(
-            self_scaled, self.internal_precision, self.internal_type
+        mantissas, exponents = LargePrecisionTensor._scale_to_mantissas(
+            self.child.numpy(), self.base ** self.precision_fractional
         )
+
+        field_bits = _power_of_two_bits(self.field)
+        if field_bits is not None:
+            result = LargePrecisionTensor._split_scaled_numbers(
+                mantissas, exponents, field_bits, self.internal_precision
+            )
+        else:
+            # The field is not a power of 2, so the numbers are reduced as Python ints
+            self_scaled = np.left_shift(mantissas.astype(object), exponents.astype(object))
+            self_scaled = np.remainder(self_scaled, self.field)
+            result = LargePrecisionTensor._split_numbers(
+                self_scaled, self.internal_precision, self.internal_type
+            )
         return torch.tensor(result, dtype=self.internal_type)
 
+    @staticmethod
+    def _scale_to_mantissas(values, scale):
+        """Scales an array of floats and floors the results, which are returned as
+        mantissas * 2 ** exponents with int64 mantissas and non negative exponents.
+        """
+        scaled = values.astype(np.float64) * float(scale)
+        if not np.all(np.isfinite(scaled)):
+            raise ValueError("LargePrecisionTensor cannot represent infinite or nan values")
+
+        fractions, exponents = np.frexp(scaled)
+        # float64 have 53 bits of mantissa, so these are integers
+        mantissas = np.ldexp(fractions, 53).astype(np.int64)
+        exponents = exponents.astype(np.int64) - 53
+        # Shifting right floors the numbers which have a fractional part
+        mantissas = np.right_shift(mantissas, np.clip(-exponents, 0, 63))
+        return mantissas, np.maximum(exponents, 0)
+
+    @staticmethod
+    def _split_scaled_numbers(mantissas, exponents, field_bits, bits) -> np.array:
+        """Splits the numbers mantissas * 2 ** exponents, modulo 2 ** field_bits, in parts
+        of the given bits, using shifts and masks on the int64 mantissas.
+
+        Returns:
+            array: a tensor with one more dimension holding the parts of the numbers,
+                most significant first.
+        """
+        nr_parts = -(-field_bits // bits)
+        mask = 2 ** bits - 1
+        number_parts = []
+        for i in range(nr_parts):
+            # Bits i * bits and above of mantissas * 2 ** exponents, in two's complement
+            start = i * bits - exponents
+            part = np.where(
+                start >= 0,
+                np.right_shift(mantissas, np.clip(start, 0, 63)),
+                np.left_shift(mantissas, np.clip(-start, 0, 63)),
+            )
+            number_parts.append(part & mask)
+
+        # Reduce modulo the field by dropping the bits above field_bits
+        number_parts[-1] &= 2 ** (field_bits - (nr_parts - 1) * bits) - 1
+        # Only keep the parts needed by the largest number
+        while len(number_parts) > 1 and not np.any(number_parts[-1]):
+            number_parts.pop()
+
+        return np.stack(number_parts[::-1], axis=-1)
+
     @staticmethod
     def _expand_item(a_number, max_length):
         return [0] * (max_length - len(a_number)) + a_number
@@ -108,9 +160,9 @@ class LargePrecisionTensor(AbstractTensor):
             "precision_fractional": self.precision_fractional,
         }
 
-    @overloaded.method
-    def add(self, self_, other):
-        return self_ + other
+    def add(self, other):
+        result = self._native_operation(other, _add_parts)
+        return result if result is not None else self._add_large_ints(other)
 
     __add__ = add
 
@@ -123,9 +175,9 @@ class LargePrecisionTensor(AbstractTensor):
 
     add_ = __iadd__
 
-    @overloaded.method
-    def sub(self, self_, other):
-        return self_ - other
+    def sub(self, other):
+        result = self._native_operation(other, _sub_parts)
+        return result if result is not None else self._sub_large_ints(other)
 
     __sub__ = sub
 
@@ -138,8 +190,31 @@ class LargePrecisionTensor(AbstractTensor):
 
     sub_ = __isub__
 
+    def mul(self, other):
+        if isinstance(other, int):
+            result = self._native_operation(other, _mul_parts)
+        else:
+            result = self._native_operation(other, self._mul_and_truncate_parts)
+        return result if result is not None else self._mul_large_ints(other)
+
+    __mul__ = mul
+
+    def __imul__(self, other):
+        self.child = self.mul(other).child
+        return self
+
+    mul_ = __imul__
+
+    @overloaded.method
+    def _add_large_ints(self, self_, other):
+        return self_ + other
+
+    @overloaded.method
+    def _sub_large_ints(self, self_, other):
+        return self_ - other
+
     @overloaded.method
-    def mul(self, self_, other):
+    def _mul_large_ints(self, self_, other):
         if isinstance(other, int):
             return self_ * other
         elif isinstance(self_, np.ndarray) and isinstance(other, np.ndarray):
@@ -156,13 +231,64 @@ class LargePrecisionTensor(AbstractTensor):
         else:
             raise NotImplementedError
 
-    __mul__ = mul
+    def _native_operation(self, other, operation):
+        """Applies an operation to the parts of the numbers without unpacking them.
 
-    def __imul__(self, other):
-        self.child = self.mul(other).child
-        return self
+        This is done when the field is a power of 2 and the parts are held locally, the
+        parts being repacked in a size for which the operation can't overflow int64.
 
-    mul_ = __imul__
+        Args:
+            other: a LargePrecisionTensor with the same attributes, or an int.
+            operation: a function taking the int64 parts of self and other, least
+                significant first along the first axis, the number of bits of the field
+                and the number of bits of each part.
+
+        Returns:
+            The resulting LargePrecisionTensor, or None if the operation must be done on
+            large ints.
+        """
+        field_bits = _power_of_two_bits(self.field)
+        if field_bits is None or not isinstance(self.child, torch.Tensor):
+            return None
+
+        work_bits = min(self.internal_precision, _MAX_WORK_BITS)
+        self_parts = _to_parts(self.child, field_bits, self.internal_precision, work_bits)
+        if isinstance(other, int):
+            other_parts = _int_to_parts(other % self.field, field_bits, work_bits)
+        elif (
+            isinstance(other, LargePrecisionTensor)
+            and isinstance(other.child, torch.Tensor)
+            and other.get_class_attributes() == self.get_class_attributes()
+        ):
+            other_parts = _to_parts(other.child, field_bits, other.internal_precision, work_bits)
+        else:
+            return None
+
+        self_parts, other_parts = _broadcast_parts(self_parts, other_parts)
+        result = operation(self_parts, other_parts, field_bits, work_bits)
+        result = _from_parts(result, field_bits, work_bits, self.internal_precision)
+        return LargePrecisionTensor(**self.get_class_attributes()).on(
+            result.to(self.internal_type), wrap=False
+        )
+
+    def _mul_and_truncate_parts(self, self_parts, other_parts, field_bits, bits):
+        """Multiplies fixed precision numbers and divides the product by the scale, rounding
+        towards minus infinity."""
+        product = _mul_parts(self_parts, other_parts, field_bits, bits)
+
+        # Divide the absolute value of the product, as the numbers above half the field
+        # are negative
+        sign_part, sign_bit = divmod(field_bits - 1, bits)
+        negative = (product[sign_part] >> sign_bit) & 1 == 1
+        product = torch.where(negative, _sub_parts(0, product, field_bits, bits), product)
+        quotient, remainder_is_zero = _divide_parts(
+            product, self.base ** self.precision_fractional, field_bits, bits
+        )
+
+        # floor(-x / d) = -ceil(x / d)
+        quotient[0] += (negative & ~remainder_is_zero).long()
+        quotient = _reduce(quotient, field_bits, bits)
+        return torch.where(negative, _sub_parts(0, quotient, field_bits, bits), quotient)
 
     @overloaded.method
     def mod(self, self_, other):
@@ -193,6 +319,16 @@ class LargePrecisionTensor(AbstractTensor):
         Returns:
             tensor: the original tensor.
         """
+        field_bits = _power_of_two_bits(self.field)
+        if field_bits is not None:
+            result = LargePrecisionTensor._parts_to_floats(
+                self.child.numpy(),
+                field_bits,
+                self.internal_precision,
+                self.base ** self.precision_fractional,
+            )
+            return torch.from_numpy(result.astype(np.float32))
+
         result = self._internal_representation_to_large_ints()
 
         gate = 1 * (result > self.field / 2)
@@ -219,6 +355,58 @@ class LargePrecisionTensor(AbstractTensor):
         result = LargePrecisionTensor._split_numbers(ndarray, internal_precision, internal_type)
         return torch.tensor(result, dtype=internal_type)
 
+    @staticmethod
+    def _parts_to_floats(number_parts, field_bits, bits, scale) -> np.array:
+        """Restores the floats represented by parts of numbers modulo 2 ** field_bits,
+        the numbers above 2 ** (field_bits - 1) being negative, and divided by scale.
+
+        The parts may be out of the range of the given bits, like after adding shares:
+        the carries are propagated with int64 operations over the parts of all the
+        numbers at once.
+
+        Args:
+            number_parts (ndarray): the parts of the numbers, most significant first.
+            field_bits (int): the bits of the field.
+            bits (int): the bits used in the split.
+            scale (int): the number the floats were multiplied with.
+
+        Returns:
+            array: the float64 array of the numbers restored.
+        """
+        # Least significant part first, along the first axis so that each part is
+        # contiguous, with room for the carries up to the field
+        nr_parts = max(field_bits // bits + 1, number_parts.shape[-1])
+        parts = np.zeros((nr_parts,) + number_parts.shape[:-1], dtype=np.int64)
+        parts[: number_parts.shape[-1]] = np.moveaxis(number_parts[..., ::-1], -1, 0)
+        parts = LargePrecisionTensor._reduce_parts(parts, field_bits, bits)
+
+        sign_part, sign_bit = divmod(field_bits - 1, bits)
+        negative = (parts[sign_part] >> sign_bit) & 1 == 1
+        # Negative numbers are restored from their opposite, field - number
+        np.negative(parts, out=parts, where=negative)
+        parts = LargePrecisionTensor._reduce_parts(parts, field_bits, bits)
+
+        result = np.zeros(parts.shape[1:])
+        for i in range(nr_parts):
+            weight = _ratio(2 ** (bits * i), scale)
+            if weight != 0 and np.any(parts[i]):
+                result += parts[i] * weight
+        return np.where(negative, -result, result)
+
+    @staticmethod
+    def _reduce_parts(parts, field_bits, bits) -> np.array:
+        """Propagates the carries of int64 parts of numbers, stacked least significant
+        first along the first axis, and reduces the numbers modulo 2 ** field_bits."""
+        mask = 2 ** bits - 1
+        for i in range(len(parts) - 1):
+            parts[i + 1] += parts[i] >> bits
+            parts[i] &= mask
+
+        top_part, top_bits = divmod(field_bits, bits)
+        parts[top_part] &= 2 ** top_bits - 1
+        parts[top_part + 1 :] = 0
+        return parts
+
     @staticmethod
     def _split_numbers(numbers, bits, internal_type) -> np.array:
         """Splits a tensor of numbers in numbers of a smaller power.
@@ -231,10 +419,11 @@ class LargePrecisionTensor(AbstractTensor):
             array: a tensor with one more dimension representing the original one.
 
         """
+        numbers = np.asarray(numbers)
         if np.all(numbers == 0):
             # numbers is an array of objects if the values are too large
             # we need to cast it back to an array of integers
-            numbers = numbers.astype(np.int)
+            numbers = numbers.astype(np.int64)
             return np.expand_dims(numbers, -1)
 
         sign_mask = np.where(numbers > 0, 1, -1)
@@ -244,44 +433,24 @@ class LargePrecisionTensor(AbstractTensor):
             ), "LargePrecisionTensors with negative values cannot be represented with uint8"
         numbers = np.where(numbers > 0, numbers, -numbers)
 
-        base = 2 ** bits
-        number_parts = []
-        while np.any(numbers):
-            # number, part = np.divmod(number, base)  # Not sure why this doesn't work
-            part = numbers % base
-            numbers = numbers // base
-            number_parts.append(part * sign_mask)
-
-        res = np.array(number_parts[::-1], dtype=np.int)
-        return res.transpose(*range(1, res.ndim), 0)
+        nr_parts = -(-int(numbers.max()).bit_length() // bits)
+        mask = 2 ** bits - 1
+        number_parts = [
+            ((numbers >> (i * bits)) & mask).astype(np.int64) * sign_mask
+            for i in reversed(range(nr_parts))
+        ]
+        return np.stack(number_parts, axis=-1)
 
     def _internal_representation_to_large_ints(self) -> np.array:
         """Creates an numpy array containing the objective large numbers."""
-        ndarray = self.child.numpy()
-        ndarray = ndarray.reshape(-1, ndarray.shape[-1])
-        result = []
-        for elem in ndarray:
-            result.append(LargePrecisionTensor._restore_large_number(elem, self.internal_precision))
-        return np.array(result).reshape(self.child.shape[:-1])
-
-    @staticmethod
-    def _restore_large_number(number_parts, bits) -> int:
-        """Rebuilds a number from a numpy array.
-
-        Args:
-            number_parts (ndarray): the numpy array of numbers representing the original one.
-            bits (int): the bits used in the split.
-
-        Returns:
-            Number: the large number represented by this tensor
-        """
+        ndarray = self.child.numpy().astype(np.int64).astype(object)
+        base = 2 ** self.internal_precision
 
-        def _restore_recursive(parts, acc, base):
-            if len(parts) == 0:
-                return acc
-            return _restore_recursive(parts[1:], acc * base + parts[0].item(), base)
-
-        return _restore_recursive(number_parts, 0, 2 ** bits)
+        # Horner evaluation along the parts, for all the numbers at once
+        result = np.zeros(ndarray.shape[:-1], dtype=object)
+        for i in range(ndarray.shape[-1]):
+            result = result * base + ndarray[..., i]
+        return np.asarray(result, dtype=object).reshape(self.child.shape[:-1])
 
     @staticmethod
     def _forward_func(tensor):
@@ -313,6 +482,179 @@ class LargePrecisionTensor(AbstractTensor):
         return self
 
 
+def _power_of_two_bits(field: int):
+    """Returns n if field is 2 ** n, and None otherwise."""
+    if field > 1 and field & (field - 1) == 0:
+        return field.bit_length() - 1
+    return None
+
+
+def _ratio(numerator: int, denominator: int) -> float:
+    """Divides two possibly large ints, returning inf if the result is too large for a float."""
+    try:
+        return numerator / denominator
+    except OverflowError:
+        return math.inf
+
+
+# The largest size of the parts of the numbers in the native operations, so that the
+# sums of the products of two parts computed in multiplications stay below 2 ** 63
+_MAX_WORK_BITS = 24
+
+
+def _carry(parts, bits):
+    """Propagates the carries of int64 parts of numbers, stacked least significant first
+    along the first axis, the last part keeping the overflow."""
+    mask = 2 ** bits - 1
+    for i in range(len(parts) - 1):
+        parts[i + 1] += parts[i] >> bits
+        parts[i] &= mask
+    return parts
+
+
+def _reduce(parts, field_bits, bits):
+    """Propagates the carries of parts of numbers and reduces them modulo 2 ** field_bits."""
+    parts = _carry(parts, bits)
+    top_part, top_bits = divmod(field_bits, bits)
+    if top_part < len(parts):
+        parts[top_part] &= 2 ** top_bits - 1
+        parts[top_part + 1 :] = 0
+    else:
+        parts[-1] &= 2 ** bits - 1
+    return parts
+
+
+def _repack(parts, from_bits, to_bits, nr_parts):
+    """Converts normalized parts of numbers of from_bits in nr_parts of to_bits."""
+    if from_bits == to_bits and len(parts) >= nr_parts:
+        return parts[:nr_parts]
+
+    mask = 2 ** to_bits - 1
+    repacked = torch.zeros((nr_parts,) + tuple(parts.shape[1:]), dtype=torch.long)
+    for i in range(nr_parts):
+        start, end = i * to_bits, (i + 1) * to_bits
+        for j in range(start // from_bits, min(-(-end // from_bits), len(parts))):
+            offset = j * from_bits - start
+            if offset >= 0:
+                # Keep the bits which fit before shifting, so that nothing overflows
+                repacked[i] |= (parts[j] & (2 ** (to_bits - offset) - 1)) << offset
+            else:
+                repacked[i] |= parts[j] >> -offset
+        repacked[i] &= mask
+    return repacked
+
+
+def _to_parts(number_parts, field_bits, bits, work_bits):
+    """Converts the parts of bits of a LargePrecisionTensor, most significant first along
+    the last axis, to normalized int64 parts of work_bits, least significant first along
+    the first axis."""
+    dims = [number_parts.dim() - 1] + list(range(number_parts.dim() - 1))
+    number_parts = number_parts.long().flip(-1).permute(*dims)
+
+    # Room for the carries of parts which are out of range, like after adding shares
+    nr_parts = max(field_bits // bits + 1, len(number_parts))
+    parts = torch.zeros((nr_parts,) + tuple(number_parts.shape[1:]), dtype=torch.long)
+    parts[: len(number_parts)] = number_parts
+    parts = _reduce(parts, field_bits, bits)
+    return _repack(parts, bits, work_bits, -(-field_bits // work_bits))
+
+
+def _from_parts(parts, field_bits, work_bits, bits):
+    """Inverse of _to_parts, for normalized parts."""
+    parts = _repack(parts, work_bits, bits, -(-field_bits // bits))
+    dims = list(range(1, parts.dim())) + [0]
+    return parts.permute(*dims).flip(-1)
+
+
+def _int_to_parts(number, field_bits, bits):
+    """Splits a non negative int in int64 parts, least significant first."""
+    nr_parts = -(-field_bits // bits)
+    return torch.tensor([(number >> (i * bits)) & (2 ** bits - 1) for i in range(nr_parts)])
+
+
+def _broadcast_parts(parts, other_parts):
+    """Aligns the dimensions of the numbers of two tensors of parts for broadcasting."""
+    nr_dims = max(parts.dim(), other_parts.dim())
+    parts = parts.view(parts.shape[:1] + (1,) * (nr_dims - parts.dim()) + parts.shape[1:])
+    other_parts = other_parts.view(
+        other_parts.shape[:1] + (1,) * (nr_dims - other_parts.dim()) + other_parts.shape[1:]
+    )
+    return parts, other_parts
+
+
+def _add_parts(parts, other_parts, field_bits, bits):
+    return _reduce(parts + other_parts, field_bits, bits)
+
+
+def _sub_parts(parts, other_parts, field_bits, bits):
+    return _reduce(parts - other_parts, field_bits, bits)
+
+
+def _mul_parts(parts, other_parts, field_bits, bits):
+    """Schoolbook multiplication of the numbers modulo 2 ** field_bits, vectorized over
+    the numbers: only the parts of the product below the field are computed."""
+    parts, other_parts = torch.broadcast_tensors(parts, other_parts)
+    nr_parts = len(parts)
+    product = torch.zeros_like(parts)
+    for i in range(nr_parts):
+        product[i:] += parts[i] * other_parts[: nr_parts - i]
+    return _reduce(product, field_bits, bits)
+
+
+def _full_mul_parts(parts, other_parts, bits):
+    """Schoolbook multiplication of the numbers, returning all the parts of the product."""
+    product = torch.zeros(
+        (len(parts) + len(other_parts),) + tuple(parts.shape[1:]), dtype=torch.long
+    )
+    for i in range(len(parts)):
+        product[i : i + len(other_parts)] += parts[i] * other_parts
+    return _carry(product, bits)
+
+
+def _shift_right(parts, shift, bits):
+    """Divides normalized parts of numbers by 2 ** shift."""
+    nr_dropped, shift = divmod(shift, bits)
+    parts = parts[nr_dropped:]
+    shifted = parts >> shift
+    shifted[:-1] |= (parts[1:] << (bits - shift)) & (2 ** bits - 1)
+    return shifted
+
+
+def _divide_parts(parts, divisor, field_bits, bits):
+    """Divides non negative numbers below 2 ** (field_bits - 1) by a positive int.
+
+    The quotient is first computed by multiplying with a precomputed reciprocal of the
+    divisor, and is then either exact or one below the exact quotient, which the
+    remainder tells.
+
+    Returns:
+        The parts of the quotients, and whether the remainders are zero.
+    """
+    if divisor == 1:
+        # The reciprocal 2 ** shift would need one more bit than the parts hold
+        return parts.clone(), torch.ones(parts.shape[1:], dtype=torch.bool)
+
+    # Shape of a number, to broadcast constants with the parts
+    constant_shape = (1,) * (parts.dim() - 1)
+
+    shift = field_bits + divisor.bit_length()
+    reciprocal = _int_to_parts(2 ** shift // divisor, shift, bits)
+    reciprocal = reciprocal.view(reciprocal.shape + constant_shape)
+    quotient = _shift_right(_full_mul_parts(parts, reciprocal, bits), shift, bits)
+    quotient = _reduce(quotient[: len(parts)].clone(), field_bits, bits)
+
+    divisor_parts = _int_to_parts(divisor % 2 ** field_bits, field_bits, bits)
+    divisor_parts = divisor_parts.view(divisor_parts.shape + constant_shape)
+    remainder = _carry(parts - _mul_parts(quotient, divisor_parts, field_bits, bits), bits)
+
+    # The remainder is below twice the divisor: correct the quotient if it is above
+    difference = _carry(remainder - divisor_parts, bits)
+    too_small = difference[-1] >= 0
+    quotient[0] += too_small.long()
+    remainder = torch.where(too_small, difference, remainder)
+    return _reduce(quotient, field_bits, bits), (remainder == 0).all(dim=0)
+
+
 # The size of each type
 type_precision = {
     torch.uint8: 8,
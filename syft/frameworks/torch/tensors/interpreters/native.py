@@ -77,6 +77,7 @@ class TorchTensor(AbstractTensor):
                 self.child.tags = set()
         else:
             self._tags = new_tags
+        self._reindex()
 
     @property
     def description(self):
@@ -93,6 +94,7 @@ class TorchTensor(AbstractTensor):
             self.child.description = new_desc
         else:
             self._description = new_desc
+        self._reindex()
 
     @property
     def shape(self):
@@ -774,17 +776,14 @@ class TorchTensor(AbstractTensor):
             assert (
                 field_type in possible_field_types
             ), f"Choose field_type in {possible_field_types} to build CRT tensors"
+            # The residues are built from self, so CRT tensors only take keyword arguments
+            assert not args, 'When storage is set to "crt", provide the arguments as keywords'
 
-            residues = {}
-            for mod in _moduli_for_fields[field_type]:
-                residues[mod] = (
-                    syft.FixedPrecisionTensor(*args, field=mod, **kwargs)
-                    .on(self, wrap=False)
-                    .fix_precision(check_range=False)
-                    .wrap()
-                )
-
-            fpt_tensor = syft.CRTPrecisionTensor(residues, *args, **kwargs)
+            fpt_tensor = (
+                syft.CRTPrecisionTensor(moduli=_moduli_for_fields[field_type], **kwargs)
+                .on(self, wrap=False)
+                .fix_precision()
+            )
 
         elif need_large_prec or storage == "large":
             fpt_tensor = (
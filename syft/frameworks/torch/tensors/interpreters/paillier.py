@@ -18,7 +18,6 @@ class PaillierTensor(AbstractTensor):
             id: An optional string or integer id of the PaillierTensor.
         """
         super().__init__(id=id, owner=owner, tags=tags, description=description)
-        print("creating paillier tensor 2")
 
     def encrypt(self, public_key):
         """This method will encrypt each value in the tensor using Paillier
@@ -38,16 +37,16 @@ class PaillierTensor(AbstractTensor):
         """This method will encrypt each value in the tensor using Paillier
         homomorphic encryption.
 
+        The values are encrypted in chunks in the process pool of syft, see
+        syft.frameworks.torch.he.paillier.encrypt_array.
+
         Args:
             *public_key a public key created using
                 syft.frameworks.torch.he.paillier.keygen()
         """
+        from syft.frameworks.torch.he import paillier
 
-        inputs = self.child.flatten().tolist()
-        new_child = sy.pool().map(public_key.encrypt, inputs)
-
-        data = np.array(new_child).reshape(self.child.shape)
-        self.child = data
+        self.child = paillier.encrypt_array(public_key, self.child.numpy())
         self.pubkey = public_key
 
     def decrypt(self, private_key):
@@ -59,14 +58,14 @@ class PaillierTensor(AbstractTensor):
                 syft.frameworks.torch.he.paillier.keygen()
         """
 
+        from syft.frameworks.torch.he import paillier
+
         if not isinstance(self.child, np.ndarray):
             return th.tensor(private_key.decrypt(self.child))
 
-        inputs = self.child.flatten().tolist()
-
-        new_child = sy.pool().map(private_key.decrypt, inputs)
+        new_child = paillier.decrypt_array(private_key, self.child)
 
-        return th.tensor(new_child).view(*self.child.shape)
+        return th.tensor(new_child.ravel().tolist()).view(*self.child.shape)
 
     def __add__(self, *args, **kwargs):
         """
@@ -76,7 +75,9 @@ class PaillierTensor(AbstractTensor):
         """
 
         if isinstance(args[0], th.Tensor):
-            data = self.child + args[0].numpy()
+            from syft.frameworks.torch.he import paillier
+
+            data = paillier.add_plain(self.child, args[0].numpy())
             obj = PaillierTensor()
             obj.child = data
             return obj
@@ -104,7 +105,9 @@ class PaillierTensor(AbstractTensor):
         """
 
         if isinstance(args[0], th.Tensor):
-            data = self.child - args[0].numpy()
+            from syft.frameworks.torch.he import paillier
+
+            data = paillier.add_plain(self.child, -args[0].numpy())
             obj = PaillierTensor()
             obj.child = data
             return obj
@@ -132,7 +135,9 @@ class PaillierTensor(AbstractTensor):
         """
 
         if isinstance(args[0], th.Tensor):
-            data = self.child * args[0].numpy()
+            from syft.frameworks.torch.he import paillier
+
+            data = paillier.mul_plain(self.child, args[0].numpy())
             obj = PaillierTensor()
             obj.child = data
             return obj
@@ -259,38 +264,54 @@ class PaillierTensor(AbstractTensor):
     @staticmethod
     def simplify(worker: AbstractWorker, tensor: "PaillierTensor") -> tuple:
         """
-        This function takes the attributes of a LogTensor and saves them in a tuple
+        This function takes the attributes of a PaillierTensor and saves them in a tuple.
+        Encrypted values are packed as fixed width bytes with
+        syft.frameworks.torch.he.paillier.serialize_encrypted.
         Args:
-            tensor (PaillierTensor): a LogTensor
+            tensor (PaillierTensor): a PaillierTensor
         Returns:
-            tuple: a tuple holding the unique attributes of the log tensor
+            tuple: a tuple holding the unique attributes of the Paillier tensor
         Examples:
             data = _simplify(tensor)
         """
 
         chain = None
-        if hasattr(tensor, "child"):
+        encrypted = None
+        if isinstance(getattr(tensor, "child", None), np.ndarray) and tensor.child.dtype == object:
+            from syft.frameworks.torch.he import paillier
+
+            encrypted = sy.serde.msgpack.serde._simplify(
+                worker, paillier.serialize_encrypted(tensor.child)
+            )
+        elif hasattr(tensor, "child"):
             chain = sy.serde.msgpack.serde._simplify(worker, tensor.child)
-        return tensor.id, chain
+        return tensor.id, chain, encrypted
 
     @staticmethod
     def detail(worker: AbstractWorker, tensor_tuple: tuple) -> "PaillierTensor":
         """
-        This function reconstructs a LogTensor given it's attributes in form of a tuple.
+        This function reconstructs a PaillierTensor given it's attributes in form of a tuple.
         Args:
             worker: the worker doing the deserialization
-            tensor_tuple: a tuple holding the attributes of the LogTensor
+            tensor_tuple: a tuple holding the attributes of the PaillierTensor
         Returns:
-            PaillierTensor: a LogTensor
+            PaillierTensor: a PaillierTensor
         Examples:
-            logtensor = detail(data)
+            paillier_tensor = detail(data)
         """
-        obj_id, chain = tensor_tuple
+        obj_id, chain, encrypted = tensor_tuple
 
         tensor = PaillierTensor(owner=worker, id=obj_id)
 
         if chain is not None:
             chain = sy.serde.msgpack.serde._detail(worker, chain)
             tensor.child = chain
+        elif encrypted is not None:
+            from syft.frameworks.torch.he import paillier
+
+            encrypted = sy.serde.msgpack.serde._detail(worker, encrypted)
+            tensor.child = paillier.deserialize_encrypted(encrypted)
+            if tensor.child.size:
+                tensor.pubkey = tensor.child.flat[0].public_key
 
         return tensor
@@ -1,6 +1,10 @@
+import math
+import warnings
+
 import torch
 
 import syft
+from syft.frameworks.torch.mpc import approximations
 from syft.frameworks.torch.tensors.interpreters.additive_shared import AdditiveSharingTensor
 from syft.generic.frameworks.hook import hook_args
 from syft.generic.frameworks.overload import overloaded
@@ -454,55 +458,164 @@ class FixedPrecisionTensor(AbstractTensor):
     __matmul__ = matmul
     mm = matmul
 
+    def matmul_add(self, other, bias=None):
+        """
+        Computes self @ other + bias as a single fused operation
+
+        When self and other are shared, the AdditiveSharingTensors are multiplied with
+        a single SPDZ matmul (so with a single triple request), the product is truncated
+        once and the bias is added to the shares locally, the result being wrapped around
+        the field by the addition. This avoids dispatching the matmul, the truncation,
+        the modulo and the addition separately through the FixedPrecisionTensor. For the
+        other operands, this is a matmul followed by an addition.
+
+        Args:
+            other: the FixedPrecisionTensor on the right of the product
+            bias: an optional FixedPrecisionTensor added to the product, broadcast like
+                in an addition
+        """
+        if not (
+            isinstance(self.child, AdditiveSharingTensor)
+            and isinstance(other.child, AdditiveSharingTensor)
+        ):
+            response = self.matmul(other)
+            return response if bias is None else response + bias
+
+        assert (
+            self.precision_fractional == other.precision_fractional
+        ), "In matmul, all args should have the same precision_fractional"
+
+        response = self.child.matmul(other.child)
+        response = response / self.base ** self.precision_fractional
+
+        if bias is None:
+            response %= self.field
+        elif isinstance(bias.child, AdditiveSharingTensor):
+            response = response + bias.child
+        else:
+            response = response + bias.child.wrap()
+
+        return FixedPrecisionTensor(owner=self.owner, **self.get_class_attributes()).on(
+            response, wrap=False
+        )
+
     # Approximations:
-    def inverse(self, iterations=8):
+    # The parameters which are not given are taken from a preset of
+    # syft.frameworks.torch.mpc.approximations.PRESETS, "fast", "balanced" or "accurate"
+    def inverse(self, iterations=None, scale=None, preset=None):
         """
         Computes an approximation of the matrix inversion using Newton-Schulz
         iterations
+
+        Args:
+            iterations (int): number of Newton-Schulz iterations, each costing two
+                matrix multiplications
+            scale (float): public estimate of the largest eigenvalue, the iterations
+                start from I / scale. They converge for matrices whose eigenvalues
+                have a positive real part smaller than 2 * scale, and faster when
+                scale is close to the largest eigenvalue.
+            preset (str): name of the preset of the other parameters
         """
         # TODO: should we add non-approximate version if self.child is a pure tensor?
 
         assert len(self.shape) >= 2, "Can't compute inverse on non-matrix"
         assert self.shape[-1] == self.shape[-2], "Must be batches of square matrices"
 
-        inverse = (0.1 * torch.eye(self.shape[-1])).fix_prec(**self.get_class_attributes()).child
+        params = approximations.get_parameters(
+            "inverse", preset, iterations=iterations, scale=scale
+        )
 
-        for _ in range(iterations):
+        inverse = (
+            (torch.eye(self.shape[-1]) / params["scale"])
+            .fix_prec(**self.get_class_attributes())
+            .child
+        )
+
+        for _ in range(params["iterations"]):
             inverse = 2 * inverse - inverse @ self @ inverse
 
         return inverse
 
-    def exp(self, iterations=8):
+    def exp(self, iterations=None, degree=None, preset=None, bound=None):
         """
-        Approximates the exponential function using a limit approximation:
-        exp(x) = \lim_{n -> infty} (1 + x / n) ^ n
+        Approximates the exponential function using
+        exp(x) = exp(x / n) ^ n
 
-        Here we compute exp by choosing n = 2 ** d for some large d equal to
-        iterations. We then compute (1 + x / n) once and square `d` times.
+        Here we choose n = 2 ** d for d equal to iterations, approximate exp(x / n)
+        with its Taylor polynomial of the given degree, and square the result d
+        times. By default, this is the limit approximation
+        exp(x) = \lim_{n -> infty} (1 + x / n) ^ n
+        with degree=1 and d=8, which stays bounded for inputs down to -2 ** 9.
+        A higher degree allows fewer iterations, hence fewer rounds and a smaller
+        amplification of the truncation errors, but the polynomial is only accurate
+        for |x / n| <= 1, so the presets other than "limit" should be used with a
+        bound on the inputs.
 
         Args:
-            iterations (int): number of iterations for limit approximation
+            iterations (int): number of squarings
+            degree (int): degree of the Taylor polynomial
+            preset (str): name of the preset of the other parameters
+            bound (float): optional public bound on |x|, iterations being increased
+                so that |x / n| <= 1
 
         Ref: https://github.com/LaRiffle/approximate-models
         """
-        return (1 + self / 2 ** iterations) ** (2 ** iterations)
+        params = approximations.get_parameters("exp", preset, iterations=iterations, degree=degree)
+        iterations = params["iterations"]
+        if bound is not None and bound > 1:
+            iterations = max(iterations, math.ceil(math.log2(bound)))
+
+        result = approximations.evaluate_polynomial(
+            self / 2 ** iterations, approximations.exp_coefficients(params["degree"])
+        )
+        for _ in range(iterations):
+            result = result * result
+
+        return result
 
-    def sigmoid(self, method="exp"):
+    def sigmoid(self, method=None, degree=None, interval=None, preset=None):
         """
         Approximates the sigmoid function
 
         Args:
             self: the fixed precision tensor
-            method (str): (default = "exp")
+            method (str): (default = "exp", or "chebyshev" if degree, interval or preset
+                is given)
                 "exp": Use the exponential approximation and the sigmoid definition
                     sigmoid(x) = 1 / (1 + exp(-x))
+                "chebyshev": Use the Chebyshev interpolation of the given degree over
+                    [-interval, interval], the result being saturated to 0 or 1
+                    outside with two comparisons
                 "maclaurin": Use the Maclaurin / Taylor approximation, with polynomial
                     interpolation of degree 5 over [-8,8]
                     NOTE: This method is faster but not as precise as "exp"
                     Ref: https://mortendahl.github.io/2017/04/17/private-deep-learning-with-mpc/#approximating-sigmoid
+            degree (int): degree of the "chebyshev" polynomial
+            interval (int): half width of the "chebyshev" interpolation interval
+            preset (str): name of the preset of the "chebyshev" parameters
         """
+        if method is None:
+            chebyshev_args = (degree, interval, preset)
+            method = "exp" if all(arg is None for arg in chebyshev_args) else "chebyshev"
+
+        if method == "chebyshev":
+            params = approximations.get_parameters(
+                "sigmoid", preset, degree=degree, interval=interval
+            )
+            interval = params["interval"]
+
+            # sigmoid(x) = 1/2 + u * q(u ** 2) with u = x / interval
+            u = self / interval
+            q = approximations.evaluate_polynomial(
+                u * u, approximations.sigmoid_coefficients(params["degree"], interval)
+            )
+            result = u * q + 0.5
+
+            above = (self - interval) > 0
+            inside = ((self + interval) > 0) - above
+            result = inside * result + above
 
-        if method == "exp":
+        elif method == "exp":
             # Inverse can only be used on matrices
             if len(self.shape) == 1:
                 one = self * 0 + 1
@@ -511,48 +624,54 @@ class FixedPrecisionTensor(AbstractTensor):
                 result = (1 + (self * -1).exp()).inverse()
 
         elif method == "maclaurin":
-            weights = (
-                torch.tensor([0.5, 1.91204779e-01, -4.58667307e-03, 4.20690803e-05])
-                .fix_precision(**self.get_class_attributes())
-                .child
+            result = approximations.evaluate_polynomial(
+                self, [0.5, 1.91204779e-01, 0, -4.58667307e-03, 0, 4.20690803e-05]
             )
-            degrees = [0, 1, 3, 5]
-
-            # initiate with term of degree 0 to avoid errors with tensor ** 0
-            one = self * 0 + 1
-            result = one * weights[0]
-            for i, d in enumerate(degrees[1:]):
-                result += (self ** d) * weights[i + 1]
 
         return result
 
-    def log(self, iterations=2, exp_iterations=8):
-        """Approximates the natural logarithm using 8th order modified Householder iterations.
+    def log(self, iterations=None, order=None, preset=None, exp_iterations=None):
+        """Approximates the natural logarithm using modified Householder iterations.
         Recall that Householder method is an algorithm to solve a non linear equation f(x) = 0.
         Here  f: x -> 1 - C * exp(-x)  with C = self
 
         Iterations are computed by:
             y_0 = some constant
             h = 1 - self * exp(-y_n)
-            y_{n+1} = y_n - h * (1 + h / 2 + h^2 / 3 + h^3 / 6 + h^4 / 5 + h^5 / 7)
+            y_{n+1} = y_n - h * (1 + h / 2 + h^2 / 3 + ... + h^order / (order + 1))
 
         Args:
-            iterations (int): number of iterations for 6th order modified
-                Householder approximation.
-            exp_iterations (int): number of iterations for limit approximation of exp
+            iterations (int): number of Householder iterations.
+            order (int): highest power of h in the iterations.
+            preset (str): name of the preset of the other parameters, exp being
+                computed with the preset of the same name.
+            exp_iterations (int): deprecated, number of iterations of the limit
+                approximation of exp used instead of the preset.
 
         Ref: https://github.com/LaRiffle/approximate-models
         """
+        params = approximations.get_parameters("log", preset, iterations=iterations, order=order)
+        if exp_iterations is None:
+            exp_params = {"preset": preset or "balanced"}
+        else:
+            warnings.warn("exp_iterations is deprecated, use preset instead", DeprecationWarning)
+            exp_params = {"iterations": exp_iterations, "degree": 1}
 
-        y = self / 31 + 1.59 - 20 * (-2 * self - 1.4).exp(iterations=exp_iterations)
+        # The initial guess uses the limit approximation of exp, which stays bounded
+        # for the very negative values it is computed on
+        y = self / 31 + 1.59 - 20 * (-2 * self - 1.4).exp(iterations=exp_iterations or 8, degree=1)
 
-        # 6th order Householder iterations
-        for i in range(iterations):
-            h = [1 - self * (-y).refresh().exp(iterations=exp_iterations)]
-            for i in range(1, 5):
+        # Householder iterations
+        for i in range(params["iterations"]):
+            h = [1 - self * (-y).refresh().exp(**exp_params)]
+            for i in range(1, params["order"]):
                 h.append(h[-1] * h[0])
 
-            y -= h[0] * (1 + h[0] / 2 + h[1] / 3 + h[2] / 4 + h[3] / 5 + h[4] / 6)
+            series = 1 + h[0] / 2
+            for i in range(1, params["order"]):
+                series = series + h[i] / (i + 2)
+
+            y -= h[0] * series
 
         return y
 
@@ -614,9 +733,7 @@ class FixedPrecisionTensor(AbstractTensor):
         module.mm = matmul
 
         def addmm(bias, input_tensor, weight):
-            matmul = input_tensor.matmul(weight)
-            result = bias.add(matmul)
-            return result
+            return input_tensor.matmul_add(weight, bias)
 
         module.addmm = addmm
 
@@ -685,7 +802,7 @@ class FixedPrecisionTensor(AbstractTensor):
             """
             # Currently, kwargs are not unwrapped by hook_args
             # So this needs to be done manually
-            if bias.is_wrapper:
+            if bias is not None and bias.is_wrapper:
                 bias = bias.child
 
             assert len(input.shape) == 4
@@ -753,28 +870,37 @@ class FixedPrecisionTensor(AbstractTensor):
                     im_reshaped.append(im_flat[:, tmp])
             im_reshaped = torch.stack(im_reshaped).permute(1, 0, 2)
 
-            # The convolution kernels are also reshaped for the matrix multiplication
-            # We will get a matrix [[weights for out channel 0],
-            #                       [weights for out channel 1],
-            #                       ...
-            #                       [weights for out channel nb_channels_out]].TRANSPOSE()
-            weight_reshaped = weight.view(nb_channels_out // groups, -1).t()
-
-            # Now that everything is set up, we can compute the result
+            # Now that everything is set up, we can compute the result, adding the bias
+            # in the same fused operation
             if groups > 1:
-                res = []
-                chunks_im = torch.chunk(im_reshaped, groups, dim=2)
-                chunks_weights = torch.chunk(weight_reshaped, groups, dim=0)
-                for g in range(groups):
-                    tmp = chunks_im[g].matmul(chunks_weights[g])
-                    res.append(tmp)
-                res = torch.cat(res, dim=2)
+                # The groups are computed with a single batched matrix multiplication:
+                # the input values of each group [batch_size, nb_out_values, group values]
+                # are multiplied by the kernels of the out channels of this group
+                nb_values_group = nb_channels_kernel * nb_rows_kernel * nb_cols_kernel
+                nb_channels_group = nb_channels_out // groups
+                im_groups = im_reshaped.view(
+                    batch_size, nb_rows_out * nb_cols_out, groups, nb_values_group
+                ).permute(2, 0, 1, 3)
+                weight_groups = weight.view(groups, 1, nb_channels_group, nb_values_group).permute(
+                    0, 1, 3, 2
+                )
+                if bias is not None:
+                    bias = bias.view(groups, 1, 1, nb_channels_group)
+
+                res = im_groups.matmul_add(weight_groups, bias)
+                res = (
+                    res.permute(1, 2, 0, 3)
+                    .contiguous()
+                    .view(batch_size, nb_rows_out * nb_cols_out, nb_channels_out)
+                )
             else:
-                res = im_reshaped.matmul(weight_reshaped)
-
-            # Add a bias if needed
-            if bias is not None:
-                res += bias
+                # The convolution kernels are also reshaped for the matrix multiplication
+                # We will get a matrix [[weights for out channel 0],
+                #                       [weights for out channel 1],
+                #                       ...
+                #                       [weights for out channel nb_channels_out]].TRANSPOSE()
+                weight_reshaped = weight.view(nb_channels_out, -1).t()
+                res = im_reshaped.matmul_add(weight_reshaped, bias)
 
             # ... And reshape it back to an image
             res = (
@@ -796,11 +922,12 @@ class FixedPrecisionTensor(AbstractTensor):
 
             @overloaded.module
             def functional(module):
-                def linear(*args):
+                def linear(input, weight, bias=None):
                     """
-                    Un-hook the function to have its detailed behaviour
+                    Overloads torch.nn.functional.linear to compute the product and
+                    the bias addition as a single fused operation
                     """
-                    return torch.nn.functional.native_linear(*args)
+                    return input.matmul_add(weight.t(), bias)
 
                 module.linear = linear
 
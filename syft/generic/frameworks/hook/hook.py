@@ -3,6 +3,7 @@ from abc import abstractmethod
 from functools import wraps
 import inspect
 import re
+import threading
 import types
 from typing import List, Tuple
 
@@ -20,8 +21,36 @@ from syft.workers.base import BaseWorker
 from syft.exceptions import route_method_exception
 from syft.exceptions import TensorsNotCollocatedException
 
+# Serializes the materialization of lazily hooked methods, which can be first
+# accessed from several threads at once
+_lazy_hooking_lock = threading.RLock()
+
+
+def _lazy_hooked_getattr(self, name):
+    """Materializes a lazily hooked method the first time it is accessed.
+
+    This is installed as the __getattr__ of the syft types hooked with
+    FrameworkHook._hook_methods_lazily, so it is only reached when the normal
+    attribute lookup has failed. The hooked method is built, set on the class
+    which registered it and returned bound to self.
+    """
+    for cls in type(self).__mro__:
+        lazy_methods = cls.__dict__.get("_lazy_hooked_methods")
+        if lazy_methods is not None and name in lazy_methods:
+            with _lazy_hooking_lock:
+                # Another thread may have set the method on the class in the meantime
+                get_hooked_method = lazy_methods.pop(name, None)
+                if get_hooked_method is not None:
+                    setattr(cls, name, get_hooked_method(name))
+            return getattr(self, name)
+
+    raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
 
 class FrameworkHook(ABC):
+    # Whether the hooked methods of the syft types are built on first use
+    lazy_hooking = False
+
     @abstractmethod
     def __init__(self, framework_module, local_worker: BaseWorker = None, is_client: bool = True):
         pass
@@ -93,15 +122,50 @@ class FrameworkHook(ABC):
         Args:
             tensor_type: the tensor_type which holds the methods
         """
+        existing_attrs = set(dir(tensor_type))
         # Use a pre-defined list to select the methods to overload
         for attr in self.to_auto_overload[tensor_type]:
             # if we haven't already overloaded this function
-            if f"native_{attr}" not in dir(tensor_type):
+            if f"native_{attr}" not in existing_attrs:
                 native_method = getattr(tensor_type, attr)
                 setattr(tensor_type, f"native_{attr}", native_method)
                 new_method = self._get_hooked_method(attr)
                 setattr(tensor_type, attr, new_method)
 
+    def _hook_methods_lazily(
+        self, syft_type: type, attrs: List[str], get_hooked_method, force: List[str] = ()
+    ):
+        """Adds to syft_type the hooked version of the methods in attrs.
+
+        Methods already defined on syft_type are left untouched, unless they are
+        listed in force. When self.lazy_hooking is set, only special methods are
+        hooked right away (Python looks them up on the type, bypassing __getattr__),
+        the others are built on first access by _lazy_hooked_getattr. This keeps
+        the hooking process cheap for the syft types which are never used.
+
+        Args:
+            syft_type: the syft type on which the hooked methods are added.
+            attrs: names of the methods to hook.
+            get_hooked_method: factory building the hooked method from its name.
+            force: names of the methods to hook even if syft_type defines them.
+        """
+        lazy_methods = syft_type.__dict__.get("_lazy_hooked_methods", {})
+        existing_attrs = set(dir(syft_type)) | set(lazy_methods)
+
+        for attr in attrs:
+            if attr in existing_attrs and attr not in force:
+                continue
+
+            if self.lazy_hooking and not attr.startswith("__") and attr not in existing_attrs:
+                lazy_methods[attr] = get_hooked_method
+            else:
+                lazy_methods.pop(attr, None)
+                setattr(syft_type, attr, get_hooked_method(attr))
+
+        if lazy_methods:
+            syft_type._lazy_hooked_methods = lazy_methods
+            syft_type.__getattr__ = _lazy_hooked_getattr
+
     def _hook_properties(hook_self, tensor_type: type):
         """Overloads tensor_type properties.
 
@@ -191,6 +255,7 @@ class FrameworkHook(ABC):
         to_overload = boolean_comparators
 
         native_pattern = re.compile("native*")
+        base_attrs = set(dir(object))
 
         for attr in dir(tensor_type):
 
@@ -202,7 +267,7 @@ class FrameworkHook(ABC):
                 continue
 
             lit = getattr(tensor_type, attr)
-            is_base = attr in dir(object)
+            is_base = attr in base_attrs
             is_desc = inspect.ismethoddescriptor(lit)
             is_func = isinstance(lit, types.FunctionType)
             is_overloaded = native_pattern.match(attr) is not None
@@ -224,11 +289,9 @@ class FrameworkHook(ABC):
             syft_type: the syft_type which holds the methods
         """
 
-        # Use a pre-defined list to select the methods to overload
-        for attr in self.to_auto_overload[tensor_type]:
-            if attr not in dir(syft_type):
-                new_method = self._get_hooked_syft_method(attr)
-                setattr(syft_type, attr, new_method)
+        self._hook_methods_lazily(
+            syft_type, self.to_auto_overload[tensor_type], self._get_hooked_syft_method
+        )
 
     def _hook_private_tensor_methods(self, tensor_type: type, syft_type: type):
         """
@@ -236,11 +299,9 @@ class FrameworkHook(ABC):
         Private Tensor: It'll add references to its parents and save
         command/operations history.
         """
-        # Use a pre-defined list to select the methods to overload
-        for attr in self.to_auto_overload[tensor_type]:
-            if attr not in dir(syft_type):
-                new_method = self._get_hooked_private_method(attr)
-                setattr(syft_type, attr, new_method)
+        self._hook_methods_lazily(
+            syft_type, self.to_auto_overload[tensor_type], self._get_hooked_private_method
+        )
 
     def _hook_pointer_tensor_methods(self, tensor_type):
         """
@@ -252,11 +313,12 @@ class FrameworkHook(ABC):
 
         boolean_comparators = ["__gt__", "__ge__", "__lt__", "__le__"]
 
-        # Use a pre-defined list to select the methods to overload
-        for attr in self.to_auto_overload[tensor_type]:
-            if attr not in dir(PointerTensor) or attr in boolean_comparators:
-                new_method = self._get_hooked_pointer_method(attr)
-                setattr(PointerTensor, attr, new_method)
+        self._hook_methods_lazily(
+            PointerTensor,
+            self.to_auto_overload[tensor_type],
+            self._get_hooked_pointer_method,
+            force=boolean_comparators,
+        )
 
     def _hook_object_pointer_methods(self, framework_cls):
         """
@@ -279,11 +341,11 @@ class FrameworkHook(ABC):
         location it is pointing at.
         """
 
-        # Use a pre-defined list to select the methods to overload
-        for attr in self.to_auto_overload[tensor_type]:
-            if attr not in dir(MultiPointerTensor):
-                new_method = self._get_hooked_multi_pointer_method(attr)
-                setattr(MultiPointerTensor, attr, new_method)
+        self._hook_methods_lazily(
+            MultiPointerTensor,
+            self.to_auto_overload[tensor_type],
+            self._get_hooked_multi_pointer_method,
+        )
 
     def _hook_string_methods(self, owner):
 
@@ -670,7 +732,7 @@ class FrameworkHook(ABC):
 
             results = {}
             for k, v in new_self.items():
-                results[k] = v.__getattribute__(attr)(*dispatch(new_args, k), **new_kwargs)
+                results[k] = getattr(v, attr)(*dispatch(new_args, k), **new_kwargs)
 
             # Put back MultiPointerTensor on the tensors found in the response
             response = hook_args.hook_response(
@@ -36,10 +36,32 @@ class AbstractObject(ABC):
         """
         self.owner = owner
         self.id = id or sy.ID_PROVIDER.pop()
-        self.tags = tags
-        self.description = description
+        # A new object can't be stored yet, so there is nothing to reindex
+        self._tags = tags
+        self._description = description
         self.child = child
 
+    @property
+    def tags(self):
+        """The tags of the object. Setting them updates the search index of the owner,
+        but changing the set in place, like with obj.tags.add(tag), doesn't: use
+        obj.tag(tag) instead."""
+        return getattr(self, "_tags", None)
+
+    @tags.setter
+    def tags(self, new_tags):
+        self._tags = new_tags
+        self._reindex()
+
+    @property
+    def description(self):
+        return getattr(self, "_description", None)
+
+    @description.setter
+    def description(self, new_desc):
+        self._description = new_desc
+        self._reindex()
+
     def __str__(self) -> str:
         if hasattr(self, "child"):
             return type(self).__name__ + ">" + self.child.__str__()
@@ -62,8 +84,15 @@ class AbstractObject(ABC):
 
         for new_tag in _tags:
             self.tags.add(new_tag)
+        self._reindex()
         return self
 
+    def _reindex(self):
+        """Keeps the search index of the owner up to date if it stores this object."""
+        owner = getattr(self, "owner", None)
+        if owner is not None and hasattr(owner, "reindex_obj"):
+            owner.reindex_obj(self)
+
     def serialize(self):  # check serde.py to see how to provide compression schemes
         """Serializes the tensor on which it's called.
 
@@ -1,22 +1,496 @@
+import bisect
+from collections import OrderedDict
+from collections.abc import MutableMapping
+import itertools
+import logging
+import os
+import threading
+import time
 from typing import List
 from typing import Union
+import uuid
 
+import numpy
+
+from syft import dependency_check
+from syft.generic.frameworks.types import FrameworkTensor
 from syft.generic.frameworks.types import FrameworkTensorType
+from syft.generic.object import AbstractObject
 from syft.generic.tensor import AbstractTensor
 
 from syft.exceptions import ObjectNotFoundError
 
+if dependency_check.torch_available:
+    import torch
+
+logger = logging.getLogger(__name__)
+
+
+def _object_size(obj: object) -> int:
+    """Returns the number of bytes of tensor data held by an object and its child chain."""
+    if hasattr(obj, "child"):
+        child = obj.child
+        if isinstance(child, dict):
+            return sum(_object_size(share) for share in child.values())
+        return _object_size(child)
+    elif isinstance(obj, FrameworkTensor) and hasattr(obj, "nelement"):
+        return obj.element_size() * obj.nelement()
+    elif isinstance(obj, numpy.ndarray):
+        return obj.nbytes
+    return 0
+
+
+class BoundedObjectDict(MutableMapping):
+    """A dictionary of objects whose memory footprint is bounded.
+
+    Objects are tracked in least recently used order, each access to an object
+    making it the most recently used one. When the tensor data held by the objects
+    exceeds memory_budget, or when an object was not accessed for ttl seconds,
+    the least recently used objects which are not pinned are evicted.
+
+    If spill_dir is provided, evicted tensors are saved to files in this
+    directory and are loaded back the next time they are accessed, so eviction is
+    transparent. Otherwise, evicted objects are removed.
+
+    Args:
+        memory_budget: the maximum number of bytes of tensor data to keep in memory.
+        ttl: the number of seconds after which an object which was not accessed
+            is evicted.
+        spill_dir: an optional directory where evicted tensors are spilled.
+    """
+
+    def __init__(self, memory_budget: int = None, ttl: float = None, spill_dir: str = None):
+        self.memory_budget = memory_budget
+        self.ttl = ttl
+        self.spill_dir = spill_dir
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+
+        # Evictable objects, from the least to the most recently used
+        self._lru = OrderedDict()
+        self._last_access = {}
+        self._pinned = {}
+        # Evicted tensors saved in spill_dir: key -> (path, requires_grad, attributes)
+        self._spilled = {}
+        self._sizes = {}
+
+        self.memory_used = 0
+        self.evicted_count = 0
+        self.reloaded_count = 0
+
+    def __getitem__(self, key):
+        if key in self._pinned:
+            return self._pinned[key]
+        elif key in self._lru:
+            self._lru.move_to_end(key)
+            self._last_access[key] = time.monotonic()
+            return self._lru[key]
+        elif key in self._spilled:
+            obj = self._reload(key)
+            self[key] = obj
+            return obj
+        raise KeyError(key)
+
+    def __setitem__(self, key, obj):
+        self.store(key, obj, pinned=key in self._pinned)
+
+    def store(self, key, obj, pinned: bool = False):
+        """Stores an object, which is never evicted if it is pinned.
+
+        Unlike setting an item and pinning it afterwards, a pinned object is stored
+        without triggering any eviction, even if it exceeds the memory budget.
+        """
+        if key in self:
+            del self[key]
+
+        size = _object_size(obj)
+        self._sizes[key] = size
+        self.memory_used += size
+
+        if pinned:
+            self._pinned[key] = obj
+        else:
+            self._lru[key] = obj
+            self._last_access[key] = time.monotonic()
+            self._evict(protected_key=key)
+
+    def __delitem__(self, key):
+        if key in self._spilled:
+            path, _, _ = self._spilled.pop(key)
+            os.remove(path)
+            return
+
+        if key in self._pinned:
+            del self._pinned[key]
+        else:
+            del self._lru[key]
+            del self._last_access[key]
+        self.memory_used -= self._sizes.pop(key)
+
+    def __contains__(self, key):
+        return key in self._lru or key in self._pinned or key in self._spilled
+
+    def __iter__(self):
+        yield from list(self._pinned)
+        yield from list(self._lru)
+        yield from list(self._spilled)
+
+    def __len__(self):
+        return len(self._pinned) + len(self._lru) + len(self._spilled)
+
+    def clear(self):
+        for path, _, _ in self._spilled.values():
+            os.remove(path)
+        self._lru.clear()
+        self._last_access.clear()
+        self._pinned.clear()
+        self._spilled.clear()
+        self._sizes.clear()
+        self.memory_used = 0
+
+    def copy(self) -> dict:
+        """Returns a dict of all the objects, spilled tensors being loaded back."""
+        return dict(self.items())
+
+    def pin(self, key):
+        """Prevents an object from being evicted."""
+        obj = self[key]
+        if key in self._lru:
+            del self._lru[key]
+            del self._last_access[key]
+            self._pinned[key] = obj
+
+    def unpin(self, key):
+        """Makes an object evictable again."""
+        if key in self._pinned:
+            self._lru[key] = self._pinned.pop(key)
+            self._last_access[key] = time.monotonic()
+            self._evict(protected_key=key)
+
+    def is_pinned(self, key) -> bool:
+        return key in self._pinned
+
+    def evict_expired(self):
+        """Evicts the objects which were not accessed for more than ttl seconds."""
+        self._evict()
+
+    def stats(self) -> dict:
+        """Returns statistics about the objects stored and the memory they use."""
+        return {
+            "objects": len(self),
+            "in_memory": len(self._lru) + len(self._pinned),
+            "pinned": len(self._pinned),
+            "spilled": len(self._spilled),
+            "memory_used": self.memory_used,
+            "memory_budget": self.memory_budget,
+            "evicted": self.evicted_count,
+            "reloaded": self.reloaded_count,
+        }
+
+    def _evict(self, protected_key=None):
+        """Evicts least recently used objects until the memory budget and the ttl are met.
+
+        Args:
+            protected_key: the key of an object which shouldn't be evicted, typically
+                the one which was just added.
+        """
+        if self.ttl is not None:
+            expiry = time.monotonic() - self.ttl
+            while self._lru:
+                key = next(iter(self._lru))
+                if key == protected_key or self._last_access[key] > expiry:
+                    break
+                self._evict_obj(key)
+
+        if self.memory_budget is not None:
+            while self.memory_used > self.memory_budget and self._lru:
+                key = next(iter(self._lru))
+                if key == protected_key:
+                    break
+                self._evict_obj(key)
+
+    def _evict_obj(self, key):
+        obj = self._lru[key]
+        del self[key]
+        self.evicted_count += 1
+
+        if self.spill_dir is not None and self._is_spillable(obj):
+            self._spill(key, obj)
+
+    @staticmethod
+    def _is_spillable(obj) -> bool:
+        # Only plain tensors without gradient can be rebuilt from their data
+        return (
+            dependency_check.torch_available
+            and type(obj) is torch.Tensor
+            and not hasattr(obj, "child")
+            and obj.grad is None
+        )
+
+    def _spill(self, key, obj):
+        path = os.path.join(self.spill_dir, f"{uuid.uuid4().hex}.npy")
+        numpy.save(path, obj.detach().numpy())
+        # Syft attributes (id, owner, tags, description, etc.) are kept in memory
+        self._spilled[key] = (path, obj.requires_grad, dict(obj.__dict__))
+        logger.debug("Spilled object %s to %s", key, path)
+
+    def _reload(self, key):
+        path, requires_grad, attributes = self._spilled.pop(key)
+        obj = torch.from_numpy(numpy.load(path))
+        os.remove(path)
+
+        obj.requires_grad_(requires_grad)
+        obj.__dict__.update(attributes)
+        self.reloaded_count += 1
+        return obj
+
+
+def _searchable_attributes(obj: object) -> tuple:
+    """Returns the tags and the description an object can be searched for."""
+    if isinstance(obj, (AbstractObject, FrameworkTensor)):
+        description = obj.description
+        if not isinstance(description, str):
+            description = None
+        return tuple(obj.tags or ()), description
+    return (), None
+
+
+class ObjectIndex:
+    """An inverted index over the ids, tags and descriptions of stored objects.
+
+    Each tag, each word of the descriptions and the string form of each id is
+    mapped to the ids of the objects carrying it, so that AND queries are answered
+    by intersecting sets of ids instead of scanning every object.
+    """
+
+    def __init__(self, objects: MutableMapping = None):
+        # The collection of objects indexed, used to detect that it was replaced
+        self.source = objects
+        self._ids = {}
+        self._tags = {}
+        self._words = {}
+        self._sorted_words = None
+        self._descriptions = {}
+        # The tags each indexed object was indexed under
+        self._indexed = {}
+
+        if objects is not None:
+            for obj_id, obj in objects.items():
+                self.add(obj_id, obj)
+
+    def __len__(self):
+        return len(self._indexed)
+
+    def __contains__(self, obj_id):
+        return obj_id in self._indexed
+
+    def add(self, obj_id, obj: object):
+        """Indexes an object under its id, tags and description, replacing any
+        previous entry for the same id."""
+        self.remove(obj_id)
+        tags, description = _searchable_attributes(obj)
+        self._indexed[obj_id] = tags
+        self._ids.setdefault(str(obj_id), set()).add(obj_id)
+
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(obj_id)
+
+        if description is not None:
+            self._descriptions[obj_id] = description
+            for word in set(description.split()):
+                ids = self._words.get(word)
+                if ids is None:
+                    ids = self._words[word] = set()
+                    self._sorted_words = None
+                ids.add(obj_id)
+
+    def remove(self, obj_id):
+        """Removes an object from the index if it is indexed."""
+        tags = self._indexed.pop(obj_id, None)
+        if tags is None:
+            return
+        self._discard(self._ids, str(obj_id), obj_id)
+
+        for tag in tags:
+            self._discard(self._tags, tag, obj_id)
+
+        description = self._descriptions.pop(obj_id, None)
+        if description is not None:
+            for word in set(description.split()):
+                if self._discard(self._words, word, obj_id):
+                    self._sorted_words = None
+
+    def clear(self):
+        self._ids.clear()
+        self._tags.clear()
+        self._words.clear()
+        self._sorted_words = None
+        self._descriptions.clear()
+        self._indexed.clear()
+
+    def search(self, query: List[str], description_prefix: bool = False) -> set:
+        """Returns the ids of the objects matching every term of the query.
+
+        A term matches an object if it is equal to the string form of its id, is one
+        of its tags or is found in its description.
+
+        Args:
+            query: the list of string terms which must all match.
+            description_prefix: if True, a term matches a description if one of its
+                words starts with the term, which is answered from the index. Otherwise
+                the term must be a substring of the description, which is checked on
+                the descriptions of the remaining candidates.
+
+        Returns:
+            The set of ids of the matching objects.
+        """
+        candidates = None
+        for term in query:
+            ids = self._ids.get(term, set()) | self._tags.get(term, set())
+
+            if description_prefix:
+                ids |= self._prefix_matches(term)
+                candidates = ids if candidates is None else candidates & ids
+            elif candidates is None:
+                ids.update(
+                    obj_id
+                    for obj_id, description in self._descriptions.items()
+                    if term in description
+                )
+                candidates = ids
+            else:
+                candidates = {
+                    obj_id
+                    for obj_id in candidates
+                    if obj_id in ids or term in self._descriptions.get(obj_id, "")
+                }
+
+            if not candidates:
+                return set()
+
+        if candidates is None:
+            return set(self._indexed)
+        return candidates
+
+    def _prefix_matches(self, prefix: str) -> set:
+        """Returns the ids of the objects with a description word starting with prefix."""
+        if self._sorted_words is None:
+            self._sorted_words = sorted(self._words)
+
+        ids = set()
+        start = bisect.bisect_left(self._sorted_words, prefix)
+        for word in itertools.islice(self._sorted_words, start, None):
+            if not word.startswith(prefix):
+                break
+            ids |= self._words[word]
+        return ids
+
+    @staticmethod
+    def _discard(mapping: dict, key, obj_id) -> bool:
+        """Removes obj_id from the set mapping[key], and returns whether the key was
+        dropped because its set became empty."""
+        ids = mapping.get(key)
+        if ids is None:
+            return False
+        ids.discard(obj_id)
+        if not ids:
+            del mapping[key]
+            return True
+        return False
+
 
 class ObjectStorage:
     """A storage of objects identifiable by their id.
 
     A wrapper object to a collection of objects where all objects
     are stored using their IDs as keys.
+
+    The storage can be accessed from several threads, for instance when a virtual
+    worker receives messages from computations running concurrently on other workers.
     """
 
     def __init__(self):
         # This is the collection of objects being stored.
         self._objects = {}
+        # This is the index used to search the objects by id, tag or description.
+        self._index = ObjectIndex(self._objects)
+        # This lock serializes the accesses to the objects and their index, as even
+        # reading an object updates the order of a BoundedObjectDict.
+        self._storage_lock = threading.RLock()
+
+    def limit_memory(
+        self,
+        memory_budget: int = None,
+        ttl: float = None,
+        spill_dir: str = None,
+        pin_existing: bool = True,
+    ):
+        """Bounds the memory used by the objects stored.
+
+        The objects are moved to a BoundedObjectDict which evicts the least recently
+        used objects once memory_budget is exceeded, or once they were not accessed
+        for ttl seconds. Evicted tensors are spilled to spill_dir if it is provided,
+        and removed otherwise.
+
+        Args:
+            memory_budget: the maximum number of bytes of tensor data to keep in memory.
+            ttl: the number of seconds after which an object which was not accessed
+                is evicted.
+            spill_dir: an optional directory where evicted tensors are spilled.
+            pin_existing: whether the objects already stored (like the data a worker
+                was initialized with) should be protected from eviction.
+        """
+        objects = BoundedObjectDict(memory_budget=memory_budget, ttl=ttl, spill_dir=spill_dir)
+        with self._lock():
+            for obj_id, obj in self._objects.items():
+                objects.store(obj_id, obj, pinned=pin_existing)
+            self._object_index().source = objects
+            self._objects = objects
+
+    def pin_obj(self, obj_id: Union[str, int]):
+        """Prevents an object from being evicted when the storage memory is limited.
+
+        Args:
+            obj_id: A string or integer id of the object to pin.
+        """
+        with self._lock():
+            if obj_id not in self._objects:
+                raise ObjectNotFoundError(obj_id, self)
+            if isinstance(self._objects, BoundedObjectDict):
+                self._objects.pin(obj_id)
+
+    def unpin_obj(self, obj_id: Union[str, int]):
+        """Makes a pinned object evictable again.
+
+        Args:
+            obj_id: A string or integer id of the object to unpin.
+        """
+        with self._lock():
+            if isinstance(self._objects, BoundedObjectDict):
+                self._objects.unpin(obj_id)
+
+    def evict_expired_objects(self):
+        """Evicts the objects which were not accessed for longer than the ttl given to
+        limit_memory.
+
+        This is done whenever an object is stored or accessed, and should be called
+        periodically by idle workers so that the objects of dead clients are freed.
+        """
+        with self._lock():
+            if isinstance(self._objects, BoundedObjectDict):
+                self._objects.evict_expired()
+
+    def storage_stats(self) -> dict:
+        """Returns statistics about the objects stored and the memory they use."""
+        with self._lock():
+            if isinstance(self._objects, BoundedObjectDict):
+                self._objects.evict_expired()
+                return self._objects.stats()
+
+            return {
+                "objects": len(self._objects),
+                "memory_used": sum(_object_size(obj) for obj in self._objects.values()),
+            }
 
     def register_obj(self, obj: object, obj_id: Union[str, int] = None):
         """Registers the specified object with the current worker node.
@@ -62,13 +536,15 @@ class ObjectStorage:
             Object with id equals to `obj_id`.
         """
 
-        try:
-            obj = self._objects[obj_id]
-        except KeyError as e:
-            if obj_id not in self._objects:
-                raise ObjectNotFoundError(obj_id, self)
-            else:
-                raise e
+        with self._lock():
+            self.evict_expired_objects()
+            try:
+                obj = self._objects[obj_id]
+            except KeyError as e:
+                if obj_id not in self._objects:
+                    raise ObjectNotFoundError(obj_id, self)
+                else:
+                    raise e
 
         return obj
 
@@ -78,7 +554,9 @@ class ObjectStorage:
         Args:
             obj: A torch or syft tensor with an id.
         """
-        self._objects[obj.id] = obj
+        with self._lock():
+            self._objects[obj.id] = obj
+            self._object_index().add(obj.id, obj)
 
     def rm_obj(self, remote_key: Union[str, int]):
         """Removes an object.
@@ -89,8 +567,10 @@ class ObjectStorage:
             remote_key: A string or integer representing id of the object to be
                 removed.
         """
-        if remote_key in self._objects:
-            del self._objects[remote_key]
+        with self._lock():
+            if remote_key in self._objects:
+                del self._objects[remote_key]
+            self._object_index().remove(remote_key)
 
     def force_rm_obj(self, remote_key: Union[str, int]):
         """Forces object removal.
@@ -102,11 +582,13 @@ class ObjectStorage:
             remote_key: A string or integer representing id of the object to be
                 removed.
         """
-        if remote_key in self._objects:
-            obj = self._objects[remote_key]
-            if hasattr(obj, "child") and hasattr(obj.child, "garbage_collect_data"):
-                obj.child.garbage_collect_data = True
-            del self._objects[remote_key]
+        with self._lock():
+            if remote_key in self._objects:
+                obj = self._objects[remote_key]
+                if hasattr(obj, "child") and hasattr(obj.child, "garbage_collect_data"):
+                    obj.child.garbage_collect_data = True
+                del self._objects[remote_key]
+            self._object_index().remove(remote_key)
 
     def clear_objects(self, return_self: bool = True):
         """Removes all objects from the object storage.
@@ -120,9 +602,63 @@ class ObjectStorage:
             self, if return_self if True, else None
 
         """
-        self._objects.clear()
+        with self._lock():
+            self._objects.clear()
+            self._object_index().clear()
         return self if return_self else None
 
     def current_objects(self):
         """Returns a copy of the objects in the object storage."""
-        return self._objects.copy()
+        with self._lock():
+            return self._objects.copy()
+
+    def reindex_obj(self, obj: object):
+        """Updates the search index of a stored object whose tags or description changed.
+
+        Args:
+            obj: the object which was modified. Nothing is done if it is not stored.
+        """
+        obj_id = getattr(obj, "id", None)
+        with self._lock():
+            index = self._object_index()
+            if obj_id in index:
+                index.add(obj_id, obj)
+
+    def find_obj_ids(self, query: List[str], description_prefix: bool = False) -> List:
+        """Returns the ids of the stored objects matching every term of the query.
+
+        See ObjectIndex.search for how terms are matched.
+
+        Args:
+            query: the list of string terms which must all match.
+            description_prefix: whether terms match the start of the description words
+                rather than any part of the description.
+
+        Returns:
+            The list of ids of the matching objects.
+        """
+        obj_ids = []
+        with self._lock():
+            index = self._object_index()
+            for obj_id in index.search(query, description_prefix=description_prefix):
+                # Objects can leave the storage without going through rm_obj, for
+                # instance when they are evicted
+                if obj_id in self._objects:
+                    obj_ids.append(obj_id)
+                else:
+                    index.remove(obj_id)
+        return obj_ids
+
+    def _object_index(self) -> ObjectIndex:
+        """Returns the search index, rebuilding it if the objects were replaced."""
+        index = getattr(self, "_index", None)
+        if index is None or index.source is not self._objects:
+            index = self._index = ObjectIndex(self._objects)
+        return index
+
+    def _lock(self) -> threading.RLock:
+        """Returns the lock of the storage, creating it if __init__ was bypassed."""
+        lock = getattr(self, "_storage_lock", None)
+        if lock is None:
+            lock = self._storage_lock = threading.RLock()
+        return lock
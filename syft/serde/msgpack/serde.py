@@ -33,7 +33,6 @@ If different compressions are required, the worker can override the function app
 from collections import OrderedDict
 from typing import Callable
 
-import inspect
 import msgpack as msgpack_lib
 
 import syft
@@ -172,11 +171,11 @@ def _force_full_simplify(worker: AbstractWorker, obj: object) -> object:
     else:
         # If the object type is not in forced_full_simplifiers,
         # we check the classes that this object inherits from.
-        # `inspect.getmro` give us all types this object inherits
+        # `__mro__` give us all types this object inherits
         # from, including `type(obj)`. We can skip the type of the
         # object because we already tried this in the
         # previous step.
-        classes_inheritance = inspect.getmro(type(obj))[1:]
+        classes_inheritance = current_type.__mro__[1:]
 
         for inheritance_type in classes_inheritance:
             if inheritance_type in forced_full_simplifiers:
@@ -247,6 +246,17 @@ no_simplifiers_found, no_full_simplifiers_found = set(), set()
 # Store types that use simplifiers from their ancestors so we
 # can look them up quickly during serialization.
 inherited_simplifiers_found = OrderedDict()
+# Store for each type already seen the function which simplifies its objects,
+# see _get_encoder.
+encoders = {}
+
+# Native collections are simplified and detailed by walking them with an explicit
+# stack rather than recursively, see _simplify_nested and _detail_nested.
+NESTED_TYPES = (list, tuple, set, dict)
+NESTED_CODES = {simplifiers[nested_type][0]: nested_type for nested_type in NESTED_TYPES}
+DICT_CODE = simplifiers[dict][0]
+# Types of the objects produced by simplification (msgpack decodes lists as tuples)
+SIMPLIFIED_TYPES = {list, tuple}
 
 
 def _serialize_msgpack_simple(
@@ -394,51 +404,136 @@ def _simplify(worker: AbstractWorker, obj: object, **kwargs) -> object:
         characters.
     """
 
-    # Check to see if there is a simplifier
-    # for this type. If there is, return the simplified object.
-    # breakpoint()
     current_type = type(obj)
-    if current_type in simplifiers:
-        result = (simplifiers[current_type][0], simplifiers[current_type][1](worker, obj, **kwargs))
-        return result
-    elif current_type in inherited_simplifiers_found:
-        result = (
-            inherited_simplifiers_found[current_type][0],
-            inherited_simplifiers_found[current_type][1](worker, obj, **kwargs),
-        )
-        return result
 
     # If we already tried to find a simplifier for this type but failed, we should
     # just return the object as it is.
-    elif current_type in no_simplifiers_found:
+    if current_type in no_simplifiers_found:
         return obj
 
+    encoder = encoders.get(current_type)
+    if encoder is None:
+        encoder = _get_encoder(current_type)
+
+        # if there is not a simplifier for this
+        # object, then the object is already a
+        # simple python object and we can just
+        # return it.
+        if encoder is None:
+            no_simplifiers_found.add(current_type)
+            return obj
+
+    return encoder(worker, obj, **kwargs)
+
+
+def _get_encoder(current_type: type) -> Callable:
+    """Builds the function simplifying the objects of a given type.
+
+    The function returned is cached in `encoders`, so that simplifying an object only
+    costs a single dictionary lookup once its type has been seen.
+
+    Args:
+        current_type: The type of the objects to simplify.
+
+    Returns:
+        A function with the same signature as _simplify, or None if the objects of
+        this type are already simple python objects.
+    """
+    if current_type in simplifiers:
+        code, simplifier = simplifiers[current_type]
     else:
         # If the object type is not in simplifiers,
         # we check the classes that this object inherits from.
-        # `inspect.getmro` give us all types this object inherits
-        # from, including `type(obj)`. We can skip the type of the
-        # object because we already tried this in the
-        # previous step.
-        classes_inheritance = inspect.getmro(type(obj))[1:]
-
-        for inheritance_type in classes_inheritance:
+        # `__mro__` give us all types this object inherits
+        # from, including `current_type`, which we can skip because
+        # we already tried this in the previous step.
+        for inheritance_type in current_type.__mro__[1:]:
             if inheritance_type in simplifiers:
                 # Store the inheritance_type in simplifiers so next time we see this type
                 # serde will be faster.
                 inherited_simplifiers_found[current_type] = simplifiers[inheritance_type]
-                result = (
-                    inherited_simplifiers_found[current_type][0],
-                    inherited_simplifiers_found[current_type][1](worker, obj, **kwargs),
-                )
-                return result
+                code, simplifier = simplifiers[inheritance_type]
+                break
+        else:
+            return None
 
-        # if there is not a simplifier for this
-        # object, then the object is already a
-        # simple python object and we can just
-        # return it.
-        no_simplifiers_found.add(current_type)
-        return obj
+    if current_type in NESTED_TYPES:
+
+        def encoder(worker: AbstractWorker, obj: object, **kwargs) -> object:
+            # Options like `shallow` are only handled by the native simplifiers
+            if kwargs:
+                return (code, simplifier(worker, obj, **kwargs))
+            return _simplify_nested(worker, obj)
+
+    else:
+
+        def encoder(worker: AbstractWorker, obj: object, **kwargs) -> object:
+            return (code, simplifier(worker, obj, **kwargs))
+
+    encoders[current_type] = encoder
+    return encoder
+
+
+def _simplify_nested(worker: AbstractWorker, obj: object) -> object:
+    """Simplifies nested native collections (list, tuple, set, dict).
+
+    The output is the same as the one of the native simplifiers called recursively,
+    but the collections are walked with an explicit stack. Collections only holding
+    objects which are already simple (int, float, None, etc.) are copied at once.
+
+    Args:
+        obj: a list, tuple, set or dict.
+
+    Returns:
+        The simplified collection.
+    """
+    # Each frame holds the code of a collection (None for the key/value pairs of
+    # dictionaries), an iterator over its items and the simplified items
+    stack = [_simplify_nested_frame(obj)]
+
+    while True:
+        code, items, pieces = stack[-1]
+        if items is not None:
+            for item in items:
+                item_type = type(item)
+                if code == DICT_CODE:
+                    # item is a (key, value) pair which is simplified as a raw tuple
+                    stack.append((None, iter(item), []))
+                    break
+                elif item_type in no_simplifiers_found:
+                    pieces.append(item)
+                elif item_type in NESTED_TYPES:
+                    stack.append(_simplify_nested_frame(item))
+                    break
+                else:
+                    pieces.append(_simplify(worker, item))
+            else:
+                items = None
+
+        if items is None:
+            stack.pop()
+            simplified = tuple(pieces) if code is None else (code, tuple(pieces))
+            if not stack:
+                return simplified
+            stack[-1][2].append(simplified)
+
+
+def _simplify_nested_frame(obj: object) -> tuple:
+    code = simplifiers[type(obj)][0]
+
+    if type(obj) is dict:
+        # Fast path: keys and values are all already simple
+        if no_simplifiers_found.issuperset(map(type, obj)) and no_simplifiers_found.issuperset(
+            map(type, obj.values())
+        ):
+            return (code, None, list(obj.items()))
+        return (code, iter(obj.items()), [])
+
+    # Fast path: all items are already simple
+    if no_simplifiers_found.issuperset(map(type, obj)):
+        return (code, None, obj)
+
+    return (code, iter(obj), [])
 
 
 def _detail(worker: AbstractWorker, obj: object, **kwargs) -> object:
@@ -457,7 +552,66 @@ def _detail(worker: AbstractWorker, obj: object, **kwargs) -> object:
         obj: a more complex Python object which msgpack would have had trouble
             deserializing directly.
     """
-    if type(obj) in (list, tuple):
+    if type(obj) in SIMPLIFIED_TYPES:
+        if obj[0] in NESTED_CODES and not kwargs:
+            return _detail_nested(worker, obj)
         return detailers[obj[0]](worker, obj[1], **kwargs)
     else:
         return obj
+
+
+def _detail_nested(worker: AbstractWorker, obj: tuple) -> object:
+    """Details simplified nested native collections (list, tuple, set, dict).
+
+    This reverses _simplify_nested, walking the simplified collections with an
+    explicit stack. Collections holding no simplified objects are rebuilt at once.
+
+    Args:
+        obj: a simplified list, tuple, set or dict.
+
+    Returns:
+        The detailed collection.
+    """
+    # Each frame holds the type of a collection (tuple for the key/value pairs of
+    # dictionaries), an iterator over its simplified items and the detailed items
+    stack = [_detail_nested_frame(obj)]
+
+    while True:
+        collection_type, items, pieces = stack[-1]
+        if items is not None:
+            for item in items:
+                if collection_type is dict:
+                    # item is a (key, value) pair which was simplified as a raw tuple
+                    stack.append((tuple, iter(item), []))
+                    break
+                elif type(item) not in SIMPLIFIED_TYPES:
+                    pieces.append(item)
+                elif item[0] in NESTED_CODES:
+                    stack.append(_detail_nested_frame(item))
+                    break
+                else:
+                    pieces.append(detailers[item[0]](worker, item[1]))
+            else:
+                items = None
+
+        if items is None:
+            stack.pop()
+            detailed = collection_type(pieces)
+            if not stack:
+                return detailed
+            stack[-1][2].append(detailed)
+
+
+def _detail_nested_frame(obj: tuple) -> tuple:
+    collection_type = NESTED_CODES[obj[0]]
+    payload = obj[1]
+
+    if collection_type is dict:
+        # Fast path: keys and values are all simple python objects
+        if all(SIMPLIFIED_TYPES.isdisjoint(map(type, pair)) for pair in payload):
+            return (dict, None, payload)
+    # Fast path: items are all simple python objects
+    elif SIMPLIFIED_TYPES.isdisjoint(map(type, payload)):
+        return (collection_type, None, payload)
+
+    return (collection_type, iter(payload), [])
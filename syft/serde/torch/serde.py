@@ -31,6 +31,9 @@ TORCH_STR_DTYPE = {name: cls for cls, name in TORCH_DTYPE_STR.items()}
 
 def torch_tensor_serializer(worker: AbstractWorker, tensor) -> bin:
     """Strategy to serialize a tensor using Torch saver"""
+    if not tensor.is_sparse and tensor.storage().size() != tensor.numel():
+        # torch.save writes the whole storage of a view, so keep only the values viewed
+        tensor = tensor.detach().clone().requires_grad_(tensor.requires_grad)
     binary_stream = io.BytesIO()
     torch.save(tensor, binary_stream)
     return binary_stream.getvalue()
@@ -13,10 +13,8 @@ from syft import codes
 from syft.generic.frameworks.hook import hook_args
 from syft.generic.frameworks.remote import Remote
 from syft.generic.frameworks.types import FrameworkTensorType
-from syft.generic.frameworks.types import FrameworkTensor
 from syft.generic.frameworks.types import FrameworkShape
 from syft.generic.object_storage import ObjectStorage
-from syft.generic.object import AbstractObject
 from syft.generic.tensor import AbstractTensor
 from syft.generic.pointers.object_pointer import ObjectPointer
 from syft.generic.pointers.pointer_tensor import PointerTensor
@@ -907,15 +905,19 @@ class BaseWorker(AbstractWorker, ObjectStorage):
 
         return None
 
-    def search(self, query: Union[List[Union[str, int]], str, int]) -> List[PointerTensor]:
+    def search(
+        self, query: Union[List[Union[str, int]], str, int], description_prefix: bool = False
+    ) -> List[PointerTensor]:
         """Search for a match between the query terms and a tensor's Id, Tag, or Description.
 
         Note that the query is an AND query meaning that every item in the list of strings (query*)
         must be found somewhere on the tensor in order for it to be included in the results.
+        The search is answered using the index of the objects stored, see find_obj_ids.
 
         Args:
             query: A list of strings to match against.
-            me: A reference to the worker calling the search.
+            description_prefix: If True, a term matches a description if one of its words
+                starts with the term, otherwise the term can be any part of the description.
 
         Returns:
             A list of PointerTensors.
@@ -923,38 +925,22 @@ class BaseWorker(AbstractWorker, ObjectStorage):
         if isinstance(query, (str, int)):
             query = [query]
 
+        terms = []
+        for query_item in query:
+            # If deserialization produced a bytes object instead of a string,
+            # make sure it's turned back to a string or a fair comparison.
+            if isinstance(query_item, bytes):
+                query_item = query_item.decode("ascii")
+            terms.append(str(query_item))
+
         results = list()
-        for key, obj in self._objects.items():
-            found_something = True
-            for query_item in query:
-                # If deserialization produced a bytes object instead of a string,
-                # make sure it's turned back to a string or a fair comparison.
-                if isinstance(query_item, bytes):
-                    query_item = query_item.decode("ascii")
-                query_item = str(query_item)
-
-                match = False
-                if query_item == str(key):
-                    match = True
-
-                if isinstance(obj, (AbstractObject, FrameworkTensor)):
-                    if obj.tags is not None:
-                        if query_item in obj.tags:
-                            match = True
-
-                    if obj.description is not None:
-                        if query_item in obj.description:
-                            match = True
-
-                if not match:
-                    found_something = False
-
-            if found_something:
-                # set garbage_collect_data to False because if we're searching
-                # for a tensor we don't own, then it's probably someone else's
-                # decision to decide when to delete the tensor.
-                ptr = obj.create_pointer(garbage_collect_data=False, owner=sy.local_worker).wrap()
-                results.append(ptr)
+        for obj_id in self.find_obj_ids(terms, description_prefix=description_prefix):
+            obj = self._objects[obj_id]
+            # set garbage_collect_data to False because if we're searching
+            # for a tensor we don't own, then it's probably someone else's
+            # decision to decide when to delete the tensor.
+            ptr = obj.create_pointer(garbage_collect_data=False, owner=sy.local_worker).wrap()
+            results.append(ptr)
 
         return results
 
@@ -7,6 +7,7 @@ import websocket
 import websockets
 import logging
 import ssl
+import threading
 import time
 
 import syft as sy
@@ -54,6 +55,9 @@ class WebsocketClientWorker(BaseWorker):
         # Secure flag adds a secure layer applying cryptography and authentication
         self.secure = secure
         self.ws = None
+        # serializes the request/response exchanges made from several threads, like
+        # when a FederatedDataLoader prefetches batches
+        self._ws_lock = threading.RLock()
         self.connect()
 
     @property
@@ -89,6 +93,10 @@ class WebsocketClientWorker(BaseWorker):
 
     def _recv_msg(self, message: bin) -> bin:
         """Forwards a message to the WebsocketServerWorker"""
+        with self._ws_lock:
+            return self._forward_and_reconnect(message)
+
+    def _forward_and_reconnect(self, message: bin) -> bin:
         response = self._forward_to_websocket_server_worker(message)
         if not self.ws.connected:
             logger.warning("Websocket connection closed (worker: %s)", self.id)
@@ -118,7 +126,9 @@ class WebsocketClientWorker(BaseWorker):
     def list_objects_remote(self):
         return self._send_msg_and_deserialize("list_objects")
 
-    def objects_count_remote(self):
+    def objects_count_remote(self, stats: bool = False):
+        if stats:
+            return dict(self._send_msg_and_deserialize("objects_count", stats=True))
         return self._send_msg_and_deserialize("objects_count")
 
     def clear_objects_remote(self):
@@ -188,22 +198,53 @@ class WebsocketClientWorker(BaseWorker):
         response = self._send_msg(serialized_message)
         return sy.serde.deserialize(response)
 
+    def held_obj_ids(self, obj_ids: List[Union[int, str]]) -> List[Union[int, str]]:
+        """Call the held_obj_ids() method on the remote worker (WebsocketServerWorker instance).
+
+        Args:
+            obj_ids: A list of object ids.
+
+        Returns:
+            See return value of the FederatedClient.held_obj_ids() method.
+        """
+        return self._send_msg_and_deserialize("held_obj_ids", obj_ids)
+
+    def model_update(self, top_k_ratio: float = None, quantize: bool = False) -> bytes:
+        """Call the model_update() method on the remote worker (WebsocketServerWorker instance).
+
+        Args:
+            top_k_ratio: Optional fraction of the largest values of the delta to send.
+            quantize: Whether the values sent are quantized on 8 bits.
+
+        Returns:
+            See return value of the FederatedClient.model_update() method.
+        """
+        return self._send_msg_and_deserialize(
+            "model_update", top_k_ratio=top_k_ratio, quantize=quantize
+        )
+
     def evaluate(
         self,
-        dataset_key: str,
+        dataset_key: Union[str, List[str]],
         return_histograms: bool = False,
         nr_bins: int = -1,
         return_loss=True,
         return_raw_accuracy: bool = True,
+        device: str = "cpu",
+        return_confusion_matrix: bool = False,
     ):
         """Call the evaluate() method on the remote worker (WebsocketServerWorker instance).
 
         Args:
-            dataset_key: Identifier of the local dataset that shall be used for training.
+            dataset_key: Identifier of the local dataset that shall be used for training,
+                or list of identifiers to evaluate the model on several datasets at once.
             return_histograms: If True, calculate the histograms of predicted classes.
             nr_bins: Used together with calculate_histograms. Provide the number of classes/bins.
             return_loss: If True, loss is calculated additionally.
             return_raw_accuracy: If True, return nr_correct_predictions and nr_predictions
+            device: The device on which the remote worker evaluates the model.
+            return_confusion_matrix: If True, return the confusion matrix and the per class
+                precision and recall.
 
         Returns:
             Dictionary containing depending on the provided flags:
@@ -212,6 +253,10 @@ class WebsocketClientWorker(BaseWorker):
                 * nr_predictions: total number of predictions.
                 * histogram_predictions: histogram of predictions.
                 * histogram_target: histogram of target values in the dataset.
+                * confusion_matrix: confusion matrix of the predictions.
+                * precision_per_class: precision of the predictions of each class.
+                * recall_per_class: recall of the predictions of each class.
+            With a list of dataset keys, a dictionary mapping each key to its result.
         """
 
         return self._send_msg_and_deserialize(
@@ -221,6 +266,8 @@ class WebsocketClientWorker(BaseWorker):
             nr_bins=nr_bins,
             return_loss=return_loss,
             return_raw_accuracy=return_raw_accuracy,
+            device=device,
+            return_confusion_matrix=return_confusion_matrix,
         )
 
     def __str__(self):
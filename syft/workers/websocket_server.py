@@ -35,6 +35,9 @@ class WebsocketServerWorker(VirtualWorker, FederatedClient):
         loop=None,
         cert_path: str = None,
         key_path: str = None,
+        memory_budget: int = None,
+        object_ttl: float = None,
+        spill_dir: str = None,
     ):
         """This is a simple extension to normal workers wherein
         all messages are passed over websockets. Note that because
@@ -56,10 +59,18 @@ class WebsocketServerWorker(VirtualWorker, FederatedClient):
                 yourself
             cert_path: path to used secure certificate, only needed for secure connections
             key_path: path to secure key, only needed for secure connections
+            memory_budget: optional maximum number of bytes of tensor data the worker
+                keeps in memory, least recently used objects being evicted beyond it.
+                Objects the worker is initialized with are never evicted.
+            object_ttl: optional number of seconds after which an object which was
+                not accessed is evicted, for instance when its client died.
+            spill_dir: optional directory where evicted tensors are spilled, and from
+                which they are transparently loaded back when accessed.
         """
 
         self.port = port
         self.host = host
+        self.object_ttl = object_ttl
         self.cert_path = cert_path
         self.key_path = key_path
 
@@ -76,6 +87,9 @@ class WebsocketServerWorker(VirtualWorker, FederatedClient):
         # call BaseWorker constructor
         super().__init__(hook=hook, id=id, data=data, log_msgs=log_msgs, verbose=verbose)
 
+        if memory_budget is not None or object_ttl is not None:
+            self.limit_memory(memory_budget=memory_budget, ttl=object_ttl, spill_dir=spill_dir)
+
     async def _consumer_handler(self, websocket: websockets.WebSocketCommonProtocol):
         """This handler listens for messages from WebsocketClientWorker
         objects.
@@ -171,14 +185,27 @@ class WebsocketServerWorker(VirtualWorker, FederatedClient):
             )
 
         asyncio.get_event_loop().run_until_complete(start_server)
+        if self.object_ttl is not None:
+            # Objects are otherwise only expired when the worker receives messages
+            asyncio.get_event_loop().create_task(self._evict_expired_objects_periodically())
         print("Serving. Press CTRL-C to stop.")
         try:
             asyncio.get_event_loop().run_forever()
         except KeyboardInterrupt:
             logging.info("Websocket server stopped.")
 
+    async def _evict_expired_objects_periodically(self):
+        """Evicts the expired objects twice per ttl, even when no client is connected."""
+        while True:
+            await asyncio.sleep(self.object_ttl / 2)
+            self.evict_expired_objects()
+
     def list_objects(self, *args):
         return str(self._objects)
 
-    def objects_count(self, *args):
+    def objects_count(self, *args, stats: bool = False):
+        if stats:
+            # A dict response would be registered like a tensor, so the items are sent
+            return tuple(self.storage_stats().items())
+        self.evict_expired_objects()
         return len(self._objects)
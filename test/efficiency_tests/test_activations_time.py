@@ -16,3 +16,29 @@ def test_activation(activation, hook, workers):
 
     x = torch.randn([10, 10]).fix_precision().share(bob, alice, crypto_provider=crypto_prov)
     activation_func(x)
+
+
+@pytest.mark.parametrize("preset", ["fast", "balanced", "accurate"])
+@pytest.mark.parametrize("function", ["exp", "sigmoid", "log"])
+@assert_time(max_time=20)
+def test_approximation_presets(function, preset, hook, workers):
+
+    bob = workers["bob"]
+    alice = workers["alice"]
+    crypto_prov = workers["james"]
+
+    x = torch.rand([10, 10]).fix_precision().share(bob, alice, crypto_provider=crypto_prov)
+    getattr(x, function)(preset=preset)
+
+
+@pytest.mark.parametrize("preset", ["fast", "balanced", "accurate"])
+@assert_time(max_time=10)
+def test_inverse_presets(preset, hook, workers):
+
+    bob = workers["bob"]
+    alice = workers["alice"]
+    crypto_prov = workers["james"]
+
+    x = torch.eye(10) + torch.rand([10, 10]) / 10
+    x = x.fix_precision().share(bob, alice, crypto_provider=crypto_prov)
+    x.inverse(preset=preset)
@@ -0,0 +1,53 @@
+import time
+
+import torch
+
+from syft.frameworks.torch.tensors.interpreters.crt_precision import _moduli_for_fields
+from test.efficiency_tests.assertions import assert_time
+
+
+def _dict_based_operations(x, y, moduli):
+    """Runs the operations of test_crt_precision_operations on one FixedPrecisionTensor
+    per modulus, as CRTPrecisionTensor did before its residues were stacked."""
+    results = {}
+    for mod in moduli:
+        x_mod = x.fix_precision(field=mod, precision_fractional=2)
+        y_mod = y.fix_precision(field=mod, precision_fractional=2)
+        results[mod] = (x_mod * y_mod + x_mod - y_mod).child.child % mod
+    return results
+
+
+@assert_time(max_time=5)
+def test_crt_precision_operations():
+    x = torch.randint(-400, 400, (100000,)).float() / 100
+    y = torch.randint(-400, 400, (100000,)).float() / 100
+
+    crt_x = x.fix_precision(field_type="int128", precision_fractional=2, storage="crt")
+    crt_y = y.fix_precision(field_type="int128", precision_fractional=2, storage="crt")
+
+    for _ in range(10):
+        result = crt_x * crt_y + crt_x - crt_y
+
+    restored = result.float_precision()
+    assert restored.shape == x.shape
+
+
+def test_crt_precision_stacked_faster_than_dict():
+    moduli = _moduli_for_fields["int128"]
+    x = torch.randint(-400, 400, (1000,)).float() / 100
+    y = torch.randint(-400, 400, (1000,)).float() / 100
+
+    t0 = time.time()
+    crt_x = x.fix_precision(field_type="int128", precision_fractional=2, storage="crt")
+    crt_y = y.fix_precision(field_type="int128", precision_fractional=2, storage="crt")
+    stacked = (crt_x * crt_y + crt_x - crt_y).child.child
+    stacked_time = time.time() - t0
+
+    t0 = time.time()
+    residues = _dict_based_operations(x, y, moduli)
+    dict_time = time.time() - t0
+
+    for mod, residue in zip(moduli, stacked):
+        assert (residue == residues[mod]).all()
+
+    assert stacked_time < dict_time, f"stacked: {stacked_time:.3f}s, dict: {dict_time:.3f}s"
@@ -0,0 +1,51 @@
+import time
+
+import torch
+
+import syft as sy
+from syft.federated.federated_client import FederatedClient
+from syft.federated.train_config import TrainConfig
+from syft.generic.pointers.object_wrapper import ObjectWrapper
+from test.efficiency_tests.assertions import assert_time
+
+
+class SlowTransformDataset(torch.utils.data.Dataset):
+    """Synthetic dataset whose samples go through a costly transform."""
+
+    def __init__(self, nr_samples):
+        self.data = torch.rand(nr_samples, 16)
+        self.targets = torch.rand(nr_samples, 1)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        time.sleep(0.005)  # e.g. decoding and augmenting an image
+        return self.data[index], self.targets[index]
+
+
+@assert_time(max_time=6)
+def test_fit_with_data_loading_workers():
+    fed_client = FederatedClient()
+    fed_client.add_dataset(SlowTransformDataset(1600), key="slow")
+
+    model = torch.jit.trace(torch.nn.Linear(16, 1), torch.rand(1, 16))
+
+    def loss_fn(pred, target):
+        return ((target - pred) ** 2).mean()
+
+    fed_client.set_obj(ObjectWrapper(obj=model, id="model"))
+    fed_client.set_obj(ObjectWrapper(obj=loss_fn, id="loss_fn"))
+    fed_client.set_obj(
+        TrainConfig(
+            model=None,
+            loss_fn=None,
+            model_id="model",
+            loss_fn_id="loss_fn",
+            batch_size=32,
+            num_workers=4,
+        )
+    )
+
+    # 1600 samples take 8s to load in the main process
+    fed_client.fit(dataset_key="slow")
@@ -0,0 +1,34 @@
+import time
+
+import torch
+
+import syft as sy
+from test.efficiency_tests.assertions import assert_time
+
+
+@assert_time(max_time=30)
+def test_federated_dataloader_websocket_batches(hook, start_remote_worker):
+    servers, remote_proxies = [], []
+    for i, port in enumerate((8774, 8775)):
+        server, remote_proxy = start_remote_worker(id=f"loader{i}", hook=hook, port=port)
+        servers.append(server)
+        remote_proxies.append(remote_proxy)
+
+    datasets = [
+        sy.BaseDataset(torch.rand(640, 1, 28, 28), torch.randint(0, 10, (640,))).send(worker)
+        for worker in remote_proxies
+    ]
+    fdataloader = sy.FederatedDataLoader(sy.FederatedDataset(datasets), batch_size=64)
+
+    t0 = time.time()
+    n_batches = sum(1 for _ in fdataloader)
+    batches_per_second = n_batches / (time.time() - t0)
+
+    assert n_batches == 20
+    assert batches_per_second > 2, f"{batches_per_second:.1f} batches per second"
+
+    for remote_proxy, server in zip(remote_proxies, servers):
+        remote_proxy.close()
+        time.sleep(0.1)
+        remote_proxy.remove_worker_from_local_worker_registry()
+        server.terminate()
@@ -0,0 +1,20 @@
+import torch
+import torchvision
+
+from syft.frameworks.torch.fl import utils
+from test.efficiency_tests.assertions import assert_time
+
+
+@assert_time(max_time=40)
+def test_federated_avg_resnet_updates():
+    model = torchvision.models.resnet18()
+    averager = utils.ModelAverager()
+
+    # Updates are folded in as they arrive, without holding all of them in memory
+    for i in range(100):
+        with torch.no_grad():
+            for param in model.parameters():
+                param.add_(0.01)
+        averager.add(model, weight=i + 1)
+
+    averager.assign_to(torchvision.models.resnet18())
@@ -0,0 +1,11 @@
+import subprocess
+import sys
+
+from test.efficiency_tests.assertions import assert_time
+
+
+@assert_time(max_time=10)
+def test_hook_startup():
+    # torch is already hooked in the test session, so the hooking process is
+    # measured from a fresh interpreter
+    subprocess.run([sys.executable, "-c", "import torch, syft; syft.TorchHook(torch)"], check=True)
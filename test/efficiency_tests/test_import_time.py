@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+
+def _import_time(module):
+    """Imports module in a fresh interpreter with `python -X importtime`.
+
+    Returns:
+        The total import time in seconds and the set of imported module names.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    total_us = 0
+    imported = set()
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        imported.add(name.strip())
+        # Nested imports are indented, their time is already counted by their parent
+        if len(name) - len(name.lstrip()) == 1:
+            total_us += int(cumulative)
+
+    return total_us / 1e6, imported
+
+
+def test_import_syft_time():
+    total, imported = _import_time("syft")
+
+    for heavy_module in ["requests", "websockets", "phe", "syft.serde", "syft.sandbox"]:
+        assert heavy_module not in imported
+
+    assert total < 10, f"import syft took {total:.2f}s (-X importtime) over {len(imported)} modules"
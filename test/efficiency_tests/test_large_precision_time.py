@@ -0,0 +1,14 @@
+import torch
+
+from test.efficiency_tests.assertions import assert_time
+
+
+@assert_time(max_time=15)
+def test_large_precision_encode_decode():
+    x = torch.randn(1000000)
+
+    # Packing and unpacking are vectorized over the 1M elements
+    enlarged = x.fix_prec(internal_type=torch.int16, precision_fractional=128)
+    restored = enlarged.float_precision()
+
+    assert (restored == x).all()
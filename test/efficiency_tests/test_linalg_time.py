@@ -2,6 +2,7 @@ import pytest
 import torch
 import syft as sy
 from syft.frameworks.torch.linalg import inv_sym
+from syft.frameworks.torch.linalg import qr
 from syft.frameworks.torch.linalg.operations import _norm_mpc
 from test.efficiency_tests.assertions import assert_time
 
@@ -18,3 +19,52 @@ def test_inv_sym(hook, workers):
     x = torch.randn(N, K).fix_precision().share(bob, alice, crypto_provider=crypto_prov)
     gram = x.t().matmul(x)
     gram_inv = inv_sym(gram)
+
+
+@pytest.mark.parametrize("n", [50, 200])
+@assert_time(max_time=30)
+def test_inv_sym_remote(hook, workers, n):
+    torch.manual_seed(42)
+    bob = workers["bob"]
+
+    x = torch.randn(2 * n, n)
+    gram = x.t().matmul(x).send(bob)
+    gram_inv = inv_sym(gram)
+
+
+@pytest.mark.parametrize("n", [50, 200])
+@assert_time(max_time=30)
+def test_qr_remote(hook, workers, n):
+    torch.manual_seed(42)
+    bob = workers["bob"]
+
+    t = torch.randn(2 * n, n).send(bob)
+    Q, R = qr(t)
+
+
+@pytest.mark.parametrize("block_size", [1, 16])
+@assert_time(max_time=600)
+def test_inv_sym_shared(hook, workers, block_size):
+    torch.manual_seed(42)  # Truncation might not always work so we set the random seed
+    n = 50
+    bob = workers["bob"]
+    alice = workers["alice"]
+    crypto_prov = workers["james"]
+
+    x = torch.randn(2 * n, n)
+    gram = x.t().matmul(x).fix_precision().share(bob, alice, crypto_provider=crypto_prov)
+    gram_inv = inv_sym(gram, block_size=block_size)
+
+
+@pytest.mark.parametrize("block_size", [1, 16])
+@assert_time(max_time=1200)
+def test_qr_shared(hook, workers, block_size):
+    torch.manual_seed(0)  # Truncation might not always work so we set the random seed
+    n = 50
+    bob = workers["bob"]
+    alice = workers["alice"]
+    crypto_prov = workers["james"]
+
+    t = torch.randn(2 * n, n)
+    t_sh = t.fix_precision(precision_fractional=6).share(bob, alice, crypto_provider=crypto_prov)
+    Q, R = qr(t_sh, norm_factor=(2 * n * n) ** (1 / 2), block_size=block_size)
@@ -0,0 +1,36 @@
+import pytest
+import torch
+import torch.nn.functional as F
+
+from test.efficiency_tests.assertions import assert_time
+
+
+@assert_time(max_time=10)
+def test_linear(hook, workers):
+
+    bob = workers["bob"]
+    alice = workers["alice"]
+    crypto_prov = workers["james"]
+
+    x = torch.randn([32, 100]).fix_precision().share(bob, alice, crypto_provider=crypto_prov)
+    weight = torch.randn([10, 100]).fix_precision().share(bob, alice, crypto_provider=crypto_prov)
+    bias = torch.randn([10]).fix_precision().share(bob, alice, crypto_provider=crypto_prov)
+
+    for _ in range(10):
+        F.linear(x, weight, bias)
+
+
+@pytest.mark.parametrize("groups", [1, 2])
+@assert_time(max_time=20)
+def test_conv2d(groups, hook, workers):
+
+    bob = workers["bob"]
+    alice = workers["alice"]
+    crypto_prov = workers["james"]
+
+    x = torch.randn([4, 2, 8, 8]).fix_precision().share(bob, alice, crypto_provider=crypto_prov)
+    weight = torch.randn([4, 2 // groups, 3, 3]).fix_precision()
+    weight = weight.share(bob, alice, crypto_provider=crypto_prov)
+    bias = torch.randn([4]).fix_precision().share(bob, alice, crypto_provider=crypto_prov)
+
+    torch.conv2d(x, weight, bias=bias, groups=groups)
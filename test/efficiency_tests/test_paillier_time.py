@@ -0,0 +1,49 @@
+import os
+import time
+
+import torch
+
+import syft as sy
+from test.efficiency_tests.assertions import assert_time
+
+# Minimum number of values encrypted or decrypted per second and per core with 1024 bits keys
+MIN_THROUGHPUT_PER_CORE = 20
+
+
+@assert_time(max_time=60)
+def test_paillier_throughput_per_core():
+    from syft.frameworks.torch.he import paillier
+
+    pub, pri = sy.keygen(n_length=1024)
+    x = torch.randn(64 * paillier.CHUNK_SIZE)
+    nr_cores = os.cpu_count() or 1
+
+    t0 = time.time()
+    encrypted = x.encrypt(pub)
+    encrypt_time = time.time() - t0
+
+    t0 = time.time()
+    decrypted = encrypted.decrypt(pri)
+    decrypt_time = time.time() - t0
+
+    assert (decrypted == x).all()
+    # Values per second and per core
+    assert x.numel() / encrypt_time / nr_cores > MIN_THROUGHPUT_PER_CORE
+    assert x.numel() / decrypt_time / nr_cores > MIN_THROUGHPUT_PER_CORE
+
+
+@assert_time(max_time=30)
+def test_paillier_encrypt_with_obfuscators():
+    from syft.frameworks.torch.he import paillier
+
+    pub, pri = sy.keygen(n_length=1024)
+    x = torch.randn(8 * paillier.CHUNK_SIZE)
+
+    # Generated offline, the obfuscators are not timed
+    paillier.precompute_obfuscators(pub, x.numel())
+
+    t0 = time.time()
+    encrypted = x.encrypt(pub)
+    assert time.time() - t0 < 1
+
+    assert (encrypted.decrypt(pri) == x).all()
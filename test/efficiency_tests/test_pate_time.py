@@ -0,0 +1,20 @@
+import numpy as np
+
+from syft.frameworks.torch.dp import pate
+from test.efficiency_tests.assertions import assert_time
+
+
+@assert_time(max_time=10)
+def test_perform_analysis():
+    np.random.seed(0)
+    num_teachers, num_examples, num_labels = (250, 10000, 10)
+    preds = (np.random.rand(num_teachers, num_examples) * num_labels).astype(int)
+    # Teachers agree on half of the examples, which have a low data dependent cost
+    preds[:, : num_examples // 2] = np.random.randint(num_labels, size=num_examples // 2)
+    indices = np.random.randint(num_examples, size=num_examples)
+
+    data_dep_eps, data_ind_eps = pate.perform_analysis(
+        teacher_preds=preds, indices=indices, noise_eps=0.1, delta=1e-5
+    )
+
+    assert data_dep_eps < data_ind_eps
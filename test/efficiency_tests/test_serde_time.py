@@ -0,0 +1,29 @@
+import torch
+import syft as sy
+from syft.messaging.message import Operation
+from syft.serde import msgpack
+from test.efficiency_tests.assertions import assert_time
+
+
+@assert_time(max_time=10)
+def test_serde_operations(workers):
+    bob = workers["bob"]
+    me = workers["me"]
+
+    x = torch.tensor([1.0, 2.0]).send(bob)
+    y = torch.tensor([3.0, 4.0]).send(bob)
+
+    # Operations as sent by pointers when running commands on remote tensors
+    operations = []
+    for i in range(2000):
+        operations.append(Operation("__add__", x.child, (y.child,), {}, [sy.ID_PROVIDER.pop()]))
+        operations.append(
+            Operation("torch.cat", None, ([x.child, y.child],), {"dim": 0}, [sy.ID_PROVIDER.pop()])
+        )
+        operations.append(
+            Operation("view", x.child, (-1, 1), {}, [sy.ID_PROVIDER.pop(), sy.ID_PROVIDER.pop()])
+        )
+
+    for operation in operations:
+        binary = msgpack.serialize(operation, worker=me)
+        msgpack.deserialize(binary, worker=bob)
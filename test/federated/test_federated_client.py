@@ -298,3 +298,70 @@ def test_evaluate():  # pragma: no cover
     assert torch.norm(torch.tensor(hist_target - hist_pred_after)) < torch.norm(
         torch.tensor(hist_target - hist_pred_before)
     )
+
+
+def test_data_loader_args():
+    data, target = utils.iris_data_partial()
+
+    fed_client = FederatedClient()
+    fed_client.add_dataset(sy.BaseDataset(data, target), key="iris")
+
+    train_config = TrainConfig(model=None, loss_fn=None, batch_size=8, drop_last=True)
+    fed_client.set_obj(train_config)
+
+    data_loader = fed_client._get_data_loader("iris", drop_last=train_config.drop_last)
+    assert len(data_loader) == 3  # 30 samples, the last incomplete batch is dropped
+    assert fed_client._get_data_loader("iris") is not data_loader
+
+    train_config = TrainConfig(
+        model=None, loss_fn=None, batch_size=8, num_workers=2, persistent_workers=True
+    )
+    fed_client.set_obj(train_config)
+
+    data_loader = fed_client._get_data_loader("iris")
+    assert data_loader.num_workers == 2
+    assert len(data_loader) == 4
+    # The data loader is kept between calls until a new TrainConfig is received
+    assert fed_client._get_data_loader("iris") is data_loader
+    fed_client.set_obj(TrainConfig(model=None, loss_fn=None))
+    assert fed_client._get_data_loader("iris") is not data_loader
+
+
+def test_evaluate_confusion_matrix():
+    data, target = utils.iris_data_partial()
+
+    fed_client = FederatedClient()
+    fed_client.add_dataset(sy.BaseDataset(data, target), key="iris")
+    fed_client.add_dataset(sy.BaseDataset(data[:12], target[:12]), key="iris_head")
+
+    def loss_fn(pred, target):
+        return torch.nn.functional.cross_entropy(input=pred, target=target)
+
+    model = torch.jit.trace(torch.nn.Linear(4, 3), data)
+    fed_client.set_obj(ObjectWrapper(obj=model, id=0))
+    fed_client.set_obj(ObjectWrapper(obj=loss_fn, id=1))
+    fed_client.set_obj(
+        TrainConfig(model=None, loss_fn=None, model_id=0, loss_fn_id=1, batch_size=8)
+    )
+
+    results = fed_client.evaluate(
+        dataset_key=["iris", "iris_head"], return_histograms=True, return_confusion_matrix=True
+    )
+    assert set(results) == {"iris", "iris_head"}
+
+    result = results["iris"]
+    confusion_matrix = result["confusion_matrix"]
+    # The number of classes is taken from the model outputs
+    assert confusion_matrix.shape == (3, 3)
+    assert (confusion_matrix.sum(axis=1) == result["histogram_target"]).all()
+    assert (confusion_matrix.sum(axis=0) == result["histogram_predictions"]).all()
+    assert confusion_matrix.trace() == result["nr_correct_predictions"]
+    assert result["recall_per_class"] * 10 == pytest.approx(confusion_matrix.diagonal())
+
+    pred = model(data).argmax(dim=1)
+    assert result["nr_correct_predictions"] == (pred == target).sum().item()
+    expected_loss = sum(loss_fn(model(x), y) for x, y in zip(data.split(8), target.split(8)))
+    assert result["loss"] == pytest.approx(expected_loss.item() / 30, rel=1e-5)
+    assert results["iris_head"]["nr_predictions"] == 12
+    result = fed_client.evaluate(dataset_key="iris_head")
+    assert result == {key: results["iris_head"][key] for key in result}
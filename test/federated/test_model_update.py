@@ -0,0 +1,109 @@
+import time
+
+import pytest
+import torch
+import torch.nn as nn
+
+import syft as sy
+from syft.federated import model_update
+from syft.frameworks.torch.fl import utils
+from syft.workers.websocket_server import WebsocketServerWorker
+
+from test.conftest import instantiate_websocket_client_worker
+
+
+def test_update_encoder_without_compression():
+    encoder = model_update.UpdateEncoder()
+    delta = torch.tensor([0.5, -1.0, 2.0])
+
+    encoded = encoder.encode(delta)
+
+    assert (model_update.decode_update(encoded) == delta).all()
+    assert encoder.residual is None
+
+
+def test_update_encoder_top_k_error_feedback():
+    encoder = model_update.UpdateEncoder(top_k_ratio=0.5)
+    delta = torch.tensor([4.0, 3.0, 2.0, 1.0])
+
+    first = model_update.decode_update(encoder.encode(delta))
+    assert first.tolist() == [4.0, 3.0, 0.0, 0.0]
+    assert encoder.residual.tolist() == [0.0, 0.0, 2.0, 1.0]
+
+    # the values dropped are added to the next delta
+    second = model_update.decode_update(encoder.encode(delta))
+    assert second.tolist() == [4.0, 0.0, 4.0, 0.0]
+    assert (first + second + encoder.residual == 2 * delta).all()
+
+
+def test_update_encoder_quantization():
+    encoder = model_update.UpdateEncoder(quantize=True)
+    delta = torch.linspace(-1, 1, 1000)
+
+    encoded = encoder.encode(delta)
+    assert encoded["values"].dtype == torch.uint8
+
+    decoded = model_update.decode_update(encoded)
+    assert (decoded - delta).abs().max() <= encoded["scale"] / 2 + 1e-6
+    assert torch.allclose(decoded + encoder.residual, delta)
+
+    with pytest.raises(ValueError):
+        model_update.UpdateEncoder(top_k_ratio=2)
+
+
+def test_federated_client_model_update(hook, workers):
+    alice = workers["alice"]
+    data, target = utils.create_gaussian_mixture_toy_data(nr_samples=20)
+    alice.add_dataset(sy.BaseDataset(data, target), key="update_data")
+
+    @hook.torch.jit.script
+    def loss_fn(pred, target):
+        return ((target.float() - pred.float()) ** 2).mean()
+
+    model = torch.jit.trace(nn.Linear(2, 1), data)
+    params = model_update.flatten_parameters(model)
+
+    train_config = sy.TrainConfig(model=model, loss_fn=loss_fn, batch_size=4)
+    train_config.send(alice)
+    alice.fit(dataset_key="update_data")
+    alice.fit(dataset_key="update_data")
+
+    delta = model_update.decode_update(alice.model_update(top_k_ratio=1.0, quantize=True))
+    trained_params = model_update.flatten_parameters(train_config.model_ptr.get().obj)
+
+    assert torch.allclose(params + delta, trained_params, atol=1e-2)
+
+    alice.remove_dataset("update_data")
+
+
+def test_websocket_model_update(hook, start_proc):  # pragma: no cover
+    data, target = utils.create_gaussian_mixture_toy_data(nr_samples=20)
+    dataset_key = "update_data"
+
+    kwargs = {"id": "fed_model_update", "host": "localhost", "port": 8804, "hook": hook}
+    server = start_proc(
+        WebsocketServerWorker, dataset=(sy.BaseDataset(data, target), dataset_key), **kwargs
+    )
+    time.sleep(0.1)
+    remote_proxy = instantiate_websocket_client_worker(**kwargs)
+
+    @hook.torch.jit.script
+    def loss_fn(pred, target):
+        return ((target.float() - pred.float()) ** 2).mean()
+
+    model = torch.jit.trace(nn.Linear(2, 1), data)
+    params = model_update.flatten_parameters(model)
+
+    train_config = sy.TrainConfig(model=model, loss_fn=loss_fn, batch_size=4)
+    train_config.send(remote_proxy)
+    remote_proxy.fit(dataset_key=dataset_key)
+
+    update = remote_proxy.model_update(top_k_ratio=1.0, quantize=True)
+    assert isinstance(update, bytes)
+    delta = model_update.decode_update(update)
+    trained_params = model_update.flatten_parameters(train_config.model_ptr.get().obj)
+
+    assert torch.allclose(params + delta, trained_params, atol=1e-2)
+
+    remote_proxy.close()
+    server.terminate()
@@ -0,0 +1,116 @@
+import threading
+import time
+
+import torch
+import torch.nn as nn
+
+import syft as sy
+from syft.frameworks.torch.fl import utils
+
+
+def _prepare_round(hook, workers, dataset_key):
+    data, target = utils.create_gaussian_mixture_toy_data(nr_samples=20)
+    for worker in workers:
+        worker.add_dataset(sy.BaseDataset(data, target), key=dataset_key)
+
+    @hook.torch.jit.script
+    def loss_fn(pred, target):
+        return ((target.float() - pred.float()) ** 2).mean()
+
+    model = torch.jit.trace(nn.Linear(2, 1), data)
+    return model, loss_fn
+
+
+def test_round_coordinator_fit_and_average(hook, workers):
+    alice, bob = workers["alice"], workers["bob"]
+    dataset_key = "round_data"
+    model, loss_fn = _prepare_round(hook, [alice, bob], dataset_key)
+    params_before = utils.flatten_parameters(model)
+
+    coordinator = sy.RoundCoordinator([alice, bob], dataset_key, batch_size=4, timeout=60)
+    updates = coordinator.fit(model, loss_fn)
+
+    assert set(updates.keys()) == {"alice", "bob"}
+    assert coordinator.stragglers == []
+
+    new_model = coordinator.fit_and_average(model, loss_fn)
+    assert not torch.allclose(utils.flatten_parameters(new_model), params_before)
+
+    for worker in (alice, bob):
+        worker.remove_dataset(dataset_key)
+
+
+def test_round_coordinator_drops_stragglers(hook, workers):
+    alice, bob = workers["alice"], workers["bob"]
+    dataset_key = "round_data"
+    model, loss_fn = _prepare_round(hook, [alice, bob], dataset_key)
+
+    # bob is much slower than alice to train
+    bob_fit = bob.fit
+
+    def slow_fit(*args, **kwargs):
+        time.sleep(2)
+        return bob_fit(*args, **kwargs)
+
+    bob.fit = slow_fit
+
+    coordinator = sy.RoundCoordinator([alice, bob], dataset_key, batch_size=4, nr_updates=1)
+    updates = coordinator.fit(model, loss_fn)
+    assert list(updates.keys()) == ["alice"]
+    assert coordinator.stragglers == ["bob"]
+    coordinator.close()
+
+    coordinator = sy.RoundCoordinator([alice, bob], dataset_key, batch_size=4, timeout=1)
+    updates = coordinator.fit(model, loss_fn)
+    assert list(updates.keys()) == ["alice"]
+    assert coordinator.stragglers == ["bob"]
+
+    # let the stragglers complete before cleaning up
+    coordinator.close()
+    del bob.fit
+    for worker in (alice, bob):
+        worker.remove_dataset(dataset_key)
+
+
+def test_round_coordinator_waits_for_late_results(hook, workers):
+    alice, bob = workers["alice"], workers["bob"]
+    dataset_key = "round_data"
+    model, loss_fn = _prepare_round(hook, [alice, bob], dataset_key)
+
+    # bob's first fit completes after the deadline of the first round
+    bob_fit = bob.fit
+    lock = threading.Lock()
+    calls = {"count": 0, "active": 0, "max_active": 0}
+
+    def slow_first_fit(*args, **kwargs):
+        with lock:
+            calls["count"] += 1
+            calls["active"] += 1
+            calls["max_active"] = max(calls["max_active"], calls["active"])
+            is_first = calls["count"] == 1
+        try:
+            if is_first:
+                time.sleep(2)
+            return bob_fit(*args, **kwargs)
+        finally:
+            with lock:
+                calls["active"] -= 1
+
+    bob.fit = slow_first_fit
+
+    coordinator = sy.RoundCoordinator([alice, bob], dataset_key, batch_size=4, timeout=1.5)
+    updates = coordinator.fit(model, loss_fn)
+    assert list(updates.keys()) == ["alice"]
+    assert coordinator.stragglers == ["bob"]
+
+    # The next round starts once bob's late fit completed, whose result is dropped
+    updates = coordinator.fit(model, loss_fn)
+    assert set(updates.keys()) == {"alice", "bob"}
+    assert coordinator.stragglers == []
+    assert calls["count"] == 2
+    assert calls["max_active"] == 1
+
+    coordinator.close()
+    del bob.fit
+    for worker in (alice, bob):
+        worker.remove_dataset(dataset_key)
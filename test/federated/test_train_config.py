@@ -431,3 +431,30 @@ def test_train_config_with_jit_trace_sync(hook, start_remote_worker):  # pragma:
     server.terminate()
 
     assert loss_after < loss_before
+
+
+def test_train_config_sends_model_only_when_missing(hook, workers):
+    alice = workers["alice"]
+    model, loss_fn, data, target, loss_before, dataset_key = prepare_training(hook, alice)
+
+    train_config = sy.TrainConfig(model=model, loss_fn=loss_fn, batch_size=2)
+    train_config.send(alice)
+    model_id, loss_fn_id = train_config._model_id, train_config._loss_fn_id
+    assert set(alice.held_obj_ids([model_id, loss_fn_id])) == {model_id, loss_fn_id}
+
+    me = workers["me"]
+    with mock.patch.object(me, "send_obj", wraps=me.send_obj) as send_obj:
+        # The same model and loss function are already held by alice
+        sy.TrainConfig(model=model, loss_fn=loss_fn, batch_size=4).send(alice)
+        assert send_obj.call_count == 1  # only the config itself
+
+        alice.fit(dataset_key=dataset_key)
+        # The model was modified by the training, so it must be sent again
+        assert alice.held_obj_ids([model_id, loss_fn_id]) == [loss_fn_id]
+        train_config = sy.TrainConfig(model=model, loss_fn=loss_fn, batch_size=2)
+        train_config.send(alice)
+        assert send_obj.call_count == 3
+
+    new_model = train_config.model_ptr.get()
+    assert new_model.id == model_id
+    alice.remove_dataset(dataset_key)
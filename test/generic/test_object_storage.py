@@ -1,5 +1,9 @@
+import time
+
+import pytest
 import torch
 
+from syft.exceptions import ObjectNotFoundError
 from syft.generic import object_storage
 
 
@@ -37,3 +41,137 @@ def test_clear_objects_return_None():
     objs = obj_storage.current_objects()
     assert len(objs) == 0
     assert ret_val is None
+
+
+def test_memory_budget_evicts_least_recently_used():
+    obj_storage = object_storage.ObjectStorage()
+    # Each tensor holds 10 float32 values, i.e. 40 bytes
+    obj_storage.limit_memory(memory_budget=100)
+
+    x, y, z = torch.zeros(10), torch.zeros(10), torch.zeros(10)
+    obj_storage.set_obj(x)
+    obj_storage.set_obj(y)
+    obj_storage.get_obj(x.id)
+    obj_storage.set_obj(z)
+
+    assert x.id in obj_storage._objects
+    assert y.id not in obj_storage._objects
+    assert z.id in obj_storage._objects
+
+    stats = obj_storage.storage_stats()
+    assert stats["objects"] == 2
+    assert stats["memory_used"] == 80
+    assert stats["evicted"] == 1
+
+
+def test_pinned_objects_are_not_evicted():
+    obj_storage = object_storage.ObjectStorage()
+    x = torch.zeros(10)
+    obj_storage.set_obj(x)
+    obj_storage.limit_memory(memory_budget=50)
+
+    y, z = torch.zeros(10), torch.zeros(10)
+    obj_storage.set_obj(y)
+    obj_storage.set_obj(z)
+
+    assert x.id in obj_storage._objects
+    assert y.id not in obj_storage._objects
+    assert z.id in obj_storage._objects
+
+    # x becomes the most recently used object, so z is evicted
+    obj_storage.unpin_obj(x.id)
+    assert x.id in obj_storage._objects
+    assert z.id not in obj_storage._objects
+
+
+def test_limit_memory_keeps_existing_objects_over_budget():
+    obj_storage = object_storage.ObjectStorage()
+    x, y = torch.zeros(10), torch.zeros(10)
+    obj_storage.set_obj(x)
+    obj_storage.set_obj(y)
+    obj_storage.limit_memory(memory_budget=50, ttl=0)
+
+    assert x.id in obj_storage._objects
+    assert y.id in obj_storage._objects
+    assert obj_storage.storage_stats()["pinned"] == 2
+    assert obj_storage.storage_stats()["memory_used"] == 80
+
+
+def test_ttl_eviction():
+    obj_storage = object_storage.ObjectStorage()
+    obj_storage.limit_memory(ttl=0)
+
+    x = torch.zeros(10)
+    obj_storage.set_obj(x)
+    obj_storage._objects.evict_expired()
+
+    assert len(obj_storage.current_objects()) == 0
+
+
+def test_ttl_expiry_without_further_stores():
+    obj_storage = object_storage.ObjectStorage()
+    obj_storage.limit_memory(ttl=0.1)
+
+    x = torch.zeros(10)
+    obj_storage.set_obj(x)
+    time.sleep(0.2)
+
+    # Expired objects are evicted when accessed or counted, not only on stores
+    with pytest.raises(ObjectNotFoundError):
+        obj_storage.get_obj(x.id)
+    assert obj_storage.storage_stats()["objects"] == 0
+
+    y = torch.zeros(10)
+    obj_storage.set_obj(y)
+    time.sleep(0.2)
+    obj_storage.evict_expired_objects()
+    assert len(obj_storage._objects) == 0
+
+
+def test_spill_to_disk_and_reload(tmpdir):
+    obj_storage = object_storage.ObjectStorage()
+    obj_storage.limit_memory(memory_budget=50, spill_dir=str(tmpdir))
+
+    x = torch.tensor([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0])
+    x.tags = ["#data"]
+    obj_storage.set_obj(x)
+    obj_storage.set_obj(torch.zeros(10))
+
+    assert obj_storage.storage_stats()["spilled"] == 1
+    assert len(tmpdir.listdir()) == 1
+
+    reloaded = obj_storage.get_obj(x.id)
+    assert (reloaded == x).all()
+    assert reloaded.id == x.id
+    assert reloaded.tags == ["#data"]
+    assert obj_storage.storage_stats()["reloaded"] == 1
+
+    obj_storage.clear_objects()
+    assert len(tmpdir.listdir()) == 0
+
+
+def test_find_obj_ids_uses_index():
+    obj_storage = object_storage.ObjectStorage()
+
+    x = torch.tensor([1]).tag("#fun", "#mnist").describe("The MNIST training images")
+    y = torch.tensor([2]).tag("#fun", "#cifar").describe("The CIFAR training images")
+    z = torch.tensor([3])
+    for tensor in (x, y, z):
+        obj_storage.set_obj(tensor)
+
+    assert set(obj_storage.find_obj_ids(["#fun"])) == {x.id, y.id}
+    assert obj_storage.find_obj_ids(["#fun", "#mnist"]) == [x.id]
+    assert obj_storage.find_obj_ids(["#fun", "MNIST train"]) == [x.id]
+    assert obj_storage.find_obj_ids([str(z.id)]) == [z.id]
+    assert obj_storage.find_obj_ids(["#fun", "#not_there"]) == []
+
+    # prefix matching only matches the start of the description words
+    assert set(obj_storage.find_obj_ids(["train"], description_prefix=True)) == {x.id, y.id}
+    assert obj_storage.find_obj_ids(["CIF"], description_prefix=True) == [y.id]
+    assert obj_storage.find_obj_ids(["IFAR"], description_prefix=True) == []
+
+    obj_storage.rm_obj(x.id)
+    assert obj_storage.find_obj_ids(["#fun"]) == [y.id]
+
+    obj_storage.clear_objects()
+    assert obj_storage.find_obj_ids(["#fun"]) == []
@@ -243,6 +243,17 @@ def test_tensor_gradient_serde():
     assert (t.grad == orig_grad).all()
 
 
+def test_torch_tensor_view_serde():
+    x = torch.rand(1000, 10)
+    view = x[10:20]
+
+    blob = syft.serde.serialize(view)
+
+    # Only the values viewed are serialized, not the whole storage
+    assert len(blob) < len(syft.serde.serialize(x)) / 10
+    assert (syft.serde.deserialize(blob) == view).all()
+
+
 def test_ndarray_simplify(workers):
     """This tests our ability to simplify numpy.array objects
 
@@ -845,3 +856,30 @@ def test_no_simplifier_found(workers):
     assert type(x) not in msgpack.serde.no_simplifiers_found
     _ = msgpack.serde._simplify(me, x)
     assert type(x) in msgpack.serde.no_simplifiers_found
+
+
+def test_nested_collections_simplify_and_detail(workers):
+    """Test that deeply nested native collections are walked without recursion."""
+    me = workers["me"]
+    nested = [0]
+    for i in range(1, 5000):
+        nested = [i, (nested, {"key": {i}})]
+
+    simplified = msgpack.serde._simplify(me, nested)
+    detailed = msgpack.serde._detail(me, simplified)
+
+    for i in range(4999, 0, -1):
+        assert detailed[0] == i
+        assert detailed[1][1] == {"key": {i}}
+        detailed = detailed[1][0]
+    assert detailed == [0]
+
+
+def test_encoder_cache(workers):
+    """Test that the function simplifying a type is cached."""
+    me = workers["me"]
+    x = torch.tensor([1, 2])
+    simplified = msgpack.serde._simplify(me, x)
+
+    assert type(x) in msgpack.serde.encoders
+    assert msgpack.serde.encoders[type(x)](me, x)[0] == simplified[0]
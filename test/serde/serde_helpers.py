@@ -540,6 +540,7 @@ def make_crtprecisiontensor(**kwargs):
         assert detailed.id == original.id
         assert detailed.base == original.base
         assert detailed.precision_fractional == original.precision_fractional
+        assert detailed.moduli == original.moduli
         return True
 
     return [
@@ -551,9 +552,12 @@ def make_crtprecisiontensor(**kwargs):
                     cpt.id,  # (int) id
                     cpt.base,  # (int) base
                     cpt.precision_fractional,  # (int) precision_fractional
+                    msgpack.serde._simplify(
+                        syft.hook.local_worker, cpt.moduli
+                    ),  # (tuple of int) moduli
                     msgpack.serde._simplify(
                         syft.hook.local_worker, cpt.child
-                    ),  # (dict of AbstractTensor) simplified chain
+                    ),  # (AbstractTensor) simplified chain
                 ),
             ),
             "cmp_detailed": compare,
@@ -1106,6 +1110,8 @@ def make_trainconfig(**kwargs):
         assert detailed.optimizer_args == original.optimizer_args
         assert detailed.max_nr_batches == original.max_nr_batches
         assert detailed.shuffle == original.shuffle
+        assert detailed.num_workers == original.num_workers
+        assert detailed.drop_last == original.drop_last
         return True
 
     return [
@@ -1114,8 +1120,8 @@ def make_trainconfig(**kwargs):
             "simplified": (
                 CODE[syft.federated.train_config.TrainConfig],
                 (
-                    None,  # (int) _model_id
-                    None,  # (int) _loss_fn_id
+                    None,  # (int or str) _model_id
+                    None,  # (int or str) _loss_fn_id
                     2,  # (int) batch_size
                     1,  # (int) epochs
                     (CODE[str], (b"SGD",)),  # (str) optimizer
@@ -1123,6 +1129,11 @@ def make_trainconfig(**kwargs):
                     conf.id,  # (int or str)
                     -1,  # (int) max_nr_batches
                     True,  # (bool) shuffle
+                    0,  # (int) num_workers
+                    2,  # (int) prefetch_factor
+                    False,  # (bool) persistent_workers
+                    False,  # (bool) pin_memory
+                    False,  # (bool) drop_last
                 ),
             ),
             "cmp_detailed": compare,
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+import torch
+
+from syft.frameworks.torch.mpc import approximations
+
+
+def test_get_parameters():
+    assert approximations.get_parameters("exp") == approximations.PRESETS["exp"]["limit"]
+    assert approximations.get_parameters("log") == approximations.PRESETS["log"]["balanced"]
+    assert approximations.get_parameters("exp", "fast") == approximations.PRESETS["exp"]["fast"]
+
+    params = approximations.get_parameters("exp", "fast", iterations=5, degree=None)
+    assert params["iterations"] == 5
+    assert params["degree"] == approximations.PRESETS["exp"]["fast"]["degree"]
+
+    with pytest.raises(ValueError):
+        approximations.get_parameters("exp", "unknown")
+
+
+@pytest.mark.parametrize("degree, tolerance", [(7, 2e-2), (11, 2e-3), (13, 1e-3)])
+def test_sigmoid_coefficients(degree, tolerance):
+    interval = 6
+    coefficients = approximations.sigmoid_coefficients(degree, interval)
+    assert len(coefficients) == (degree + 1) // 2
+
+    x = np.linspace(-interval, interval, 101)
+    u = x / interval
+    approximation = 0.5 + u * np.polynomial.polynomial.polyval(u ** 2, coefficients)
+    assert np.abs(approximation - 1 / (1 + np.exp(-x))).max() < tolerance
+
+
+@pytest.mark.parametrize("degree", range(8))
+def test_evaluate_polynomial(degree):
+    # Local fixed precision tensors only support positive values
+    coefficients = [1 / (i + 1) for i in range(degree + 1)]
+    t = torch.tensor([0.0, 0.5, 1.0, 1.5])
+    x = t.fix_precision().child
+
+    result = approximations.evaluate_polynomial(x, coefficients)
+    expected = np.polynomial.polynomial.polyval(t.numpy(), coefficients)
+
+    assert np.allclose(result.float_precision().numpy(), expected, atol=1e-2)
+
+
+def test_evaluate_polynomial_private_muls():
+    # Horner's rule needs degree private multiplications
+    for degree in [4, 7, 11]:
+        nr_muls = min(approximations._nr_private_muls(degree, k) for k in range(1, degree + 1))
+        assert nr_muls < degree
@@ -1,3 +1,5 @@
+import json
+
 import numpy as np
 
 import torch
@@ -60,3 +62,64 @@ def test_torch_ref_match():
 
     assert torch.isclose(data_dep_eps, torch.tensor(data_dep_eps_ref))
     assert torch.isclose(data_ind_eps, torch.tensor(data_ind_eps_ref))
+
+
+def test_vectorized_matches_reference():
+
+    # The vectorized costs are the sums of the per query reference functions
+
+    num_teachers, num_examples, num_labels = (40, 20, 5)
+    preds = (np.random.rand(num_teachers, num_examples) * num_labels).astype(int)
+    preds[:, 0:5] = 1
+    preds[:num_labels, -1] = np.arange(num_labels)
+    indices = np.arange(num_examples)
+
+    counts_mat = pate._counts_from_preds(preds)
+    l_list = 1.0 + np.arange(8)
+
+    log_mgf, smoothed_sens = pate._privacy_costs(counts_mat[indices], 0.1, l_list, 0.09)
+
+    ref_log_mgf = sum(
+        np.array([pate.logmgf_from_counts(counts_mat[i], 0.1, l) for l in l_list]) for i in indices
+    )
+    ref_smoothed_sens = sum(
+        np.array([pate.smoothed_sens(counts_mat[i], 0.1, l, 0.09) for l in l_list]) for i in indices
+    )
+
+    assert np.allclose(log_mgf, ref_log_mgf)
+    assert np.allclose(smoothed_sens, ref_smoothed_sens)
+
+
+def test_accountant_matches_analysis():
+
+    num_teachers, num_examples, num_labels = (100, 60, 10)
+    preds = (np.random.rand(num_teachers, num_examples) * num_labels).astype(int)
+    preds[:, 0:20] = 3
+    indices = np.arange(num_examples)
+
+    data_dep_eps, data_ind_eps = pate.perform_analysis(
+        teacher_preds=preds, indices=indices, noise_eps=0.1, delta=1e-5
+    )
+
+    accountant = pate.PATEAccountant(num_labels, noise_eps=0.1, delta=1e-5)
+    for start in range(0, num_examples, 25):
+        accountant.update(teacher_preds=torch.tensor(preds[:, start : start + 25]))
+
+    assert accountant.num_queries == num_examples
+    assert np.isclose(accountant.data_dependent_epsilon(), data_dep_eps)
+    assert np.isclose(accountant.data_independent_epsilon(), data_ind_eps)
+
+
+def test_accountant_state_dict():
+
+    accountant = pate.PATEAccountant(num_labels=4, noise_eps=0.1)
+    accountant.update(counts=np.array([[10, 0, 0, 0], [3, 3, 2, 2]]))
+
+    state = json.loads(json.dumps(accountant.state_dict()))
+    restored = pate.PATEAccountant.from_state_dict(state)
+    assert restored.data_dependent_epsilon() == accountant.data_dependent_epsilon()
+
+    restored.update(counts=np.array([[0, 9, 1, 0]]))
+    accountant.update(counts=np.array([[0, 9, 1, 0]]))
+    assert restored.num_queries == 3
+    assert restored.data_dependent_epsilon() == accountant.data_dependent_epsilon()
@@ -136,3 +136,103 @@ def test_federated_dataloader_one_worker(workers):
     num_iterators = len(datasets)
     fdataloader = sy.FederatedDataLoader(fed_dataset, batch_size=2, shuffle=True)
     assert fdataloader.num_iterators == 1, f"{fdataloader.num_iterators} == {1}"
+
+
+def test_federated_dataloader_builds_batches_remotely(workers):
+    bob = workers["bob"]
+    data = th.tensor([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0], [7.0, 8.0]])
+    targets = th.tensor([1, 2, 3, 4])
+    fed_dataset = sy.FederatedDataset([fl.BaseDataset(data, targets).send(bob)])
+
+    fdataloader = sy.FederatedDataLoader(fed_dataset, batch_size=3)
+    batches = [(x.get(), y.get()) for x, y in fdataloader]
+
+    # Same batches as when stacking the data points one by one
+    def collate_fn(batch):
+        return fl.dataloader.default_collate(batch)
+
+    fdataloader = sy.FederatedDataLoader(fed_dataset, batch_size=3, collate_fn=collate_fn)
+    expected = [(x.get(), y.get()) for x, y in fdataloader]
+
+    assert len(batches) == len(expected) == 2
+    for (x, y), (expected_x, expected_y) in zip(batches, expected):
+        assert (x == expected_x).all()
+        assert (y == expected_y).all()
+    assert (batches[0][0] == data[:3]).all()
+    assert (batches[1][1] == targets[3:]).all()
+
+
+def test_federated_dataloader_batch_transform(workers):
+    bob = workers["bob"]
+    data = th.tensor([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0], [7.0, 8.0]])
+    targets = th.tensor([1, 2, 3, 4])
+
+    @th.jit.script
+    def normalize(x):
+        return (x - x.mean(dim=0)) / 2
+
+    dataset = fl.BaseDataset(data, targets, batch_transform=normalize).send(bob)
+    fdataloader = sy.FederatedDataLoader(sy.FederatedDataset([dataset]), batch_size=2)
+
+    batches = [(x.get(), y.get()) for x, y in fdataloader]
+    assert len(batches) == 2
+    # The transform is applied to each batch as a whole
+    assert (batches[0][0] == normalize(data[:2])).all()
+    assert (batches[1][0] == normalize(data[2:])).all()
+    assert (batches[1][1] == targets[2:]).all()
+
+
+def test_federated_dataloader_prefetch(workers):
+    bob = workers["bob"]
+    alice = workers["alice"]
+    datasets = [
+        fl.BaseDataset(th.tensor([1, 2, 3, 4, 5]), th.tensor([1, 2, 3, 4, 5])).send(bob),
+        fl.BaseDataset(th.tensor([6, 7, 8, 9]), th.tensor([6, 7, 8, 9])).send(alice),
+    ]
+    fed_dataset = sy.FederatedDataset(datasets)
+
+    # Batches come in the same order as without prefetching
+    fdataloader = sy.FederatedDataLoader(fed_dataset, batch_size=2, prefetch=2)
+    batches = [data.get().tolist() for data, target in fdataloader]
+    assert batches == [[1, 2], [3, 4], [5], [6, 7], [8, 9]]
+
+    fdataloader = sy.FederatedDataLoader(
+        fed_dataset, batch_size=2, iter_per_worker=True, shuffle=True, prefetch=1
+    )
+    for epoch in range(2):
+        values = {bob: [], alice: []}
+        for batches in fdataloader:
+            for worker, (data, target) in batches.items():
+                assert data.location == worker
+                data, target = data.get(), target.get()
+                assert (data == target).all()
+                values[worker] += data.tolist()
+
+        # alice runs out of data after 2 batches, which ends the epoch
+        assert len(values[bob]) == len(values[alice]) == 4
+        assert set(values[bob]) < {1, 2, 3, 4, 5}
+        assert set(values[alice]) == {6, 7, 8, 9}
+
+        # bob's iterator is stopped too once the epoch ends
+        assert all(it.prefetcher.executor is None for it in fdataloader.iterators)
+
+
+def test_federated_dataloader_prefetch_abandoned(workers):
+    bob = workers["bob"]
+    alice = workers["alice"]
+    datasets = [
+        fl.BaseDataset(th.tensor([1, 2, 3, 4, 5]), th.tensor([1, 2, 3, 4, 5])).send(bob),
+        fl.BaseDataset(th.tensor([6, 7, 8, 9]), th.tensor([6, 7, 8, 9])).send(alice),
+    ]
+    fed_dataset = sy.FederatedDataset(datasets)
+    fdataloader = sy.FederatedDataLoader(fed_dataset, batch_size=1, prefetch=2)
+
+    for data, target in fdataloader:
+        break
+    prefetcher = fdataloader.iterators[0].prefetcher
+    assert prefetcher.executor is not None
+
+    # Starting a new epoch stops prefetching the batches of the abandoned one
+    batches = [data.get().tolist() for data, target in fdataloader]
+    assert prefetcher.executor is None and not prefetcher.pending
+    assert batches == [[i] for i in range(1, 10)]
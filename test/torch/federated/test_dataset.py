@@ -46,6 +46,61 @@ def test_base_dataset_transform():
     assert expected_val.equal(th.tensor(transformed_val).long())
 
 
+def test_base_dataset_batch_transform(workers):
+    bob = workers["bob"]
+    inputs = th.tensor([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    targets = th.tensor([1, 2, 3])
+
+    @th.jit.script
+    def flip_and_scale(x):
+        return x.flip([1]) * 2
+
+    expected = flip_and_scale(inputs)
+
+    dataset = BaseDataset(inputs, targets, batch_transform=flip_and_scale)
+    assert (dataset[1][0] == expected[1]).all()
+    data, _ = dataset.index_select([0, 2])
+    assert (data == expected[[0, 2]]).all()
+
+    # The transform is sent with the first batch and applied where the data is
+    dataset.send(bob)
+    data, labels = dataset.index_select([2, 0])
+    assert data.location == bob
+    assert (data.get() == expected[[2, 0]]).all()
+    assert (labels.get() == targets[[2, 0]]).all()
+    assert dataset._batch_transform_ptr is not None
+
+
+def test_base_dataset_cache_transform(workers):
+    bob = workers["bob"]
+    inputs = th.tensor([1.0, 2.0, 3.0, 4.0])
+    targets = th.tensor([1, 2, 3, 4])
+    nr_calls = []
+
+    def scale(x):
+        nr_calls.append(len(x))
+        return x * 2
+
+    dataset = BaseDataset(inputs, targets, batch_transform=scale, cache_transform=True)
+    assert [dataset[i][0].item() for i in range(4)] == [2.0, 4.0, 6.0, 8.0]
+    assert (dataset.index_select([3, 1])[0] == th.tensor([8.0, 4.0])).all()
+    # The transform ran once, on all the data points
+    assert nr_calls == [4]
+
+    @th.jit.script
+    def scale_remotely(x):
+        return x * 2
+
+    dataset = BaseDataset(inputs, targets, batch_transform=scale_remotely, cache_transform=True)
+    dataset.send(bob)
+    transformed = dataset.transformed_data()
+    assert dataset.transformed_data() is transformed
+    assert (dataset.index_select([3, 1])[0].get() == th.tensor([8.0, 4.0])).all()
+
+    dataset.get()
+    assert (dataset.index_select([0])[0] == th.tensor([2.0])).all()
+
+
 def test_federated_dataset(workers):
     bob = workers["bob"]
     alice = workers["alice"]
@@ -85,6 +140,40 @@ def test_dataset_to_federate(workers):
     assert len(fed_dataset) == 6
 
 
+def test_dataset_to_federate_by_label(workers):
+    bob = workers["bob"]
+    alice = workers["alice"]
+
+    targets = th.tensor([0, 1, 2, 0, 1, 2, 3])
+    dataset = BaseDataset(th.arange(7), targets)
+
+    fed_dataset = dataset.federate((bob, alice), partition="label")
+
+    bob_data, bob_targets = fed_dataset["bob"].data.get(), fed_dataset["bob"].targets.get()
+    alice_targets = fed_dataset["alice"].targets.get()
+    assert set(bob_targets.tolist()) == {0, 2}
+    assert set(alice_targets.tolist()) == {1, 3}
+    assert (targets[bob_data] == bob_targets).all()
+
+
+def test_dataset_to_federate_dirichlet(workers):
+    bob = workers["bob"]
+    alice = workers["alice"]
+    james = workers["james"]
+
+    targets = th.arange(4).repeat(50)
+    dataset = BaseDataset(th.arange(200), targets)
+
+    fed_dataset = dataset.federate((bob, alice, james), partition="dirichlet", alpha=0.1)
+
+    shards = [fed_dataset[worker_id].data.get() for worker_id in fed_dataset.workers]
+    assert sorted(th.cat(shards).tolist()) == list(range(200))
+    assert len(fed_dataset) == 200
+
+    with pytest.raises(ValueError):
+        dataset.federate((bob, alice), partition="unknown")
+
+
 def test_federated_dataset_search(workers):
 
     bob = workers["bob"]
@@ -130,3 +130,49 @@ def test_accuracy():
     acc = utils.accuracy(pred, target)
 
     assert acc == 1.0 / 3.0
+
+
+def test_federated_avg():
+    class Net(th.nn.Module):
+        def __init__(self):
+            super(Net, self).__init__()
+            self.fc1 = th.nn.Linear(2, 2)
+
+    nets = {"bob": Net(), "alice": Net(), "james": Net()}
+    weights = {"bob": 1.0, "alice": 2.0, "james": 5.0}
+    expected_weight = sum(weights[w] * nets[w].fc1.weight.data for w in nets) / 8.0
+    expected_bias = sum(nets[w].fc1.bias.data for w in nets) / 3.0
+    alice_weight = nets["alice"].fc1.weight.data.clone()
+
+    avg_net = utils.federated_avg(nets, weights=weights, dst_model=Net())
+    assert th.allclose(avg_net.fc1.weight.data, expected_weight)
+    # the models averaged are left unchanged
+    assert (nets["alice"].fc1.weight.data == alice_weight).all()
+
+    avg_net = utils.federated_avg(nets)
+    assert avg_net is nets["bob"]
+    assert th.allclose(avg_net.fc1.bias.data, expected_bias)
+
+
+def test_model_averager():
+    class Net(th.nn.Module):
+        def __init__(self):
+            super(Net, self).__init__()
+            self.fc1 = th.nn.Linear(2, 2)
+            self.fc2 = th.nn.Linear(2, 1)
+
+    averager = utils.ModelAverager()
+    flat_params = []
+    for weight in (1.0, 3.0):
+        net = Net()
+        flat_params.append(utils.flatten_parameters(net))
+        averager.add(net, weight)
+
+    assert flat_params[0].shape == (9,)
+    assert th.allclose(averager.average(), (flat_params[0] + 3 * flat_params[1]) / 4)
+
+    net = averager.assign_to(Net())
+    assert th.allclose(utils.flatten_parameters(net), averager.average())
+
+    with pytest.raises(ValueError):
+        averager.add(th.nn.Linear(2, 2))
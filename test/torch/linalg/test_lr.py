@@ -3,6 +3,56 @@ import torch
 import syft as sy
 from syft.frameworks.torch.linalg import EncryptedLinearRegression
 from syft.frameworks.torch.linalg import DASH
+from syft.frameworks.torch.linalg.lr import _pack
+from syft.frameworks.torch.linalg.lr import _unpack
+
+
+def test_pack_unpack(hook, workers):
+    """
+    Test packing tensors in a single tensor, shared at once, and unpacking them
+    """
+    bob = workers["bob"]
+    alice = workers["alice"]
+    crypto_prov = workers["james"]
+
+    x = torch.randn(3, 2)
+    tensors = [x.t() @ x, x.t(), x.sum(dim=0)]
+    packed = _pack([tensor.send(bob) for tensor in tensors])
+    packed_shared = packed.fix_precision().share(bob, alice, crypto_provider=crypto_prov).get()
+
+    shapes = [(2, 2), (2, 3), (2,)]
+    for tensor, unpacked in zip(tensors, _unpack(packed_shared, shapes)):
+        assert unpacked.shape == tensor.shape
+        assert ((unpacked.get().float_precision() - tensor).abs() < 1e-2).all()
+
+
+def test_share_ptrs_concurrently(hook, workers):
+    """
+    Test sharing the tensors of several workers concurrently, which registers objects
+    on the same workers from several threads
+    """
+    bob = workers["bob"]
+    alice = workers["alice"]
+    james = workers["james"]
+    crypto_prov = workers["james"]
+    hbc_worker = workers["charlie"]
+
+    tensors = [torch.randn(100) for _ in range(3)]
+    ptrs = [x.send(worker) for x, worker in zip(tensors, [alice, bob, james])]
+
+    crypto_lr = EncryptedLinearRegression(crypto_prov, hbc_worker)
+    crypto_lr.workers = [alice, bob, james]
+    nr_hbc_objects = len(hbc_worker._objects)
+
+    for _ in range(5):
+        shared = crypto_lr._share_ptrs(ptrs, 0)
+
+        assert len(shared) == len(tensors)
+        for tensor, shared_tensor in zip(tensors, shared):
+            assert ((shared_tensor.get().float_precision() - tensor).abs() < 1e-2).all()
+
+    # Every share was registered on the honest but curious worker then removed
+    assert len(hbc_worker._objects) == nr_hbc_objects
 
 
 @pytest.mark.parametrize("fit_intercept", [False, True])
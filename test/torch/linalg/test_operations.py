@@ -31,6 +31,27 @@ def test_inv_sym(hook, workers):
     assert (diff < 1e-3).all()
 
 
+def test_inv_sym_blocked(hook, workers):
+    """
+    Testing inverse of symmetric matrix with panels smaller than the matrix
+    """
+    torch.manual_seed(42)
+
+    bob = workers["bob"]
+    alice = workers["alice"]
+    crypto_prov = workers["james"]
+
+    x = torch.randn(10, 8)
+    gram = x.t().matmul(x)
+    gram_inv = inv_sym(gram, block_size=3)
+    assert ((gram_inv - gram.inverse()).abs() < 1e-3).all()
+
+    x = torch.Tensor([[1.2, 0.3, 0.1], [0.3, 0.9, 0.2], [0.1, 0.2, 1.1]])
+    x_sh = x.fix_precision(precision_fractional=6).share(bob, alice, crypto_provider=crypto_prov)
+    x_inv = inv_sym(x_sh, block_size=2).get().float_precision()
+    assert ((x_inv - x.inverse()).abs() < 1e-2).all()
+
+
 @assert_time(max_time=20)
 def test_norm_mpc(hook, workers):
     """
@@ -88,6 +109,25 @@ def test_qr(hook, workers):
     assert R.shape == (n_cols, n_cols)
 
 
+def test_qr_blocked(hook, workers):
+    """
+    Testing QR decomposition with panels smaller than the matrix
+    """
+    torch.manual_seed(42)
+
+    bob = workers["bob"]
+    n_cols = 5
+    n_rows = 10
+    t = torch.randn([n_rows, n_cols])
+    Q, R = qr(t.send(bob), mode="complete", block_size=2)
+    Q = Q.get()
+    R = R.get()
+
+    assert ((torch.eye(n_rows) - Q @ Q.t()).abs() < 1e-5).all()
+    assert ((R - R.triu()).abs() < 1e-5).all()
+    assert ((Q @ R - t).abs() < 1e-5).all()
+
+
 def test_qr_mpc(hook, workers):
     """
     Testing QR decomposition with an AdditiveSharedTensor
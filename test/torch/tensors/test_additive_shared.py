@@ -508,6 +508,30 @@ def test_nn_linear(workers):
     assert y.get().float_prec() == torch.tensor([[2.0]])
 
 
+def test_torch_addmm(workers):
+    torch.manual_seed(121)  # Truncation might not always work so we set the random seed
+    bob, alice, james = (workers["bob"], workers["alice"], workers["james"])
+
+    weight = torch.tensor([[1.0, -2], [4.0, 2]])
+    inputs = torch.tensor([[1.0, 2], [-3.0, 0.5]])
+    bias = torch.tensor([1.0, -2])
+
+    weight_sh = weight.fix_prec().share(bob, alice, crypto_provider=james)
+    inputs_sh = inputs.fix_prec().share(bob, alice, crypto_provider=james)
+    bias_sh = bias.fix_prec().share(bob, alice, crypto_provider=james)
+
+    result = torch.addmm(bias_sh, inputs_sh, weight_sh).get().float_prec()
+    assert (result == torch.addmm(bias, inputs, weight)).all()
+
+    # with a public bias
+    result = torch.addmm(bias.fix_prec(), inputs_sh, weight_sh).get().float_prec()
+    assert (result == torch.addmm(bias, inputs, weight)).all()
+
+    # without bias
+    result = F.linear(inputs_sh, weight_sh).get().float_prec()
+    assert (result == F.linear(inputs, weight)).all()
+
+
 def test_matmul(workers):
     torch.manual_seed(121)  # Truncation might not always work so we set the random seed
     bob, alice, james = (workers["bob"], workers["alice"], workers["james"])
@@ -615,6 +639,17 @@ def test_torch_conv2d(workers):
     assert (res0 == expected0).all()
     assert (res1 == expected1).all()
 
+    # with several out channels per group
+    w = torch.cat([w, -w])[:, 0:1].contiguous()
+    bias = torch.Tensor([0.0, 5.0, 1.0, -2.0])
+    w_shared = w.fix_precision().share(bob, alice, crypto_provider=james)
+    bias_shared = bias.fix_precision().share(bob, alice, crypto_provider=james)
+
+    res2 = torch.conv2d(im_shared, w_shared, bias=bias_shared, groups=2).get().float_precision()
+    expected2 = torch.conv2d(im, w, bias=bias, groups=2)
+
+    assert (res2 == expected2).all()
+
 
 def test_fixed_precision_and_sharing(workers):
 
@@ -1,3 +1,4 @@
+import pytest
 import torch
 import syft
 
@@ -9,6 +10,12 @@ def test__str__():
     assert isinstance(crt.__str__(), str)
 
 
+def test_positional_args_rejected():
+    t = torch.tensor([1.25, -3.5])
+    with pytest.raises(AssertionError):
+        t.fix_precision(10, storage="crt")
+
+
 def test_eq():
     t_a = torch.tensor([[3, 9], [4, 1]])
     t_b = torch.tensor([[3, 9], [4, 1]])
@@ -128,3 +135,54 @@ def test_share_and_get(workers):
     back = shared.get()
 
     assert (back.float_precision() == copy.float_precision()).all()
+
+
+def test_stacked_residues():
+    t = torch.tensor([[1.5, -2.25], [3.0, -4.5]])
+    crt = t.fix_precision(field_type="int100", precision_fractional=2, storage="crt")
+
+    moduli = syft.frameworks.torch.tensors.interpreters.crt_precision._moduli_for_fields["int100"]
+    residues = crt.child.child
+
+    assert crt.child.moduli == tuple(moduli)
+    assert residues.shape == (len(moduli), 2, 2)
+    for mod, residue in zip(moduli, residues):
+        assert (residue == (t * 100).long() % mod).all()
+
+
+def test_build_from_residues():
+    t = torch.tensor([1.25, -3.5])
+    residues = {mod: t.fix_precision(field=mod, precision_fractional=2) for mod in [883, 887, 907]}
+
+    crt = syft.CRTPrecisionTensor(residues).wrap()
+
+    assert (crt.float_precision() == t).all()
+
+
+def test_reconstruct_large_values():
+    t = torch.tensor([-12345.5, 98765.25, 0.0, -0.5])
+    crt = t.fix_precision(field_type="int128", precision_fractional=2, storage="crt")
+
+    assert (crt.float_precision() == t).all()
+
+    # Values which don't fit in 64 bits
+    result = crt * 10 ** 12
+
+    expected = t.double() * 10 ** 12
+    assert torch.allclose(result.float_precision().double(), expected, rtol=1e-6)
+
+
+def test_shared_add(workers):
+    alice, bob, james = (workers["alice"], workers["bob"], workers["james"])
+
+    t_a = torch.tensor([1.5, -2.0, 3.25])
+    t_b = torch.tensor([-4.0, 2.5, 1.0])
+    crt_a = t_a.fix_precision(field_type="int100", precision_fractional=2, storage="crt")
+    crt_b = t_b.fix_precision(field_type="int100", precision_fractional=2, storage="crt")
+
+    shared_a = crt_a.share(alice, bob, crypto_provider=james)
+    shared_b = crt_b.share(alice, bob, crypto_provider=james)
+
+    result = (shared_a + shared_b - crt_a) * 3 + 1
+
+    assert (result.get().float_precision() == (t_b * 3 + 1)).all()
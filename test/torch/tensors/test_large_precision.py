@@ -50,6 +50,53 @@ def test_negative_numbers(workers):
     assert torch.all(torch.eq(x, restored))
 
 
+def test_field_not_power_of_two(workers):
+    x = torch.tensor([[-1.5, 2.0], [2000.0123458910, -0.25]])
+    enlarged = x.fix_prec(
+        internal_type=torch.int32, precision_fractional=100, field=3 ** 300, storage="large"
+    )
+    restored = enlarged.float_precision()
+    assert torch.all(torch.eq(x, restored))
+
+
+def test_operations_field_not_power_of_two():
+    x = torch.tensor([[-1.5, 2.0], [200.25, -0.25]])
+    y = torch.tensor([[3.0, -2.0], [-0.5, 4.0]])
+    lpt_x = x.fix_prec(internal_type=torch.int32, precision_fractional=64, field=3 ** 300)
+    lpt_y = y.fix_prec(internal_type=torch.int32, precision_fractional=64, field=3 ** 300)
+
+    assert torch.all(torch.eq((lpt_x + lpt_y).float_precision(), x + y))
+    assert torch.all(torch.eq((lpt_x - lpt_y).float_precision(), x - y))
+    assert torch.all(torch.eq((lpt_x * lpt_y).float_precision(), x * y))
+
+
+@pytest.mark.parametrize(
+    "internal_type, field",
+    [
+        (torch.int8, 2 ** 62),
+        (torch.int16, 2 ** 63),
+        (torch.int32, 2 ** 71),
+        (torch.int64, 2 ** 95),
+    ],
+)
+def test_mul_without_fractional_part(internal_type, field):
+    x = torch.tensor([796.0, -12.0])
+    y = torch.tensor([26.0, 7.0])
+    kwargs = dict(internal_type=internal_type, precision_fractional=0, field=field)
+    lpt_x = x.fix_prec(storage="large", **kwargs)
+    lpt_y = y.fix_prec(storage="large", **kwargs)
+
+    assert torch.all(torch.eq((lpt_x * lpt_y).float_precision(), x * y))
+
+
+def test_restore_unnormalized_parts():
+    x = torch.tensor([-3.25, 7.5, 0.0])
+    lpt = x.fix_prec(internal_type=torch.int16, precision_fractional=128).child
+    # Parts out of the int16 range, like the sum of shares, are carried when restoring
+    lpt.child = lpt.child.long() * 3
+    assert torch.all(torch.eq(x * 3, lpt.float_precision()))
+
+
 def test_add_multiple_dimensions(workers):
     x = torch.tensor([[[-1.5, -2.0, -3.0]], [[4.5, 5.0, -3.0]]])
     y = torch.tensor([[[-1.5, -2.0, -3.0]], [[4.5, 5.0, 6.0]]])
@@ -147,6 +194,24 @@ def test_mul_multiple_dims():
     assert torch.all(torch.eq(expected, result.float_precision()))
 
 
+def test_native_operations():
+    x = torch.tensor([[-1.5, 2.25], [1000.5, -0.125]])
+    y = torch.tensor([[3.0, -2.0], [-0.5, -8.0]])
+    for internal_type in (torch.int16, torch.int32):
+        lpt_x = x.fix_prec(internal_type=internal_type, precision_fractional=64)
+        lpt_y = y.fix_prec(internal_type=internal_type, precision_fractional=64)
+
+        for result, expected in [
+            (lpt_x + lpt_y, x + y),
+            (lpt_x - lpt_y, x - y),
+            (lpt_x * lpt_y, x * y),
+            (lpt_x * 3, x * 3),
+        ]:
+            assert isinstance(result.child.child, torch.Tensor)
+            assert result.child.child.dtype == internal_type
+            assert torch.all(torch.eq(result.float_precision(), expected))
+
+
 def test_concat_ops():
     internal_type = torch.int16
     precision_fractional = 32
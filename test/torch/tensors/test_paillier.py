@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 import torch
 import syft as sy
+from syft.frameworks.torch.tensors.interpreters.paillier import PaillierTensor
 
 
 def test_encrypt_and_decrypt():
@@ -166,3 +168,84 @@ def test_decrypted_encrypted_matmul():
     z = (x_tensor.mm(y)).decrypt(pri)
 
     assert ((x_tensor.mm(y_tensor)) == z).all()
+
+
+def test_encrypt_and_decrypt_in_chunks():
+    """
+    Test the encryption and decryption of a tensor split in several chunks,
+    partly with precomputed obfuscators
+    """
+    from syft.frameworks.torch.he import paillier
+
+    pub, pri = sy.keygen(n_length=1024)
+    paillier.precompute_obfuscators(pub, 10)
+
+    x_tensor = torch.randn(2 * paillier.CHUNK_SIZE + 3, 2)
+    x = x_tensor.encrypt(pub)
+
+    y = (x * torch.tensor([-3.0, 0.5]) - x_tensor).decrypt(pri)
+
+    assert (y == x_tensor * torch.tensor([-3.0, 0.5]) - x_tensor).all()
+
+
+def test_serialize_encrypted():
+    """
+    Test the compact serialization of encrypted values
+    """
+    pub, pri = sy.keygen(n_length=1024)
+
+    x_tensor = torch.Tensor([[1.5, -2], [3, 0]])
+    x = x_tensor.encrypt(pub)
+
+    simplified = PaillierTensor.simplify(sy.hook.local_worker, x.child)
+    detailed = PaillierTensor.detail(sy.hook.local_worker, simplified)
+
+    assert detailed.pubkey == pub
+    assert (detailed.decrypt(pri) == x_tensor).all()
+
+
+def test_operations_rerandomize_ciphertexts():
+    """
+    Test that the ciphertexts resulting from additions and multiplications with
+    plain values are not a deterministic function of the ciphertexts operated on
+    """
+    from syft.frameworks.torch.he import paillier
+
+    pub, pri = sy.keygen(n_length=1024)
+
+    x = paillier.encrypt_array(pub, np.array([1.5, -2.0]))
+    _, ciphertexts, _ = paillier._from_encrypted(x)
+
+    for result in [paillier.add_plain(x, np.zeros(2)), paillier.mul_plain(x, np.ones(2))]:
+        _, result_ciphertexts, _ = paillier._from_encrypted(result)
+        assert all(c != r for c, r in zip(ciphertexts, result_ciphertexts))
+        assert (paillier.decrypt_array(pri, result) == np.array([1.5, -2.0])).all()
+
+    # Serializing obfuscates the results computed by phe
+    y = x + x
+    _, sum_ciphertexts, _ = paillier._from_encrypted(y)
+    serialized = paillier.deserialize_encrypted(paillier.serialize_encrypted(y))
+    _, serialized_ciphertexts, _ = paillier._from_encrypted(serialized)
+    assert all(c != s for c, s in zip(sum_ciphertexts, serialized_ciphertexts))
+    assert (paillier.decrypt_array(pri, serialized) == np.array([3.0, -4.0])).all()
+
+
+def test_encrypt_values_of_wide_range():
+    """
+    Test floats whose range is too wide to be encoded with a common exponent
+    """
+    from syft.frameworks.torch.he import paillier
+
+    pub, pri = sy.keygen(n_length=1024)
+
+    values = np.array([1e-200, 1e200, 0.0, -3.5])
+    mantissas, exponents = paillier.encode(pub, values)
+    assert isinstance(exponents, list) and len(set(exponents)) > 1
+
+    x = paillier.encrypt_array(pub, values)
+    assert (paillier.decrypt_array(pri, x) == values).all()
+    assert (paillier.decrypt_array(pri, paillier.add_plain(x, np.ones(4))) == values + 1).all()
+    assert (paillier.decrypt_array(pri, paillier.mul_plain(x, np.full(4, 2.0))) == values * 2).all()
+
+    with pytest.raises(ValueError):
+        paillier.encode(pub, values, exponent=paillier.encoding_exponent(values))
@@ -444,6 +444,33 @@ def test_torch_exp_approx(workers):
         assert (cumsum < 1).all()
 
 
+def test_torch_exp_large_inputs(workers):
+    """
+    Test that exp stays bounded on large negative inputs, with the default limit
+    approximation and with a polynomial preset given a bound on the inputs
+    """
+    alice, bob, james = workers["alice"], workers["bob"], workers["james"]
+
+    t = torch.tensor([-40.0, -30.0])
+    t_sh = t.fix_precision().share(alice, bob, crypto_provider=james)
+
+    r = t_sh.exp().get().float_prec()
+    assert (r.abs() < 1e-2).all()
+
+    r = t_sh.exp(preset="balanced", bound=40).get().float_prec()
+    assert (r.abs() < 1e-2).all()
+
+    t = torch.tensor([40.0, 30.0])
+    t_sh = t.fix_precision().share(alice, bob, crypto_provider=james)
+    r = t_sh.sigmoid(method="exp").get().float_prec()
+    assert ((r - 1).abs() < 1e-2).all()
+
+    t = torch.tensor([-40.0, 40.0])
+    t_sh = t.fix_precision().share(alice, bob, crypto_provider=james)
+    r = t_sh.sigmoid(method="chebyshev").get().float_prec()
+    assert ((r - torch.tensor([0.0, 1.0])).abs() < 1e-2).all()
+
+
 @assert_time(max_time=40)
 def test_torch_sigmoid_approx(workers):
     """
@@ -453,7 +480,10 @@ def test_torch_sigmoid_approx(workers):
     alice, bob, james = workers["alice"], workers["bob"], workers["james"]
 
     fix_prec_tolerance_by_method = {
+        "chebyshev": {3: 3 / 100, 4: 1 / 100, 5: 1 / 100},
         "exp": {3: 5 / 100, 4: 1 / 100, 5: 1 / 100},
+        # The default method is "exp"
+        None: {3: 5 / 100, 4: 1 / 100, 5: 1 / 100},
         "maclaurin": {3: 7 / 100, 4: 15 / 100, 5: 15 / 100},
     }
 
@@ -1,4 +1,7 @@
 """Tests relative to verifying the hook process behaves properly."""
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
 import pytest
 import torch
 import torch.nn as nn
@@ -25,6 +28,42 @@ def test_torch_attributes():
     syft.framework._command_guard("torch.add", get_native=False)
 
 
+def test_lazy_hooking_of_syft_tensor_methods(hook):
+    from syft.frameworks.torch.tensors.decorators.logging import LoggingTensor
+
+    lazy_methods = LoggingTensor.__dict__["_lazy_hooked_methods"]
+    method_name = next(iter(lazy_methods))
+
+    x = LoggingTensor()
+    assert method_name not in LoggingTensor.__dict__
+    assert callable(getattr(x, method_name))
+    # The method is now set on the class and is no longer resolved lazily
+    assert method_name in LoggingTensor.__dict__
+    assert method_name not in lazy_methods
+
+    with pytest.raises(AttributeError):
+        x.not_a_tensor_method
+
+
+def test_lazy_hooking_from_several_threads(hook):
+    from syft.frameworks.torch.tensors.decorators.logging import LoggingTensor
+
+    lazy_methods = LoggingTensor.__dict__["_lazy_hooked_methods"]
+    method_name = next(iter(lazy_methods))
+    barrier = threading.Barrier(8)
+
+    def access_method(_):
+        x = LoggingTensor()
+        barrier.wait()
+        return getattr(x, method_name)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        methods = list(executor.map(access_method, range(8)))
+
+    assert all(callable(method) for method in methods)
+    assert method_name in LoggingTensor.__dict__
+
+
 def test_worker_registration(hook, workers):
     boris = syft.VirtualWorker(id="boris", hook=hook, is_client_worker=False)
 
@@ -190,6 +190,40 @@ def test_search():
     assert len(bob.search("#cifar")) == 1
     assert len(bob.search("#not_fun")) == 2
     assert len(bob.search(["#not_fun", "#boston_housing"])) == 1
+    assert len(bob.search(["#fun", "MNIST"])) == 2
+    assert len(bob.search(["#fun", "imag"], description_prefix=True)) == 2
+    assert len(bob.search(["#fun", "mages"], description_prefix=True)) == 0
+
+    x.get()
+    assert len(bob.search("#fun")) == 1
+
+
+def test_search_after_tagging_stored_object(workers):
+    bob = workers["bob"]
+
+    x = torch.tensor([1, 2, 3]).send(bob)
+    assert len(bob.search("#late")) == 0
+
+    bob.get_obj(x.id_at_location).tag("#late").describe("tagged once stored")
+    assert len(bob.search(["#late", "stored"])) == 1
+
+
+def test_search_after_setting_attributes_of_stored_object(workers):
+    bob = workers["bob"]
+
+    x = torch.tensor([1, 2, 3]).tag("#old").send(bob)
+    obj = bob.get_obj(x.id_at_location)
+
+    obj.tags = {"#new"}
+    obj.description = "assigned once stored"
+    assert len(bob.search("#old")) == 0
+    assert len(bob.search(["#new", "assigned"])) == 1
+
+    # Changing the tags in place isn't seen until the object is reindexed
+    obj.tags.add("#in_place")
+    assert len(bob.search("#in_place")) == 0
+    obj.tag()
+    assert len(bob.search("#in_place")) == 1
 
 
 def test_obj_not_found(workers):
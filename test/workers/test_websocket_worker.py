@@ -1,3 +1,4 @@
+import asyncio
 import io
 from os.path import exists, join
 import time
@@ -157,6 +158,11 @@ def test_objects_count_remote(hook, start_remote_worker):
     nr_objects = remote_proxy.objects_count_remote()
     assert nr_objects == 1
 
+    stats = remote_proxy.objects_count_remote(stats=True)
+    assert stats["objects"] == 1
+    # y holds 3 int64 values
+    assert stats["memory_used"] == 24
+
     # delete remote object before terminating the websocket connection
     del y
     time.sleep(0.1)
@@ -166,6 +172,23 @@ def test_objects_count_remote(hook, start_remote_worker):
     server.terminate()
 
 
+def test_idle_server_evicts_expired_objects(hook):
+    server = WebsocketServerWorker(
+        id="fed-object-ttl", hook=hook, host="localhost", port=8805, object_ttl=0.1
+    )
+    x = torch.tensor([1, 2, 3])
+    server.register_obj(x)
+
+    # No message is received: the periodic task alone evicts the object
+    eviction = asyncio.wait_for(server._evict_expired_objects_periodically(), timeout=0.3)
+    with pytest.raises(asyncio.TimeoutError):
+        server.loop.run_until_complete(eviction)
+
+    assert x.id not in server._objects
+    assert server.objects_count() == 0
+    server.remove_worker_from_local_worker_registry()
+
+
 def test_clear_objects_remote(hook, start_remote_worker):
     server, remote_proxy = start_remote_worker(id="fed-clear-objects", hook=hook, port=8769)
 